@@ -1,6 +1,6 @@
 """Body composition API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query as QueryParam
+from fastapi import APIRouter, HTTPException, Query as QueryParam, Request, Response
 from typing import Optional
 
 from app.models.body_composition import (
@@ -10,9 +10,12 @@ from app.models.body_composition import (
     BodyCompositionTrend,
 )
 from app.repositories.body_comp_repo import BodyCompositionRepository
+from app.utils.http_cache import not_modified_response
 
 router = APIRouter()
 
+body_comp_repo = BodyCompositionRepository()
+
 
 @router.get("/", response_model=list[BodyComposition])
 def get_measurements(
@@ -22,19 +25,16 @@ def get_measurements(
     limit: int = 100,
 ):
     """Get body composition measurements."""
-    repo = BodyCompositionRepository()
-
     if start_date and end_date:
-        return repo.get_by_date_range(start_date, end_date)
+        return body_comp_repo.get_by_date_range(start_date, end_date)
 
-    return repo.get_all(skip=skip, limit=limit)
+    return body_comp_repo.get_all(skip=skip, limit=limit)
 
 
 @router.get("/latest", response_model=Optional[BodyComposition])
 def get_latest_measurement():
     """Get the most recent measurement."""
-    repo = BodyCompositionRepository()
-    latest = repo.get_latest()
+    latest = body_comp_repo.get_latest()
 
     if not latest:
         raise HTTPException(status_code=404, detail="No measurements found")
@@ -45,45 +45,27 @@ def get_latest_measurement():
 @router.get("/stats", response_model=BodyCompositionStats)
 def get_stats():
     """Get summary statistics."""
-    repo = BodyCompositionRepository()
-    return repo.get_stats()
+    return body_comp_repo.get_stats()
 
 
 @router.get("/trends", response_model=BodyCompositionTrend)
 def get_trends(
+    request: Request,
+    response: Response,
     days: int = QueryParam(30, ge=1, le=365, description="Number of days"),
 ):
     """Get trend data for charts."""
-    repo = BodyCompositionRepository()
-    measurements = repo.get_recent(days=days)
-
-    dates = []
-    weights = []
-    body_fat_pcts = []
-    muscle_masses = []
-    water_pcts = []
-
-    for m in measurements:
-        dates.append(m.get('date', ''))
-        weights.append(m.get('weight'))
-        body_fat_pcts.append(m.get('body_fat_pct'))
-        muscle_masses.append(m.get('muscle_mass'))
-        water_pcts.append(m.get('water_pct'))
-
-    return BodyCompositionTrend(
-        dates=dates,
-        weights=weights,
-        body_fat_pcts=body_fat_pcts,
-        muscle_masses=muscle_masses,
-        water_pcts=water_pcts,
-    )
+    trends = body_comp_repo.get_recent_trends(days=days)
+    cached = not_modified_response(request, response, trends)
+    if cached is not None:
+        return cached
+    return BodyCompositionTrend(**trends)
 
 
 @router.post("/", response_model=BodyComposition, status_code=201)
 def create_measurement(measurement: BodyCompositionCreate):
     """Create a new measurement (manual entry)."""
-    repo = BodyCompositionRepository()
-    created = repo.create(measurement)
+    created = body_comp_repo.create(measurement)
 
     if not created:
         raise HTTPException(
@@ -97,8 +79,7 @@ def create_measurement(measurement: BodyCompositionCreate):
 @router.delete("/{measurement_id}", status_code=204)
 def delete_measurement(measurement_id: int):
     """Delete a measurement."""
-    repo = BodyCompositionRepository()
-    deleted = repo.delete(measurement_id)
+    deleted = body_comp_repo.delete(measurement_id)
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Measurement not found")
@@ -1,6 +1,6 @@
 """Exercise and category API endpoints."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from app.models.exercise import (
     Exercise,
@@ -12,6 +12,7 @@ from app.models.exercise import (
     SeedExercisesResponse,
 )
 from app.repositories.exercise_repo import ExerciseRepository, CategoryRepository
+from app.utils.http_cache import not_modified_response
 
 # Exercises from workout presets (wendler_531, stronglifts_5x5)
 PRESET_EXERCISES = {
@@ -47,27 +48,31 @@ PRESET_EXERCISES = {
 
 router = APIRouter()
 
+exercise_repo = ExerciseRepository()
+category_repo = CategoryRepository()
+
 
 # Exercise endpoints
 @router.get("/", response_model=list[Exercise])
-def get_exercises():
+def get_exercises(request: Request, response: Response):
     """Get all exercises."""
-    repo = ExerciseRepository()
-    return repo.get_all()
+    exercises = exercise_repo.get_all()
+    cached = not_modified_response(request, response, exercises)
+    if cached is not None:
+        return cached
+    return exercises
 
 
 @router.get("/recent", response_model=list[Exercise])
 def get_recent_exercises(limit: int = 10):
     """Get recently used exercises."""
-    repo = ExerciseRepository()
-    return repo.get_recent(limit=limit)
+    return exercise_repo.get_recent(limit=limit)
 
 
 @router.get("/{exercise_name}", response_model=Exercise)
 def get_exercise(exercise_name: str):
     """Get a specific exercise by name."""
-    repo = ExerciseRepository()
-    exercise = repo.get_by_name(exercise_name)
+    exercise = exercise_repo.get_by_name(exercise_name)
 
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
@@ -78,15 +83,13 @@ def get_exercise(exercise_name: str):
 @router.post("/", response_model=Exercise, status_code=201)
 def create_exercise(exercise: ExerciseCreate):
     """Create a new exercise."""
-    repo = ExerciseRepository()
-    return repo.create(exercise)
+    return exercise_repo.create(exercise)
 
 
 @router.put("/{exercise_id}", response_model=Exercise)
 def update_exercise(exercise_id: int, exercise: ExerciseUpdate):
     """Update an exercise."""
-    repo = ExerciseRepository()
-    updated = repo.update(exercise_id, exercise)
+    updated = exercise_repo.update(exercise_id, exercise)
 
     if not updated:
         raise HTTPException(status_code=404, detail="Exercise not found")
@@ -97,8 +100,7 @@ def update_exercise(exercise_id: int, exercise: ExerciseUpdate):
 @router.delete("/{exercise_id}", status_code=204)
 def delete_exercise(exercise_id: int):
     """Delete an exercise."""
-    repo = ExerciseRepository()
-    if not repo.delete(exercise_id):
+    if not exercise_repo.delete(exercise_id):
         raise HTTPException(status_code=404, detail="Exercise not found")
 
 
@@ -110,28 +112,7 @@ def seed_exercises():
     (Wendler 5/3/1, StrongLifts 5x5). Only creates exercises that
     don't already exist.
     """
-    exercise_repo = ExerciseRepository()
-    category_repo = CategoryRepository()
-
-    created_categories = 0
-    created_exercises = 0
-
-    for category_name, exercises in PRESET_EXERCISES.items():
-        # Get or create category
-        category = category_repo.get_by_name(category_name)
-        if not category:
-            category = category_repo.create(CategoryCreate(name=category_name))
-            created_categories += 1
-
-        # Create exercises that don't exist
-        for exercise_name in exercises:
-            existing = exercise_repo.get_by_name(exercise_name)
-            if not existing:
-                exercise_repo.create(ExerciseCreate(
-                    name=exercise_name,
-                    category=category_name,
-                ))
-                created_exercises += 1
+    created_categories, created_exercises = exercise_repo.create_missing(PRESET_EXERCISES)
 
     if created_exercises == 0 and created_categories == 0:
         message = "All preset exercises already exist"
@@ -147,17 +128,19 @@ def seed_exercises():
 
 # Category endpoints
 @router.get("/categories/", response_model=list[Category])
-def get_categories():
+def get_categories(request: Request, response: Response):
     """Get all categories."""
-    repo = CategoryRepository()
-    return repo.get_all()
+    categories = category_repo.get_all()
+    cached = not_modified_response(request, response, categories)
+    if cached is not None:
+        return cached
+    return categories
 
 
 @router.get("/categories/{category_name}", response_model=Category)
 def get_category(category_name: str):
     """Get a specific category by name."""
-    repo = CategoryRepository()
-    category = repo.get_by_name(category_name)
+    category = category_repo.get_by_name(category_name)
 
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
@@ -168,18 +151,13 @@ def get_category(category_name: str):
 @router.post("/categories/", response_model=Category, status_code=201)
 def create_category(category: CategoryCreate):
     """Create a new category."""
-    repo = CategoryRepository()
-    return repo.create(category)
+    return category_repo.create(category)
 
 
 @router.get("/categories/{category_name}/exercises", response_model=ExercisesByCategoryResponse)
 def get_exercises_by_category(category_name: str):
     """Get all exercises in a category."""
-    exercise_repo = ExerciseRepository()
-    exercises = exercise_repo.get_by_category(category_name)
-
-    # Extract just the names
-    exercise_names = [e['name'] for e in exercises]
+    exercise_names = exercise_repo.get_names_by_category(category_name)
 
     return ExercisesByCategoryResponse(
         category=category_name,
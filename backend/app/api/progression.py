@@ -1,5 +1,7 @@
 """Progression API endpoints."""
 
+from typing import Optional
+
 from fastapi import APIRouter, Query as QueryParam
 
 from app.models.progression import ProgressionResponse
@@ -8,15 +10,23 @@ from app.repositories.exercise_repo import ExerciseRepository
 
 router = APIRouter()
 
+# Shared across requests; ProgressionService keeps per-request caches, so it stays per call
+exercise_repo = ExerciseRepository()
+
 
 @router.get("/{exercise}", response_model=ProgressionResponse)
 def get_progression(
     exercise: str,
     include_upcoming: bool = QueryParam(True, description="Include upcoming workouts"),
+    limit: Optional[int] = QueryParam(
+        None, ge=1, description="Only the most recent N training dates"
+    ),
 ):
     """Get progression data for a specific exercise."""
     service = ProgressionService()
-    return service.get_progression_data(exercise, include_upcoming=include_upcoming)
+    return service.get_progression_data(
+        exercise, include_upcoming=include_upcoming, limit=limit
+    )
 
 
 @router.get("/", response_model=dict)
@@ -29,6 +39,5 @@ def get_main_lifts():
 @router.get("/exercises/list", response_model=list[str])
 def get_exercise_list():
     """Get list of all exercises for progression tracking."""
-    repo = ExerciseRepository()
-    exercises = repo.get_all()
+    exercises = exercise_repo.get_all()
     return [e['name'] for e in exercises]
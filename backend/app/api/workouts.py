@@ -6,9 +6,11 @@ from typing import Optional
 from app.models.workout import (
     Workout,
     WorkoutCreate,
+    WorkoutBulkCreate,
     WorkoutUpdate,
     WorkoutReorder,
     WorkoutBulkReorder,
+    WorkoutBulkReorderResponse,
     WorkoutComplete,
     WorkoutMoveDate,
     WorkoutMoveDateResponse,
@@ -20,6 +22,9 @@ from app.repositories.workout_repo import WorkoutRepository
 
 router = APIRouter()
 
+# Repositories are stateless, so one instance serves every request
+workout_repo = WorkoutRepository()
+
 
 @router.get("/", response_model=list[Workout])
 def get_workouts(
@@ -28,13 +33,11 @@ def get_workouts(
     limit: int = 100,
 ):
     """Get workouts, optionally filtered by date."""
-    repo = WorkoutRepository()
-
     if date:
-        workouts = repo.get_by_date(date)
+        workouts = workout_repo.get_by_date(date)
         return workouts
 
-    return repo.get_all(skip=skip, limit=limit)
+    return workout_repo.get_all(skip=skip, limit=limit)
 
 
 @router.get("/calendar", response_model=CalendarResponse)
@@ -43,8 +46,7 @@ def get_calendar(
     month: int = QueryParam(..., ge=1, le=12, description="Month (1-12)"),
 ):
     """Get workout counts by date for calendar view."""
-    repo = WorkoutRepository()
-    counts = repo.get_workout_counts_by_date(year, month)
+    counts = workout_repo.get_workout_counts_by_date(year, month)
 
     return CalendarResponse(year=year, month=month, counts=counts)
 
@@ -52,8 +54,7 @@ def get_calendar(
 @router.get("/{workout_id}", response_model=Workout)
 def get_workout(workout_id: int):
     """Get a specific workout by ID."""
-    repo = WorkoutRepository()
-    workout = repo.get_by_id(workout_id)
+    workout = workout_repo.get_by_id(workout_id)
 
     if not workout:
         raise HTTPException(status_code=404, detail="Workout not found")
@@ -64,15 +65,19 @@ def get_workout(workout_id: int):
 @router.post("/", response_model=Workout, status_code=201)
 def create_workout(workout: WorkoutCreate):
     """Create a new workout."""
-    repo = WorkoutRepository()
-    return repo.create(workout)
+    return workout_repo.create(workout)
+
+
+@router.post("/bulk", response_model=list[Workout], status_code=201)
+def create_bulk_workouts(bulk: WorkoutBulkCreate):
+    """Create multiple workouts in one transaction."""
+    return workout_repo.create_bulk(bulk.workouts)
 
 
 @router.put("/{workout_id}", response_model=Workout)
 def update_workout(workout_id: int, workout: WorkoutUpdate):
     """Update an existing workout."""
-    repo = WorkoutRepository()
-    updated = repo.update(workout_id, workout)
+    updated = workout_repo.update(workout_id, workout)
 
     if not updated:
         raise HTTPException(status_code=404, detail="Workout not found")
@@ -83,34 +88,30 @@ def update_workout(workout_id: int, workout: WorkoutUpdate):
 @router.delete("/{workout_id}", status_code=204)
 def delete_workout(workout_id: int):
     """Delete a workout."""
-    repo = WorkoutRepository()
-    deleted = repo.delete(workout_id)
+    deleted = workout_repo.delete(workout_id)
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Workout not found")
 
 
-@router.patch("/reorder")
+@router.patch("/reorder", response_model=WorkoutBulkReorderResponse)
 def bulk_reorder_workouts(reorder: WorkoutBulkReorder):
     """Bulk reorder workouts by providing ordered list of IDs."""
-    repo = WorkoutRepository()
-    success = repo.bulk_reorder(reorder.workout_ids)
+    success = workout_repo.bulk_reorder(reorder.workout_ids)
 
     if not success:
         raise HTTPException(status_code=400, detail="Failed to reorder workouts")
 
-    return {"success": True, "message": "Workouts reordered"}
+    return WorkoutBulkReorderResponse(success=True, message="Workouts reordered")
 
 
 @router.post("/date/{source_date}/move", response_model=WorkoutMoveDateResponse)
 def move_workouts_to_date(source_date: str, move: WorkoutMoveDate):
     """Move all workouts from one date to another."""
-    repo = WorkoutRepository()
-
     if source_date == move.target_date:
         raise HTTPException(status_code=400, detail="Source and target dates must be different")
 
-    count = repo.move_to_date(source_date, move.target_date)
+    count = workout_repo.move_to_date(source_date, move.target_date)
 
     if count == 0:
         raise HTTPException(status_code=404, detail="No workouts found on source date")
@@ -126,15 +127,13 @@ def move_workouts_to_date(source_date: str, move: WorkoutMoveDate):
 @router.post("/date/{source_date}/copy", response_model=WorkoutCopyDateResponse)
 def copy_workouts_to_date(source_date: str, copy: WorkoutCopyDate):
     """Copy all workouts from one date to another."""
-    repo = WorkoutRepository()
-
     if source_date == copy.target_date:
         raise HTTPException(
             status_code=400,
             detail="Source and target dates must be different"
         )
 
-    count = repo.copy_to_date(source_date, copy.target_date)
+    count = workout_repo.copy_to_date(source_date, copy.target_date)
 
     if count == 0:
         raise HTTPException(
@@ -153,9 +152,7 @@ def copy_workouts_to_date(source_date: str, copy: WorkoutCopyDate):
 @router.patch("/{workout_id}/complete", response_model=Workout)
 def toggle_workout_complete(workout_id: int, complete: WorkoutComplete):
     """Mark a workout set as complete or incomplete."""
-    repo = WorkoutRepository()
-
-    updated = repo.toggle_complete(workout_id, complete.completed)
+    updated = workout_repo.toggle_complete(workout_id, complete.completed)
 
     if not updated:
         raise HTTPException(status_code=404, detail="Workout not found")
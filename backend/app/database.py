@@ -1,6 +1,6 @@
 """Database setup and connection management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config import settings
@@ -15,11 +15,41 @@ class Base(DeclarativeBase):
     """Base class for ORM models."""
 
 
+# Upper bound on the memory-mapped portion of the database file (bytes)
+SQLITE_MMAP_SIZE = 64 * 1024 * 1024
+
+# Per-connection page cache (KiB); SQLite's default is 2 MiB
+SQLITE_CACHE_SIZE_KIB = 16 * 1024
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure each new SQLite connection.
+
+    WAL makes every commit an atomic append to the write-ahead log, so readers
+    (API requests) never see a half-written transaction from the MQTT writer
+    and are not blocked while it commits. synchronous=NORMAL is durable in WAL
+    mode apart from the last commits on power loss and avoids an fsync per commit.
+    mmap_size lets SQLite read pages straight from the OS page cache instead of
+    copying them through read() into its own buffers, and a larger page cache
+    keeps full-history scans (progression, body composition) from re-reading
+    pages within a connection.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    # Negative values are a size in KiB rather than a page count
+    cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KIB}")
+    cursor.close()
+
+
+# No pool_pre_ping: a SQLite file connection cannot go stale the way a network
+# connection can, so pinging on every checkout was a wasted round trip per request.
 engine = create_engine(
     _build_db_url(),
     connect_args={"check_same_thread": False},
-    pool_pre_ping=True,
 )
+event.listen(engine, "connect", set_sqlite_pragmas)
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
@@ -4,10 +4,32 @@ from datetime import datetime
 
 from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 from app.database import Base
 
 
+class Reps(TypeDecorator):
+    """Rep count stored as text, so values like "5+" survive, but loaded typed.
+
+    Purely numeric values come back as ``int`` at the database boundary rather
+    than every reader re-parsing the string.
+    """
+
+    impl = String(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return str(value)
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.isdigit():
+            return int(value)
+        return value
+
+
 class Category(Base):
     """Exercise category."""
 
@@ -30,6 +52,7 @@ class Exercise(Base):
     """Exercise definition."""
 
     __tablename__ = "exercises"
+    __table_args__ = (Index("ix_exercises_category_last_used", "category_id", "last_used"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(150), unique=True, index=True, nullable=False)
@@ -50,7 +73,10 @@ class Workout(Base):
     """Historical workout entry."""
 
     __tablename__ = "workouts"
-    __table_args__ = (Index("ix_workouts_date_order", "date", "order"),)
+    __table_args__ = (
+        Index("ix_workouts_date_order", "date", "order"),
+        Index("ix_workouts_exercise_date", "exercise_id", "date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     date: Mapped[str] = mapped_column(String(10), index=True, nullable=False)
@@ -62,7 +88,7 @@ class Workout(Base):
     )
     weight: Mapped[float | None] = mapped_column(Float, nullable=True)
     weight_unit: Mapped[str] = mapped_column(String(16), nullable=False)
-    reps: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    reps: Mapped[int | str | None] = mapped_column(Reps, nullable=True)
     distance: Mapped[float | None] = mapped_column(Float, nullable=True)
     distance_unit: Mapped[str | None] = mapped_column(String(16), nullable=True)
     time: Mapped[str | None] = mapped_column(String(32), nullable=True)
@@ -16,6 +16,17 @@ from app.services.mqtt_service import MQTTService
 mqtt_service: MQTTService | None = None
 
 
+class ImmutableStaticFiles(StaticFiles):
+    """Static files whose names are content-hashed by the build, so browsers may
+    cache them indefinitely instead of revalidating on every page load."""
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle manager for startup and shutdown."""
@@ -99,8 +110,10 @@ if not static_dir.exists():
     static_dir = Path(__file__).parent.parent.parent / "frontend" / "dist"
 
 if static_dir.exists() and static_dir.is_dir():
-    # Mount static files for assets
-    app.mount("/assets", StaticFiles(directory=str(static_dir / "assets")), name="assets")
+    # Mount static files for assets (Vite emits hashed file names)
+    app.mount(
+        "/assets", ImmutableStaticFiles(directory=str(static_dir / "assets")), name="assets"
+    )
 
     # Serve static files (manifest, service worker, icons)
     @app.get("/manifest.webmanifest")
@@ -115,8 +128,10 @@ if static_dir.exists() and static_dir.is_dir():
     async def workbox(filename: str):
         return FileResponse(static_dir / f"workbox-{filename}", media_type="application/javascript")
 
+    # Plain def: the exists() check is blocking filesystem I/O, so let FastAPI
+    # run it in the threadpool like the API endpoints instead of on the event loop
     @app.get("/{filename}.png")
-    async def icons(filename: str):
+    def icons(filename: str):
         file_path = static_dir / f"{filename}.png"
         if file_path.exists():
             return FileResponse(file_path, media_type="image/png")
@@ -27,6 +27,12 @@ class WorkoutCreate(WorkoutBase):
     order: Optional[int] = None
 
 
+class WorkoutBulkCreate(BaseModel):
+    """Model for bulk creating workouts."""
+
+    workouts: list[WorkoutCreate]
+
+
 class WorkoutUpdate(WorkoutBase):
     """Model for updating a workout."""
 
@@ -56,6 +62,13 @@ class WorkoutBulkReorder(BaseModel):
     workout_ids: list[int] = Field(..., description="Ordered list of workout IDs")
 
 
+class WorkoutBulkReorderResponse(BaseModel):
+    """Response for bulk reordering workouts."""
+
+    success: bool
+    message: str
+
+
 class WorkoutComplete(BaseModel):
     """Model for marking workout as complete."""
 
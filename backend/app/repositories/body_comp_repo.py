@@ -1,15 +1,107 @@
 """Body composition repository for database operations."""
 
+import bisect
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
 
 from app.database import SessionLocal
 from app.db.models import BodyComposition
 from app.models.body_composition import BodyCompositionCreate
 from app.utils.date_helpers import get_current_datetime, PACIFIC_TZ
 
+# Process-wide cache of all measurements (serialized, ascending by timestamp).
+# Guarded by a lock because the MQTT service writes from paho's network thread.
+_cache_lock = threading.Lock()
+_cache_key: Optional[tuple] = None
+_cache_rows: list[dict] = []
+_cache_columns: dict[str, list] = {}
+
+# Timestamps already stored, keyed by database URL, so duplicate readings (the
+# bulk of an openScaleSync "all" resync) are rejected without an INSERT attempt.
+# Timestamps are stored as naive wall-clock values, so the set holds them naive.
+# It is only a hint: rows deleted by another process stay in it, so a hit is
+# confirmed against the database before a reading is rejected.
+_known_timestamps: dict[str, set[datetime]] = {}
+
+# Column projection matching BodyCompositionRepository._serialize, used by the
+# bulk read paths so rows come back as plain mappings without ORM hydration.
+_ROW_COLUMNS = (
+    BodyComposition.id.label("doc_id"),
+    BodyComposition.timestamp,
+    BodyComposition.date,
+    BodyComposition.weight,
+    BodyComposition.weight_unit,
+    BodyComposition.body_fat_pct,
+    BodyComposition.muscle_mass,
+    BodyComposition.bmi,
+    BodyComposition.water_pct,
+    BodyComposition.bone_mass,
+    BodyComposition.visceral_fat,
+    BodyComposition.metabolic_age,
+    BodyComposition.protein_pct,
+    BodyComposition.created_at,
+)
+
+# Columns charted by /trends, labelled with their BodyCompositionTrend field names
+_TREND_COLUMNS = (
+    BodyComposition.date.label("dates"),
+    BodyComposition.weight.label("weights"),
+    BodyComposition.body_fat_pct.label("body_fat_pcts"),
+    BodyComposition.muscle_mass.label("muscle_masses"),
+    BodyComposition.water_pct.label("water_pcts"),
+)
+
+
+def _invalidate_cache() -> None:
+    global _cache_key
+    with _cache_lock:
+        _cache_key = None
+
+
+def _timestamp_key(timestamp: datetime) -> datetime:
+    return timestamp.replace(tzinfo=None)
+
+
+def _as_stored(row: dict) -> dict:
+    """Return a just-written row as reads will return it.
+
+    Timestamps are stored as naive wall-clock values, so the database hands
+    them back without the offset the incoming values carried.
+    """
+    return {
+        **row,
+        "timestamp": row["timestamp"].replace(tzinfo=None),
+        "created_at": row["created_at"].replace(tzinfo=None),
+    }
+
+
+def _recent_cutoff_date(days: int) -> str:
+    """First date (YYYY-MM-DD) inside a window of the last N days.
+
+    Compared against the indexed date column, so the range is filtered in SQL.
+    """
+    return (get_current_datetime().date() - timedelta(days=days)).isoformat()
+
+
+def _ensure_pacific(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=PACIFIC_TZ)
+    return dt.astimezone(PACIFIC_TZ)
+
+
+def _build_columns(rows: list[dict]) -> dict[str, list]:
+    """Build column-oriented views of the rows used by the stats computation."""
+    return {
+        # POSIX seconds: normalized once here so window checks are float compares
+        # rather than aware-datetime compares that resolve UTC offsets every time.
+        "epoch": [_ensure_pacific(row["timestamp"]).timestamp() for row in rows],
+        "weight": [row["weight"] for row in rows],
+    }
+
 
 class BodyCompositionRepository:
     """Repository for body composition data operations."""
@@ -32,16 +124,122 @@ class BodyCompositionRepository:
             "created_at": measurement.created_at,
         }
 
+    def _fetch_rows(self, session, statement) -> list[dict]:
+        """Execute a projection of _ROW_COLUMNS and return serialized dicts."""
+        return [dict(row) for row in session.execute(statement).mappings()]
+
+    def _get_known_timestamps(self, session) -> set[datetime]:
+        """Return the set of stored timestamps, loading it on first use."""
+        url = str(session.get_bind().url)
+        with _cache_lock:
+            known = _known_timestamps.get(url)
+        if known is None:
+            known = set(session.execute(select(BodyComposition.timestamp)).scalars())
+            with _cache_lock:
+                known = _known_timestamps.setdefault(url, known)
+        return known
+
+    def _confirm_stored(
+        self, session, known: set[datetime], timestamps: set[datetime]
+    ) -> set[datetime]:
+        """Return which of the given known timestamps are really still stored.
+
+        Stale entries (rows deleted outside this process) are dropped from the set.
+        """
+        if not timestamps:
+            return set()
+        stored = set(
+            session.execute(
+                select(BodyComposition.timestamp).where(
+                    BodyComposition.timestamp.in_(timestamps)
+                )
+            ).scalars()
+        )
+        with _cache_lock:
+            known.difference_update(timestamps - stored)
+        return stored
+
+    def _fingerprint(self, session) -> tuple:
+        """Cheap summary of the table used to detect changes since the cache was built."""
+        fingerprint = session.execute(
+            select(
+                func.count(BodyComposition.id),
+                func.max(BodyComposition.id),
+                func.max(BodyComposition.created_at),
+            )
+        ).one()
+        return (str(session.get_bind().url), *fingerprint)
+
+    def _add_to_cache(self, session, row: dict) -> None:
+        """Insert a just-created row (as stored) into the warm cache in timestamp order.
+
+        Falls back to invalidating when anything but this one insert changed the
+        table since the cache was built. The lists are copied rather than mutated
+        because readers may be iterating the current ones.
+        """
+        global _cache_key, _cache_rows, _cache_columns
+
+        key = self._fingerprint(session)
+
+        with _cache_lock:
+            if (
+                _cache_key is None
+                or _cache_key[0] != key[0]
+                or key[1] != _cache_key[1] + 1
+                or key[2] != row["doc_id"]
+            ):
+                _cache_key = None
+                return
+
+            index = bisect.bisect_right(
+                _cache_rows, row["timestamp"], key=lambda r: r["timestamp"]
+            )
+            rows = list(_cache_rows)
+            rows.insert(index, row)
+            columns = {name: list(values) for name, values in _cache_columns.items()}
+            for name, values in _build_columns([row]).items():
+                columns[name].insert(index, values[0])
+
+            _cache_key = key
+            _cache_rows = rows
+            _cache_columns = columns
+
+    def _get_cached_measurements(self) -> tuple[list[dict], dict[str, list]]:
+        """Return all measurements ascending by timestamp, re-reading only on change.
+
+        Returns the serialized rows and their column views. Both are shared;
+        callers must not mutate them.
+        """
+        global _cache_key, _cache_rows, _cache_columns
+
+        with SessionLocal() as session:
+            key = self._fingerprint(session)
+
+            with _cache_lock:
+                if key == _cache_key:
+                    return _cache_rows, _cache_columns
+
+            rows = self._fetch_rows(
+                session, select(*_ROW_COLUMNS).order_by(BodyComposition.timestamp.asc())
+            )
+        columns = _build_columns(rows)
+
+        with _cache_lock:
+            _cache_key = key
+            _cache_rows = rows
+            _cache_columns = columns
+        return rows, columns
+
     def get_all(self, skip: int = 0, limit: int = 100) -> list[dict]:
         """Get all measurements with pagination."""
         with SessionLocal() as session:
-            measurements = session.execute(
-                select(BodyComposition)
+            return self._fetch_rows(
+                session,
+                select(*_ROW_COLUMNS)
                 .order_by(BodyComposition.timestamp.desc())
                 .offset(skip)
-                .limit(limit)
-            ).scalars().all()
-            return [self._serialize(m) for m in measurements]
+                .limit(limit),
+            )
 
     def get_by_id(self, doc_id: int) -> Optional[dict]:
         """Get a measurement by ID."""
@@ -50,71 +248,158 @@ class BodyCompositionRepository:
             return self._serialize(measurement) if measurement else None
 
     def get_latest(self) -> Optional[dict]:
-        """Get the most recent measurement."""
+        """Get the most recent measurement.
+
+        A top-1 read on the timestamp index, projected like the bulk reads so
+        no ORM object is built for it.
+        """
         with SessionLocal() as session:
-            measurement = session.execute(
-                select(BodyComposition).order_by(BodyComposition.timestamp.desc()).limit(1)
-            ).scalar_one_or_none()
-            return self._serialize(measurement) if measurement else None
+            rows = self._fetch_rows(
+                session,
+                select(*_ROW_COLUMNS).order_by(BodyComposition.timestamp.desc()).limit(1),
+            )
+            return rows[0] if rows else None
 
     def get_by_date_range(self, start_date: str, end_date: str) -> list[dict]:
-        """Get measurements within a date range."""
+        """Get measurements within a date range.
+
+        Ordering by (date, timestamp) lets SQLite walk the composite index for
+        the range instead of scanning the whole table by timestamp.
+        """
         with SessionLocal() as session:
-            measurements = session.execute(
-                select(BodyComposition)
+            return self._fetch_rows(
+                session,
+                select(*_ROW_COLUMNS)
                 .where(BodyComposition.date >= start_date)
                 .where(BodyComposition.date <= end_date)
-                .order_by(BodyComposition.timestamp.asc())
-            ).scalars().all()
-            return [self._serialize(m) for m in measurements]
+                .order_by(BodyComposition.date.asc(), BodyComposition.timestamp.asc()),
+            )
 
     def get_recent(self, days: int = 30) -> list[dict]:
         """Get measurements from the last N days."""
-        cutoff_date = (
-            datetime.now(PACIFIC_TZ).date() - timedelta(days=days)
-        ).isoformat()
+        cutoff_date = _recent_cutoff_date(days)
 
         with SessionLocal() as session:
-            measurements = session.execute(
-                select(BodyComposition)
+            return self._fetch_rows(
+                session,
+                select(*_ROW_COLUMNS)
                 .where(BodyComposition.date >= cutoff_date)
-                .order_by(BodyComposition.timestamp.asc())
-            ).scalars().all()
-            return [self._serialize(m) for m in measurements]
+                .order_by(BodyComposition.date.asc(), BodyComposition.timestamp.asc()),
+            )
+
+    def get_recent_trends(self, days: int = 30) -> dict[str, list]:
+        """Get the charted columns of the last N days of measurements.
+
+        Selects only the trend columns and transposes the rows into columns in
+        one zip, instead of building a full dict per measurement first.
+        """
+        cutoff_date = _recent_cutoff_date(days)
+
+        with SessionLocal() as session:
+            rows = session.execute(
+                select(*_TREND_COLUMNS)
+                .where(BodyComposition.date >= cutoff_date)
+                .order_by(BodyComposition.date.asc(), BodyComposition.timestamp.asc())
+            ).all()
+
+        columns = zip(*rows) if rows else ((),) * len(_TREND_COLUMNS)
+        return {
+            column.key: list(values) for column, values in zip(_TREND_COLUMNS, columns)
+        }
+
+    def _column_values(self, measurement: BodyCompositionCreate, now: datetime) -> dict:
+        """Column values for a new row, in _serialize order (minus doc_id)."""
+        measurement_dict = measurement.model_dump(exclude_none=False)
+        return {
+            "timestamp": measurement.timestamp,
+            "date": measurement_dict["date"],
+            "weight": measurement_dict["weight"],
+            "weight_unit": measurement_dict.get("weight_unit") or "kg",
+            "body_fat_pct": measurement_dict.get("body_fat_pct"),
+            "muscle_mass": measurement_dict.get("muscle_mass"),
+            "bmi": measurement_dict.get("bmi"),
+            "water_pct": measurement_dict.get("water_pct"),
+            "bone_mass": measurement_dict.get("bone_mass"),
+            "visceral_fat": measurement_dict.get("visceral_fat"),
+            "metabolic_age": measurement_dict.get("metabolic_age"),
+            "protein_pct": measurement_dict.get("protein_pct"),
+            "created_at": now,
+        }
 
     def create(self, measurement: BodyCompositionCreate) -> Optional[dict]:
         """Create a new measurement. Returns None if duplicate timestamp."""
-        timestamp = measurement.timestamp
+        timestamp_key = _timestamp_key(measurement.timestamp)
 
         with SessionLocal() as session:
-            existing = session.execute(
-                select(BodyComposition).where(BodyComposition.timestamp == timestamp)
-            ).scalar_one_or_none()
-            if existing:
+            known = self._get_known_timestamps(session)
+            if timestamp_key in known and self._confirm_stored(
+                session, known, {timestamp_key}
+            ):
                 return None
 
-            now = get_current_datetime()
-            measurement_dict = measurement.model_dump(exclude_none=False)
-
+            # The unique constraint on timestamp still guards against rows
+            # written since the set was built.
             new_measurement = BodyComposition(
-                timestamp=timestamp,
-                date=measurement_dict["date"],
-                weight=measurement_dict["weight"],
-                weight_unit=measurement_dict.get("weight_unit") or "kg",
-                body_fat_pct=measurement_dict.get("body_fat_pct"),
-                muscle_mass=measurement_dict.get("muscle_mass"),
-                bmi=measurement_dict.get("bmi"),
-                water_pct=measurement_dict.get("water_pct"),
-                bone_mass=measurement_dict.get("bone_mass"),
-                visceral_fat=measurement_dict.get("visceral_fat"),
-                metabolic_age=measurement_dict.get("metabolic_age"),
-                protein_pct=measurement_dict.get("protein_pct"),
-                created_at=now,
+                **self._column_values(measurement, get_current_datetime())
             )
             session.add(new_measurement)
-            session.commit()
-            session.refresh(new_measurement)
-            return self._serialize(new_measurement)
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                return None
+            with _cache_lock:
+                known.add(timestamp_key)
+            created = _as_stored(self._serialize(new_measurement))
+            self._add_to_cache(session, created)
+            return created
+
+    def create_many(self, measurements: list[BodyCompositionCreate]) -> list[dict]:
+        """Create several measurements in one transaction, skipping duplicate timestamps.
+
+        Returns the measurements that were actually inserted.
+        """
+        with SessionLocal() as session:
+            known = self._get_known_timestamps(session)
+            now = get_current_datetime()
+
+            timestamps = {_timestamp_key(m.timestamp) for m in measurements}
+            with _cache_lock:
+                hinted = {timestamp for timestamp in timestamps if timestamp in known}
+            stored = self._confirm_stored(session, known, hinted)
+
+            pending: dict[datetime, dict] = {}
+            for measurement in measurements:
+                timestamp_key = _timestamp_key(measurement.timestamp)
+                if timestamp_key in stored or timestamp_key in pending:
+                    continue
+                pending[timestamp_key] = self._column_values(measurement, now)
+
+            if not pending:
+                return []
+
+            rows = list(pending.values())
+            try:
+                # One executemany INSERT from plain dicts; no per-row ORM objects
+                ids = session.execute(
+                    insert(BodyComposition).returning(
+                        BodyComposition.id, sort_by_parameter_order=True
+                    ),
+                    rows,
+                ).scalars().all()
+                session.commit()
+            except IntegrityError:
+                # Another writer got in first; fall back to row-at-a-time inserts.
+                session.rollback()
+                with _cache_lock:
+                    _known_timestamps.pop(str(session.get_bind().url), None)
+                created = [self.create(m) for m in measurements]
+                return [c for c in created if c is not None]
+
+            with _cache_lock:
+                known.update(pending)
+            _invalidate_cache()
+            return [_as_stored({"doc_id": doc_id, **row}) for doc_id, row in zip(ids, rows)]
 
     def delete(self, doc_id: int) -> bool:
         """Delete a measurement."""
@@ -124,83 +409,74 @@ class BodyCompositionRepository:
                 return False
             session.delete(measurement)
             session.commit()
+            with _cache_lock:
+                _known_timestamps.pop(str(session.get_bind().url), None)
+            _invalidate_cache()
             return True
 
     def get_stats(self) -> dict:
         """Get summary statistics."""
-        with SessionLocal() as session:
-            measurements = session.execute(
-                select(BodyComposition).order_by(BodyComposition.timestamp.asc())
-            ).scalars().all()
-            if not measurements:
-                return {
-                    "total_measurements": 0,
-                    "latest_weight": None,
-                    "latest_body_fat": None,
-                    "latest_muscle_mass": None,
-                    "weight_change": None,
-                    "body_fat_change": None,
-                    "muscle_mass_change": None,
-                    "first_date": None,
-                    "latest_date": None,
-                }
-
-            first = measurements[0]
-            latest = measurements[-1]
-
-            def _ensure_pacific(dt: datetime) -> datetime:
-                if dt.tzinfo is None:
-                    return dt.replace(tzinfo=PACIFIC_TZ)
-                return dt.astimezone(PACIFIC_TZ)
-
-            now = datetime.now(PACIFIC_TZ)
-            thirty_days_ago = now - timedelta(days=30)
-            sixty_days_ago = now - timedelta(days=60)
-
-            last_30_days = [
-                m for m in measurements if _ensure_pacific(m.timestamp) >= thirty_days_ago
-            ]
-            prev_30_days = [
-                m
-                for m in measurements
-                if sixty_days_ago <= _ensure_pacific(m.timestamp) < thirty_days_ago
-            ]
-
-            def calculate_avg_weight(measurement_list):
-                weights = [m.weight for m in measurement_list if m.weight is not None]
-                return sum(weights) / len(weights) if weights else None
-
-            avg_weight_last_30 = calculate_avg_weight(last_30_days)
-            avg_weight_prev_30 = calculate_avg_weight(prev_30_days)
-
-            weight_change = None
-            if avg_weight_last_30 is not None and avg_weight_prev_30 is not None:
-                weight_change = avg_weight_last_30 - avg_weight_prev_30
-
-            def safe_float(value):
-                try:
-                    return float(value) if value is not None else None
-                except (ValueError, TypeError):
-                    return None
-
+        measurements, columns = self._get_cached_measurements()
+        if not measurements:
             return {
-                "total_measurements": len(measurements),
-                "latest_weight": safe_float(latest.weight),
-                "latest_body_fat": safe_float(latest.body_fat_pct),
-                "latest_muscle_mass": safe_float(latest.muscle_mass),
-                "weight_change": weight_change,
-                "body_fat_change": (
-                    safe_float(latest.body_fat_pct) - safe_float(first.body_fat_pct)
-                    if safe_float(latest.body_fat_pct) is not None
-                    and safe_float(first.body_fat_pct) is not None
-                    else None
-                ),
-                "muscle_mass_change": (
-                    safe_float(latest.muscle_mass) - safe_float(first.muscle_mass)
-                    if safe_float(latest.muscle_mass) is not None
-                    and safe_float(first.muscle_mass) is not None
-                    else None
-                ),
-                "first_date": first.date,
-                "latest_date": latest.date,
+                "total_measurements": 0,
+                "latest_weight": None,
+                "latest_body_fat": None,
+                "latest_muscle_mass": None,
+                "weight_change": None,
+                "body_fat_change": None,
+                "muscle_mass_change": None,
+                "first_date": None,
+                "latest_date": None,
             }
+
+        first = measurements[0]
+        latest = measurements[-1]
+
+        now = get_current_datetime()
+        thirty_days_ago = (now - timedelta(days=30)).timestamp()
+        sixty_days_ago = (now - timedelta(days=60)).timestamp()
+
+        # Rows are in timestamp order, so each window is a contiguous slice
+        epochs = columns["epoch"]
+        weights = columns["weight"]
+        start_60 = bisect.bisect_left(epochs, sixty_days_ago)
+        start_30 = bisect.bisect_left(epochs, thirty_days_ago, lo=start_60)
+        last_30_weights = [w for w in weights[start_30:] if w is not None]
+        prev_30_weights = [w for w in weights[start_60:start_30] if w is not None]
+
+        def calculate_avg_weight(values):
+            return sum(values) / len(values) if values else None
+
+        avg_weight_last_30 = calculate_avg_weight(last_30_weights)
+        avg_weight_prev_30 = calculate_avg_weight(prev_30_weights)
+
+        weight_change = None
+        if avg_weight_last_30 is not None and avg_weight_prev_30 is not None:
+            weight_change = avg_weight_last_30 - avg_weight_prev_30
+
+        def safe_float(value):
+            try:
+                return float(value) if value is not None else None
+            except (ValueError, TypeError):
+                return None
+
+        def change(latest_value, first_value):
+            if latest_value is None or first_value is None:
+                return None
+            return latest_value - first_value
+
+        latest_body_fat = safe_float(latest["body_fat_pct"])
+        latest_muscle_mass = safe_float(latest["muscle_mass"])
+
+        return {
+            "total_measurements": len(measurements),
+            "latest_weight": safe_float(latest["weight"]),
+            "latest_body_fat": latest_body_fat,
+            "latest_muscle_mass": latest_muscle_mass,
+            "weight_change": weight_change,
+            "body_fat_change": change(latest_body_fat, safe_float(first["body_fat_pct"])),
+            "muscle_mass_change": change(latest_muscle_mass, safe_float(first["muscle_mass"])),
+            "first_date": first["date"],
+            "latest_date": latest["date"],
+        }
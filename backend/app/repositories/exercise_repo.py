@@ -3,7 +3,8 @@
 from typing import Optional
 
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload
 
 from app.database import SessionLocal
 from app.db.models import Category, Exercise
@@ -44,7 +45,7 @@ class ExerciseRepository:
         """Get all exercises."""
         with SessionLocal() as session:
             exercises = session.execute(
-                select(Exercise).options(selectinload(Exercise.category))
+                select(Exercise).options(joinedload(Exercise.category))
             ).scalars().all()
             return [self._serialize(exercise) for exercise in exercises]
 
@@ -53,7 +54,7 @@ class ExerciseRepository:
         with SessionLocal() as session:
             exercise = session.execute(
                 select(Exercise)
-                .options(selectinload(Exercise.category))
+                .options(joinedload(Exercise.category))
                 .where(Exercise.name == name)
             ).scalar_one_or_none()
             return self._serialize(exercise) if exercise else None
@@ -64,18 +65,30 @@ class ExerciseRepository:
             exercises = session.execute(
                 select(Exercise)
                 .join(Category)
-                .options(selectinload(Exercise.category))
+                .options(joinedload(Exercise.category))
                 .where(Category.name == category)
                 .order_by(Exercise.last_used.desc())
             ).scalars().all()
             return [self._serialize(exercise) for exercise in exercises]
 
+    def get_names_by_category(self, category: str) -> list[str]:
+        """Get exercise names in a category, most recently used first."""
+        with SessionLocal() as session:
+            return list(
+                session.execute(
+                    select(Exercise.name)
+                    .join(Category)
+                    .where(Category.name == category)
+                    .order_by(Exercise.last_used.desc())
+                ).scalars()
+            )
+
     def create(self, exercise: ExerciseCreate) -> dict:
         """Create a new exercise."""
         with SessionLocal() as session:
             existing = session.execute(
                 select(Exercise)
-                .options(selectinload(Exercise.category))
+                .options(joinedload(Exercise.category))
                 .where(Exercise.name == exercise.name)
             ).scalar_one_or_none()
             if existing:
@@ -97,6 +110,58 @@ class ExerciseRepository:
             session.refresh(new_exercise)
             return self._serialize(new_exercise)
 
+    def create_missing(self, exercises_by_category: dict[str, list[str]]) -> tuple[int, int]:
+        """Create any of the given exercises and categories that don't exist yet.
+
+        Each table gets one INSERT ... ON CONFLICT (name) DO NOTHING, so the
+        unique name index does the existence check and only the rows actually
+        inserted come back. Everything runs in a single transaction.
+
+        Returns:
+            Tuple of (categories created, exercises created)
+        """
+        if not exercises_by_category:
+            return 0, 0
+
+        now = get_current_datetime()
+        with SessionLocal() as session:
+            created_categories = session.execute(
+                sqlite_insert(Category)
+                .values([{"name": name, "created_at": now} for name in exercises_by_category])
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(Category.id)
+            ).all()
+            category_ids = dict(
+                session.execute(
+                    select(Category.name, Category.id)
+                    .where(Category.name.in_(exercises_by_category))
+                ).all()
+            )
+
+            exercise_rows = [
+                {
+                    "name": name,
+                    "category_id": category_ids[category_name],
+                    "notes": None,
+                    "last_used": None,
+                    "use_count": 0,
+                    "created_at": now,
+                }
+                for category_name, names in exercises_by_category.items()
+                for name in names
+            ]
+            created_exercises = []
+            if exercise_rows:
+                created_exercises = session.execute(
+                    sqlite_insert(Exercise)
+                    .values(exercise_rows)
+                    .on_conflict_do_nothing(index_elements=["name"])
+                    .returning(Exercise.id)
+                ).all()
+
+            session.commit()
+            return len(created_categories), len(created_exercises)
+
     def update_usage(self, name: str, date: str) -> bool:
         """Update exercise usage statistics."""
         with SessionLocal() as session:
@@ -116,7 +181,7 @@ class ExerciseRepository:
         with SessionLocal() as session:
             exercises = session.execute(
                 select(Exercise)
-                .options(selectinload(Exercise.category))
+                .options(joinedload(Exercise.category))
                 .where(Exercise.last_used.is_not(None))
                 .order_by(Exercise.last_used.desc())
                 .limit(limit)
@@ -128,7 +193,7 @@ class ExerciseRepository:
         with SessionLocal() as session:
             exercise = session.execute(
                 select(Exercise)
-                .options(selectinload(Exercise.category))
+                .options(joinedload(Exercise.category))
                 .where(Exercise.id == exercise_id)
             ).scalar_one_or_none()
             if not exercise:
@@ -2,11 +2,11 @@
 
 from typing import Optional
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import joinedload
 
 from app.database import SessionLocal
-from app.db.models import Category, Exercise, UpcomingWorkout
+from app.db.models import Category, Exercise, UpcomingWorkout, Workout
 from app.models.upcoming import UpcomingWorkoutCreate
 from app.utils.date_helpers import get_current_datetime
 
@@ -68,16 +68,19 @@ class UpcomingWorkoutRepository:
         return exercise
 
     def get_all(self) -> list[dict]:
-        """Get all upcoming workouts, sorted by session."""
+        """Get all upcoming workouts, sorted by session and then creation order.
+
+        Callers can group sessions in a single pass over the result.
+        """
         with SessionLocal() as session:
             workouts = (
                 session.execute(
                     select(UpcomingWorkout)
                     .options(
-                        selectinload(UpcomingWorkout.exercise),
-                        selectinload(UpcomingWorkout.category),
+                        joinedload(UpcomingWorkout.exercise),
+                        joinedload(UpcomingWorkout.category),
                     )
-                    .order_by(UpcomingWorkout.session.asc())
+                    .order_by(UpcomingWorkout.session.asc(), UpcomingWorkout.id.asc())
                 )
                 .scalars()
                 .all()
@@ -91,8 +94,8 @@ class UpcomingWorkoutRepository:
                 session.execute(
                     select(UpcomingWorkout)
                     .options(
-                        selectinload(UpcomingWorkout.exercise),
-                        selectinload(UpcomingWorkout.category),
+                        joinedload(UpcomingWorkout.exercise),
+                        joinedload(UpcomingWorkout.category),
                     )
                     .where(UpcomingWorkout.session == session_id)
                     .order_by(UpcomingWorkout.id.asc())
@@ -139,50 +142,59 @@ class UpcomingWorkoutRepository:
             session.refresh(new_workout)
             return self._serialize(new_workout)
 
+    def _add_workouts(
+        self, session, workouts: list[UpcomingWorkoutCreate]
+    ) -> list[UpcomingWorkout]:
+        """Add new upcoming workouts to a session without committing."""
+        now = get_current_datetime()
+        categories_cache: dict[str, Category] = {}
+        exercises_cache: dict[str, Exercise] = {}
+        created = []
+
+        for workout in workouts:
+            workout_dict = workout.model_dump(exclude_none=False)
+            category_name = workout_dict["category"]
+            exercise_name = workout_dict["exercise"]
+
+            category = categories_cache.get(category_name)
+            if not category:
+                category = self._get_or_create_category(session, category_name)
+                categories_cache[category_name] = category
+
+            exercise = exercises_cache.get(exercise_name)
+            if not exercise:
+                exercise = self._get_or_create_exercise(session, exercise_name, category)
+                exercises_cache[exercise_name] = exercise
+
+            reps = workout_dict.get("reps")
+            if reps is not None and not isinstance(reps, str):
+                reps = str(reps)
+
+            new_workout = UpcomingWorkout(
+                session=workout_dict["session"],
+                exercise_id=exercise.id,
+                category_id=category.id,
+                weight=workout_dict.get("weight"),
+                weight_unit=workout_dict.get("weight_unit") or "lbs",
+                reps=reps,
+                distance=workout_dict.get("distance"),
+                distance_unit=workout_dict.get("distance_unit"),
+                time=workout_dict.get("time"),
+                comment=workout_dict.get("comment"),
+                created_at=now,
+            )
+            session.add(new_workout)
+            created.append(new_workout)
+
+        return created
+
     def create_bulk(self, workouts: list[UpcomingWorkoutCreate]) -> list[dict]:
         """Create multiple upcoming workouts."""
         if not workouts:
             return []
 
         with SessionLocal() as session:
-            categories_cache: dict[str, Category] = {}
-            exercises_cache: dict[str, Exercise] = {}
-            created = []
-
-            for workout in workouts:
-                workout_dict = workout.model_dump(exclude_none=False)
-                category_name = workout_dict["category"]
-                exercise_name = workout_dict["exercise"]
-
-                category = categories_cache.get(category_name)
-                if not category:
-                    category = self._get_or_create_category(session, category_name)
-                    categories_cache[category_name] = category
-
-                exercise = exercises_cache.get(exercise_name)
-                if not exercise:
-                    exercise = self._get_or_create_exercise(session, exercise_name, category)
-                    exercises_cache[exercise_name] = exercise
-
-                reps = workout_dict.get("reps")
-                if reps is not None and not isinstance(reps, str):
-                    reps = str(reps)
-
-                new_workout = UpcomingWorkout(
-                    session=workout_dict["session"],
-                    exercise_id=exercise.id,
-                    category_id=category.id,
-                    weight=workout_dict.get("weight"),
-                    weight_unit=workout_dict.get("weight_unit") or "lbs",
-                    reps=reps,
-                    distance=workout_dict.get("distance"),
-                    distance_unit=workout_dict.get("distance_unit"),
-                    time=workout_dict.get("time"),
-                    comment=workout_dict.get("comment"),
-                    created_at=get_current_datetime(),
-                )
-                session.add(new_workout)
-                created.append(new_workout)
+            created = self._add_workouts(session, workouts)
 
             session.commit()
             for workout in created:
@@ -190,24 +202,80 @@ class UpcomingWorkoutRepository:
 
             return [self._serialize(workout) for workout in created]
 
+    def replace_all(self, workouts: list[UpcomingWorkoutCreate]) -> tuple[int, int]:
+        """Replace every upcoming workout in one transaction.
+
+        Returns (deleted count, created count). Either both the delete and the
+        inserts land or neither does, so a failed generate never leaves the
+        program empty.
+        """
+        with SessionLocal() as session:
+            deleted = session.execute(delete(UpcomingWorkout)).rowcount
+            created = self._add_workouts(session, workouts)
+            session.commit()
+            return deleted, len(created)
+
     def delete_session(self, session_id: int) -> int:
         """Delete all workouts in a session. Returns count of deleted workouts."""
         with SessionLocal() as session:
-            workouts = (
+            result = session.execute(
+                delete(UpcomingWorkout).where(UpcomingWorkout.session == session_id)
+            )
+            session.commit()
+            return result.rowcount
+
+    def transfer_session(self, session_id: int, date: str) -> int:
+        """Move a session's workouts into the workout log on the given date.
+
+        The workouts keep their session order. Exercise and category ids are
+        copied over as-is, and the inserts and the delete from upcoming share
+        one transaction, so a failure leaves the session untouched.
+
+        Returns:
+            Number of workouts transferred (0 if the session doesn't exist)
+        """
+        now = get_current_datetime()
+
+        with SessionLocal() as session:
+            upcoming = (
                 session.execute(
-                    select(UpcomingWorkout).where(UpcomingWorkout.session == session_id)
+                    select(UpcomingWorkout)
+                    .where(UpcomingWorkout.session == session_id)
+                    .order_by(UpcomingWorkout.id.asc())
                 )
                 .scalars()
                 .all()
             )
-            if not workouts:
+            if not upcoming:
                 return 0
 
-            for workout in workouts:
-                session.delete(workout)
-
+            session.execute(
+                insert(Workout),
+                [
+                    {
+                        "date": date,
+                        "exercise_id": workout.exercise_id,
+                        "category_id": workout.category_id,
+                        "weight": workout.weight,
+                        "weight_unit": workout.weight_unit or "lbs",
+                        "reps": workout.reps,
+                        "distance": workout.distance,
+                        "distance_unit": workout.distance_unit,
+                        "time": workout.time,
+                        "comment": workout.comment,
+                        "order": order,
+                        "created_at": now,
+                        "updated_at": now,
+                        "completed_at": None,
+                    }
+                    for order, workout in enumerate(upcoming, start=1)
+                ],
+            )
+            session.execute(
+                delete(UpcomingWorkout).where(UpcomingWorkout.session == session_id)
+            )
             session.commit()
-            return len(workouts)
+            return len(upcoming)
 
     def get_by_exercise(self, exercise: str) -> list[dict]:
         """Get all upcoming workouts for a specific exercise."""
@@ -217,8 +285,8 @@ class UpcomingWorkoutRepository:
                     select(UpcomingWorkout)
                     .join(Exercise)
                     .options(
-                        selectinload(UpcomingWorkout.exercise),
-                        selectinload(UpcomingWorkout.category),
+                        joinedload(UpcomingWorkout.exercise),
+                        joinedload(UpcomingWorkout.category),
                     )
                     .where(Exercise.name == exercise)
                     .order_by(UpcomingWorkout.session.asc())
@@ -231,11 +299,6 @@ class UpcomingWorkoutRepository:
     def delete_all(self) -> int:
         """Delete all upcoming workouts. Returns count of deleted workouts."""
         with SessionLocal() as session:
-            workouts = session.execute(select(UpcomingWorkout)).scalars().all()
-
-            count = len(workouts)
-            for workout in workouts:
-                session.delete(workout)
-
+            result = session.execute(delete(UpcomingWorkout))
             session.commit()
-            return count
+            return result.rowcount
@@ -2,8 +2,8 @@
 
 from typing import Optional
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import joinedload
 
 from app.database import SessionLocal
 from app.db.models import Category, Exercise, Workout
@@ -15,10 +15,6 @@ class WorkoutRepository:
     """Repository for workout data operations."""
 
     def _serialize(self, workout: Workout) -> dict:
-        reps = workout.reps
-        if isinstance(reps, str) and reps.isdigit():
-            reps = int(reps)
-
         return {
             "doc_id": workout.id,
             "date": workout.date,
@@ -26,7 +22,7 @@ class WorkoutRepository:
             "category": workout.category.name if workout.category else None,
             "weight": workout.weight,
             "weight_unit": workout.weight_unit,
-            "reps": reps,
+            "reps": workout.reps,
             "distance": workout.distance,
             "distance_unit": workout.distance_unit,
             "time": workout.time,
@@ -70,12 +66,23 @@ class WorkoutRepository:
         session.flush()
         return exercise
 
+    def _next_order(self, session, date: str) -> int:
+        """Next free position on a date.
+
+        MAX over the (date, order) index is a single index seek, and unlike a
+        row count it never reuses a position left behind by a deleted workout.
+        """
+        max_order = session.execute(
+            select(func.max(Workout.order)).where(Workout.date == date)
+        ).scalar_one()
+        return (max_order or 0) + 1
+
     def get_all(self, skip: int = 0, limit: int = 100) -> list[dict]:
         """Get all workouts with pagination."""
         with SessionLocal() as session:
             workouts = session.execute(
                 select(Workout)
-                .options(selectinload(Workout.exercise), selectinload(Workout.category))
+                .options(joinedload(Workout.exercise), joinedload(Workout.category))
                 .order_by(Workout.date.desc(), Workout.order.desc())
                 .offset(skip)
                 .limit(limit)
@@ -87,7 +94,7 @@ class WorkoutRepository:
         with SessionLocal() as session:
             workout = session.execute(
                 select(Workout)
-                .options(selectinload(Workout.exercise), selectinload(Workout.category))
+                .options(joinedload(Workout.exercise), joinedload(Workout.category))
                 .where(Workout.id == doc_id)
             ).scalar_one_or_none()
             return self._serialize(workout) if workout else None
@@ -97,7 +104,7 @@ class WorkoutRepository:
         with SessionLocal() as session:
             workouts = session.execute(
                 select(Workout)
-                .options(selectinload(Workout.exercise), selectinload(Workout.category))
+                .options(joinedload(Workout.exercise), joinedload(Workout.category))
                 .where(Workout.date == date)
                 .order_by(Workout.order.asc())
             ).scalars().all()
@@ -113,14 +120,7 @@ class WorkoutRepository:
             exercise = self._get_or_create_exercise(session, workout_dict["exercise"], category)
 
             if workout_dict.get("order") is None:
-                count = session.execute(
-                    select(func.count()).select_from(Workout).where(Workout.date == workout.date)
-                ).scalar_one()
-                workout_dict["order"] = count + 1
-
-            reps = workout_dict.get("reps")
-            if reps is not None and not isinstance(reps, str):
-                reps = str(reps)
+                workout_dict["order"] = self._next_order(session, workout.date)
 
             order_value = workout_dict.get("order")
             if order_value is None:
@@ -132,7 +132,7 @@ class WorkoutRepository:
                 category_id=category.id,
                 weight=workout_dict.get("weight"),
                 weight_unit=workout_dict.get("weight_unit") or "lbs",
-                reps=reps,
+                reps=workout_dict.get("reps"),
                 distance=workout_dict.get("distance"),
                 distance_unit=workout_dict.get("distance_unit"),
                 time=workout_dict.get("time"),
@@ -145,10 +145,73 @@ class WorkoutRepository:
             session.add(new_workout)
             session.commit()
             session.refresh(new_workout)
-            session.refresh(exercise)
-            session.refresh(category)
             return self._serialize(new_workout)
 
+    def create_bulk(self, workouts: list[WorkoutCreate]) -> list[dict]:
+        """Create multiple workouts in a single transaction."""
+        if not workouts:
+            return []
+
+        now = get_current_datetime()
+
+        with SessionLocal() as session:
+            categories_cache: dict[str, Category] = {}
+            exercises_cache: dict[str, Exercise] = {}
+            next_order_by_date: dict[str, int] = {}
+            created = []
+
+            for workout in workouts:
+                workout_dict = workout.model_dump(exclude_none=False)
+                category_name = workout_dict["category"]
+                exercise_name = workout_dict["exercise"]
+                date = workout_dict["date"]
+
+                category = categories_cache.get(category_name)
+                if not category:
+                    category = self._get_or_create_category(session, category_name)
+                    categories_cache[category_name] = category
+
+                exercise = exercises_cache.get(exercise_name)
+                if not exercise:
+                    exercise = self._get_or_create_exercise(session, exercise_name, category)
+                    exercises_cache[exercise_name] = exercise
+
+                order_value = workout_dict.get("order")
+                if order_value is None:
+                    if date not in next_order_by_date:
+                        next_order_by_date[date] = self._next_order(session, date)
+                    order_value = next_order_by_date[date]
+                    next_order_by_date[date] += 1
+
+                new_workout = Workout(
+                    date=date,
+                    exercise_id=exercise.id,
+                    category_id=category.id,
+                    weight=workout_dict.get("weight"),
+                    weight_unit=workout_dict.get("weight_unit") or "lbs",
+                    reps=workout_dict.get("reps"),
+                    distance=workout_dict.get("distance"),
+                    distance_unit=workout_dict.get("distance_unit"),
+                    time=workout_dict.get("time"),
+                    comment=workout_dict.get("comment"),
+                    order=order_value,
+                    created_at=now,
+                    updated_at=now,
+                    completed_at=workout_dict.get("completed_at"),
+                )
+                session.add(new_workout)
+                created.append(new_workout)
+
+            session.commit()
+            # Reload the rows in one query, as create() refreshes its single
+            # row, so timestamps come back exactly as later reads return them
+            session.execute(
+                select(Workout)
+                .where(Workout.id.in_([workout.id for workout in created]))
+                .execution_options(populate_existing=True)
+            ).scalars().all()
+            return [self._serialize(workout) for workout in created]
+
     def update(self, doc_id: int, workout: WorkoutUpdate) -> Optional[dict]:
         """Update an existing workout."""
         workout_dict = workout.model_dump(exclude_none=False)
@@ -161,16 +224,12 @@ class WorkoutRepository:
             category = self._get_or_create_category(session, workout_dict["category"])
             exercise = self._get_or_create_exercise(session, workout_dict["exercise"], category)
 
-            reps = workout_dict.get("reps")
-            if reps is not None and not isinstance(reps, str):
-                reps = str(reps)
-
             existing.date = workout_dict["date"]
             existing.exercise_id = exercise.id
             existing.category_id = category.id
             existing.weight = workout_dict.get("weight")
             existing.weight_unit = workout_dict.get("weight_unit") or "lbs"
-            existing.reps = reps
+            existing.reps = workout_dict.get("reps")
             existing.distance = workout_dict.get("distance")
             existing.distance_unit = workout_dict.get("distance_unit")
             existing.time = workout_dict.get("time")
@@ -209,34 +268,31 @@ class WorkoutRepository:
             return self._serialize(workout)
 
     def reorder(self, doc_id: int, date: str, direction: str) -> bool:
-        """Reorder a workout within its date."""
+        """Reorder a workout within its date by swapping with its neighbour."""
         with SessionLocal() as session:
-            workouts = session.execute(
-                select(Workout)
-                .where(Workout.date == date)
-                .order_by(Workout.order.asc())
-            ).scalars().all()
-
-            workout_index = None
-            for i, w in enumerate(workouts):
-                if w.id == doc_id:
-                    workout_index = i
-                    break
-
-            if workout_index is None:
+            workout = session.get(Workout, doc_id)
+            if not workout or workout.date != date:
                 return False
 
-            if direction == "up" and workout_index == 0:
-                return False
-            if direction == "down" and workout_index == len(workouts) - 1:
+            # Seek the adjacent workout on the (date, order) index instead of
+            # loading and scanning the whole day.
+            if direction == "up":
+                neighbour_query = (
+                    select(Workout)
+                    .where(Workout.date == date, Workout.order < workout.order)
+                    .order_by(Workout.order.desc())
+                )
+            else:
+                neighbour_query = (
+                    select(Workout)
+                    .where(Workout.date == date, Workout.order > workout.order)
+                    .order_by(Workout.order.asc())
+                )
+            neighbour = session.execute(neighbour_query.limit(1)).scalar_one_or_none()
+            if not neighbour:
                 return False
 
-            swap_index = workout_index - 1 if direction == "up" else workout_index + 1
-
-            workouts[workout_index].order, workouts[swap_index].order = (
-                workouts[swap_index].order,
-                workouts[workout_index].order,
-            )
+            workout.order, neighbour.order = neighbour.order, workout.order
             session.commit()
             return True
 
@@ -246,14 +302,21 @@ class WorkoutRepository:
             return False
 
         with SessionLocal() as session:
-            workouts = session.execute(
-                select(Workout).where(Workout.id.in_(workout_ids))
-            ).scalars().all()
+            current_orders = dict(
+                session.execute(
+                    select(Workout.id, Workout.order).where(Workout.id.in_(workout_ids))
+                ).all()
+            )
 
-            workout_map = {workout.id: workout for workout in workouts}
-            for order, doc_id in enumerate(workout_ids, start=1):
-                if doc_id in workout_map:
-                    workout_map[doc_id].order = order
+            # Only rewrite rows whose position actually changed; a drag-and-drop
+            # usually moves one item and shifts a few neighbours.
+            changes = [
+                {"id": doc_id, "order": order}
+                for order, doc_id in enumerate(workout_ids, start=1)
+                if doc_id in current_orders and current_orders[doc_id] != order
+            ]
+            if changes:
+                session.execute(update(Workout), changes)
 
             session.commit()
             return True
@@ -267,10 +330,7 @@ class WorkoutRepository:
             if not source_workouts:
                 return 0
 
-            target_count = session.execute(
-                select(func.count()).select_from(Workout).where(Workout.date == target_date)
-            ).scalar_one()
-            starting_order = target_count + 1
+            starting_order = self._next_order(session, target_date)
 
             now = get_current_datetime()
             for i, workout in enumerate(source_workouts):
@@ -292,11 +352,8 @@ class WorkoutRepository:
             if not source_workouts:
                 return 0
 
-            # Get target date's max order
-            target_count = session.execute(
-                select(func.count()).select_from(Workout).where(Workout.date == target_date)
-            ).scalar_one()
-            starting_order = target_count + 1
+            # Get target date's next free position
+            starting_order = self._next_order(session, target_date)
 
             # Create copies
             now = get_current_datetime()
@@ -324,12 +381,16 @@ class WorkoutRepository:
 
     def get_workout_counts_by_date(self, year: int, month: int) -> dict[str, int]:
         """Get workout counts grouped by date for a specific month."""
-        pattern = f"{year}-{month:02d}-%"
+        # A half-open range on the ISO date string is served by the date index;
+        # LIKE is case-insensitive in SQLite and so forced a full table scan.
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        start = f"{year:04d}-{month:02d}-01"
+        end = f"{next_year:04d}-{next_month:02d}-01"
 
         with SessionLocal() as session:
             rows = session.execute(
                 select(Workout.date, func.count())
-                .where(Workout.date.like(pattern))
+                .where(Workout.date >= start, Workout.date < end)
                 .group_by(Workout.date)
             ).all()
 
@@ -341,8 +402,68 @@ class WorkoutRepository:
             workouts = session.execute(
                 select(Workout)
                 .join(Exercise)
-                .options(selectinload(Workout.exercise), selectinload(Workout.category))
+                .options(joinedload(Workout.exercise), joinedload(Workout.category))
                 .where(Exercise.name == exercise)
                 .order_by(Workout.date.asc())
             ).scalars().all()
             return [self._serialize(workout) for workout in workouts]
+
+    def get_sets_by_exercises(self, exercises: list[str]) -> dict[str, list[tuple]]:
+        """Get (weight, reps) for every set of several exercises in one query.
+
+        Returns a dict mapping exercise name to its sets in date order. Exercises
+        without history are omitted.
+        """
+        if not exercises:
+            return {}
+
+        with SessionLocal() as session:
+            rows = session.execute(
+                select(Exercise.name, Workout.weight, Workout.reps)
+                .join(Exercise, Workout.exercise_id == Exercise.id)
+                .where(Exercise.name.in_(exercises))
+                .order_by(Workout.date.asc(), Workout.id.asc())
+            ).all()
+
+        sets: dict[str, list[tuple]] = {}
+        for name, weight, reps in rows:
+            sets.setdefault(name, []).append((weight, reps))
+        return sets
+
+    def get_progression_sets(self, exercise: str, limit: Optional[int] = None) -> list[tuple]:
+        """Get weighted sets for an exercise as (date, weight, weight_unit, reps, comment).
+
+        A narrow projection for progression charts, which need none of the other
+        workout columns or relationships. Sets are in date order. With ``limit``,
+        only sets from the most recent ``limit`` training dates are returned.
+        """
+        stmt = (
+            select(
+                Workout.date,
+                Workout.weight,
+                Workout.weight_unit,
+                Workout.reps,
+                Workout.comment,
+            )
+            .join(Exercise, Workout.exercise_id == Exercise.id)
+            .where(Exercise.name == exercise)
+            .where(Workout.weight.is_not(None))
+        )
+        if limit is not None:
+            recent_dates = (
+                select(Workout.date)
+                .join(Exercise, Workout.exercise_id == Exercise.id)
+                .where(Exercise.name == exercise)
+                .where(Workout.weight.is_not(None))
+                .distinct()
+                .order_by(Workout.date.desc())
+                .limit(limit)
+            )
+            stmt = stmt.where(Workout.date.in_(recent_dates.scalar_subquery()))
+
+        with SessionLocal() as session:
+            rows = session.execute(
+                stmt.order_by(Workout.date.asc(), Workout.id.asc())
+            ).all()
+
+        return [tuple(row) for row in rows]
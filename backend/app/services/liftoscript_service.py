@@ -144,9 +144,12 @@ class LiftoscriptParser:
         self,
         weight_str: str,
         exercise_name: str,
-        cycle_num: int,
-    ) -> tuple[float | None, str]:
-        """Parse weight string and return (weight_lbs, unit)."""
+    ) -> tuple[float | None, float | None, str]:
+        """Parse weight string and return (weight_lbs, lp_increment_lbs, unit).
+
+        The increment is None for fixed weights. For linear progression the
+        weight is the unrounded starting weight; see _weight_for_cycle.
+        """
         weight_str = weight_str.strip()
 
         percent_match = self.WEIGHT_PERCENT_PATTERN.search(weight_str)
@@ -156,7 +159,7 @@ class LiftoscriptParser:
                 self._validate_required_comments(exercise_name, True, False)
             base_max = self.required_1rms.get(exercise_name, 0)
             weight = base_max * (percent / 100)
-            return self._round_to_nearest_5(weight), "lbs"
+            return self._round_to_nearest_5(weight), None, "lbs"
 
         progress_match = self.PROGRESS_LP_PATTERN.search(weight_str)
         if progress_match:
@@ -167,9 +170,7 @@ class LiftoscriptParser:
             if exercise_name not in self.required_sw:
                 self._validate_required_comments(exercise_name, False, True)
             base_weight = self.required_sw.get(exercise_name, 0)
-            total_increment = increment * cycle_num
-            weight = base_weight + total_increment
-            return self._round_to_nearest_5(weight), "lbs"
+            return base_weight, increment, "lbs"
 
         absolute_match = self.WEIGHT_ABSOLUTE_PATTERN.search(weight_str)
         if absolute_match:
@@ -177,9 +178,17 @@ class LiftoscriptParser:
             unit = absolute_match.group(2)
             if unit == "kg":
                 value = self._convert_kg_to_lbs(value)
-            return round(value), "lbs"
+            return round(value), None, "lbs"
+
+        return None, None, "lbs"
 
-        return None, "lbs"
+    def _weight_for_cycle(
+        self, weight: float | None, increment: float | None, cycle_num: int
+    ) -> float | None:
+        """Resolve a parsed weight for a given cycle, applying linear progression."""
+        if increment is None:
+            return weight
+        return self._round_to_nearest_5(weight + increment * cycle_num)
 
     def _parse_sets_reps(self, sets_reps_str: str) -> tuple[int, int, bool]:
         """Parse sets and reps string. Returns (sets, reps, is_amrap)."""
@@ -191,33 +200,26 @@ class LiftoscriptParser:
         is_amrap = "+" in sets_reps_str
         return sets, reps, is_amrap
 
-    def _parse_script(
-        self, lines: list[str], cycle_num: int, session_offset: int
-    ) -> tuple[list[UpcomingWorkoutCreate], int]:
-        """Parse the full script and return workouts."""
-        workouts = []
-        current_session = 0
+    def _compile_script(self, lines: list[str]) -> tuple[list[tuple], int]:
+        """Parse the script once into cycle-independent set entries.
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        Returns (entries, session_count) where each entry is
+        (session, exercise, category, sets, reps, comment, weight, increment, unit).
+        """
+        entries = []
+        current_session = 0
 
-            if not line:
-                i += 1
-                continue
+        for raw_line in lines:
+            line = raw_line.strip()
 
-            if line.startswith("//"):
-                i += 1
+            if not line or line.startswith("//"):
                 continue
 
-            day_match = self.DAY_HEADER_PATTERN.match(line)
-            if day_match:
+            if self.DAY_HEADER_PATTERN.match(line):
                 current_session += 1
-                i += 1
                 continue
 
             if "/" not in line:
-                i += 1
                 continue
 
             parts = [p.strip() for p in line.split("/")]
@@ -226,43 +228,66 @@ class LiftoscriptParser:
             full_spec = parts[1].strip() if len(parts) > 1 else ""
 
             if not full_spec:
-                i += 1
                 continue
 
             # Determine category from exercise name, default to "Other"
             category = EXERCISE_CATEGORIES.get(exercise_name, "Other")
 
             # Split by comma to handle multiple set specifications (e.g., "1x5 65%, 1x5 75%, 1x5+ 85%")
-            set_specs = [spec.strip() for spec in full_spec.split(",")]
-
-            for set_spec in set_specs:
+            for set_spec in (spec.strip() for spec in full_spec.split(",")):
                 if not set_spec:
                     continue
 
                 sets, reps, is_amrap = self._parse_sets_reps(set_spec)
-                weight, unit = self._parse_weight(set_spec, exercise_name, cycle_num)
-
-                comment_parts = []
-                if is_amrap:
-                    comment_parts.append("AMRAP")
+                weight, increment, unit = self._parse_weight(set_spec, exercise_name)
+                comment = "AMRAP" if is_amrap else None
+
+                entries.append(
+                    (
+                        current_session,
+                        exercise_name,
+                        category,
+                        sets,
+                        reps,
+                        comment,
+                        weight,
+                        increment,
+                        unit,
+                    )
+                )
 
-                comment = ", ".join(comment_parts) if comment_parts else None
+        return entries, current_session
 
-                for _ in range(sets):
-                    workout = UpcomingWorkoutCreate(
-                        session=session_offset + current_session,
+    def _expand_cycle(
+        self, entries: list[tuple], cycle_num: int, session_offset: int
+    ) -> list[UpcomingWorkoutCreate]:
+        """Materialize compiled entries into workouts for one cycle."""
+        workouts = []
+        for (
+            session,
+            exercise_name,
+            category,
+            sets,
+            reps,
+            comment,
+            weight,
+            increment,
+            unit,
+        ) in entries:
+            cycle_weight = self._weight_for_cycle(weight, increment, cycle_num)
+            for _ in range(sets):
+                workouts.append(
+                    UpcomingWorkoutCreate(
+                        session=session_offset + session,
                         exercise=exercise_name,
                         category=category,
-                        weight=weight,
+                        weight=cycle_weight,
                         weight_unit=unit,
                         reps=reps,
                         comment=comment,
                     )
-                    workouts.append(workout)
-
-            i += 1
-
-        return workouts, current_session
+                )
+        return workouts
 
     def parse(
         self,
@@ -283,14 +308,17 @@ class LiftoscriptParser:
         """
         self._parse_required_comments(script)
 
-        lines = script.strip().split("\n")
-        all_workouts = []
-        sessions_per_cycle = 0
+        if num_cycles < 1:
+            return []
+
+        # Every cycle repeats the same lines; only linear progression weights
+        # depend on the cycle, so parse once and expand per cycle.
+        entries, sessions_per_cycle = self._compile_script(script.strip().split("\n"))
 
+        all_workouts = []
         for cycle in range(num_cycles):
-            session_offset = cycle * sessions_per_cycle
-            cycle_workouts, sessions_in_cycle = self._parse_script(lines, cycle, session_offset)
-            sessions_per_cycle = max(sessions_in_cycle, sessions_per_cycle)
-            all_workouts.extend(cycle_workouts)
+            all_workouts.extend(
+                self._expand_cycle(entries, cycle, cycle * sessions_per_cycle)
+            )
 
         return all_workouts
@@ -2,18 +2,26 @@
 
 import json
 import logging
-from typing import Callable, Optional
+import queue
+import threading
 from datetime import datetime
+from typing import Callable, Optional
 
 import paho.mqtt.client as mqtt
 
-from app.repositories.body_comp_repo import BodyCompositionRepository
 from app.models.body_composition import BodyCompositionCreate
-from app.utils.date_helpers import PACIFIC_TZ
+from app.repositories.body_comp_repo import BodyCompositionRepository
+from app.utils.date_helpers import PACIFIC_TZ, parse_iso_timestamp
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sentinel telling the writer thread to exit
+_STOP = object()
+
+# Seconds stop() and start() wait for a finishing writer before giving up on it
+WRITER_STOP_TIMEOUT = 5
+
 
 class MQTTService:
     """MQTT client service for body composition data."""
@@ -37,6 +45,11 @@ class MQTTService:
         self.on_measurement_callback = on_measurement_callback
         self.body_comp_repo = BodyCompositionRepository()
 
+        # Measurements parsed on paho's thread, saved by the writer thread
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stopping = False
+
         # Create MQTT client
         self.client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
         self.client.on_connect = self._on_connect
@@ -70,69 +83,133 @@ class MQTTService:
         logger.warning(f"Disconnected from MQTT broker: {reason_code}")
         self.is_connected = False
 
+    def _build_measurement(self, payload: dict) -> Optional[BodyCompositionCreate]:
+        """Convert an openScale payload into a measurement, or None if incomplete."""
+        date_str = payload.get("date")
+        weight = payload.get("weight")
+
+        if not date_str or not weight:
+            logger.warning(f"Missing required fields in payload: {payload}")
+            return None
+
+        # Parse ISO 8601 timestamp
+        try:
+            dt = parse_iso_timestamp(date_str)
+        except ValueError:
+            dt = datetime.fromisoformat(date_str.replace("T", " ").split("-")[0])
+            dt = dt.replace(tzinfo=PACIFIC_TZ)
+
+        return BodyCompositionCreate(
+            timestamp=dt,
+            date=dt.date().isoformat(),
+            weight=weight,
+            weight_unit="kg",
+            body_fat_pct=payload.get("fat"),
+            muscle_mass=payload.get("muscle"),
+            bmi=payload.get("bmi"),
+            water_pct=payload.get("water"),
+            bone_mass=payload.get("bone"),
+            visceral_fat=payload.get("visceralFat"),
+            metabolic_age=payload.get("metabolicAge"),
+            protein_pct=payload.get("protein"),
+        )
+
     def _on_message(self, client, userdata, msg):
-        """Callback when a message is received."""
+        """Callback when a message is received.
+
+        Runs on paho's network thread, so it only parses the payload and queues
+        the measurements; the writer thread does the database work.
+        """
         try:
             payload = json.loads(msg.payload.decode())
             logger.info(f"Received message on {msg.topic}: {payload}")
+            topic_type = msg.topic.split("/")[-1]
 
-            date_str = payload.get("date")
-            weight = payload.get("weight")
+            # Bulk sync from the app arrives as a list of measurements
+            items = payload if isinstance(payload, list) else [payload]
+            items = [item for item in items if isinstance(item, dict)]
+            measurements = [m for m in map(self._build_measurement, items) if m]
+            if measurements:
+                self._write_queue.put((measurements, topic_type))
 
-            if not date_str or not weight:
-                logger.warning(f"Missing required fields in payload: {payload}")
-                return
+            # Call callback if provided
+            if self.on_measurement_callback:
+                for item in items:
+                    self.on_measurement_callback(item)
 
-            # Parse ISO 8601 timestamp
-            try:
-                dt = datetime.fromisoformat(date_str)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=PACIFIC_TZ)
-                else:
-                    dt = dt.astimezone(PACIFIC_TZ)
-            except ValueError:
-                dt = datetime.fromisoformat(date_str.replace("T", " ").split("-")[0])
-                dt = dt.replace(tzinfo=PACIFIC_TZ)
-
-            # Create measurement
-            measurement = BodyCompositionCreate(
-                timestamp=dt,
-                date=dt.date().isoformat(),
-                weight=weight,
-                weight_unit="kg",
-                body_fat_pct=payload.get("fat"),
-                muscle_mass=payload.get("muscle"),
-                bmi=payload.get("bmi"),
-                water_pct=payload.get("water"),
-                bone_mass=payload.get("bone"),
-                visceral_fat=payload.get("visceralFat"),
-                metabolic_age=payload.get("metabolicAge"),
-                protein_pct=payload.get("protein"),
-            )
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON payload: {e}")
+        except Exception as e:
+            logger.error(f"Error processing message: {e}", exc_info=True)
 
-            # Save to database
-            saved = self.body_comp_repo.create(measurement)
+    def _write_batch(self, batch: list[tuple[list[BodyCompositionCreate], str]]) -> None:
+        """Save queued measurements, coalescing everything queued into one insert."""
+        measurements = [m for queued, _ in batch for m in queued]
+        topic_types = ", ".join(sorted({topic_type for _, topic_type in batch}))
 
-            topic_type = msg.topic.split("/")[-1]
-            if saved:
+        if len(measurements) == 1:
+            measurement = measurements[0]
+            if self.body_comp_repo.create(measurement):
                 logger.info(
-                    f"Saved {topic_type} measurement: {weight} kg "
-                    f"(fat: {payload.get('fat')}%, muscle: {payload.get('muscle')}%)"
+                    f"Saved {topic_types} measurement: {measurement.weight} kg "
+                    f"(fat: {measurement.body_fat_pct}%, muscle: {measurement.muscle_mass}%)"
                 )
             else:
-                logger.info(f"Skipped duplicate {topic_type} measurement: {weight} kg")
+                logger.info(
+                    f"Skipped duplicate {topic_types} measurement: {measurement.weight} kg"
+                )
+            return
 
-            # Call callback if provided
-            if self.on_measurement_callback:
-                self.on_measurement_callback(payload)
+        saved = self.body_comp_repo.create_many(measurements)
+        logger.info(f"Saved {len(saved)} of {len(measurements)} {topic_types} measurements")
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON payload: {e}")
-        except Exception as e:
-            logger.error(f"Error processing message: {e}", exc_info=True)
+    def _drain_queue(self, batch: Optional[list] = None) -> int:
+        """Write everything currently queued (after any items already taken off it).
+
+        Returns the number of messages written.
+        """
+        batch = list(batch or [])
+        while True:
+            try:
+                item = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._write_queue.put(item)
+                break
+            batch.append(item)
+
+        if batch:
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Error saving measurements: {e}", exc_info=True)
+        return len(batch)
+
+    def _writer_loop(self):
+        """Block for queued measurements and write them until stopped."""
+        while True:
+            item = self._write_queue.get()
+            if item is _STOP:
+                break
+            self._drain_queue([item])
 
     def start(self):
         """Start the MQTT client and connect to broker."""
+        if self._writer_stopping:
+            # The previous writer takes the queued stop marker once its
+            # current batch is saved; a new writer starts after it exits.
+            self._writer_thread.join(timeout=WRITER_STOP_TIMEOUT)
+            if self._writer_thread.is_alive():
+                logger.error("MQTT writer from the last stop is still saving; not starting")
+                return
+            self._writer_stopping = False
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="mqtt-body-comp-writer", daemon=True
+            )
+            self._writer_thread.start()
+
         try:
             logger.info(
                 f"Connecting to MQTT broker at {self.broker_host}:{self.broker_port}..."
@@ -144,10 +221,23 @@ class MQTTService:
             logger.error(f"Failed to start MQTT service: {e}")
 
     def stop(self):
-        """Stop the MQTT client."""
+        """Stop the MQTT client, writing any measurements still queued."""
         logger.info("Stopping MQTT service...")
         self.client.loop_stop()
         self.client.disconnect()
+        if self._writer_thread is not None:
+            self._write_queue.put(_STOP)
+            self._writer_thread.join(timeout=WRITER_STOP_TIMEOUT)
+            if self._writer_thread.is_alive():
+                # Still mid-write; it owns the queue up to the stop marker and
+                # exits on its own. Keep the reference so start() waits for it
+                # instead of running a second writer alongside it.
+                logger.warning("MQTT writer still saving measurements; leaving it to finish")
+                self._writer_stopping = True
+            else:
+                self._writer_thread = None
+        if self._writer_thread is None:
+            self._drain_queue()
         logger.info("MQTT service stopped")
 
     def get_status(self) -> dict:
@@ -1,13 +1,21 @@
 """Progression calculation service."""
 
-from datetime import timedelta
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional
 
 from app.repositories.workout_repo import WorkoutRepository
 from app.repositories.upcoming_repo import UpcomingWorkoutRepository
 from app.utils.calculations import calculate_estimated_1rm
 from app.utils.date_helpers import get_current_date, PACIFIC_TZ
-from datetime import datetime
+
+# Lifts shown together on the main lifts overview
+MAIN_LIFTS = (
+    'Flat Barbell Bench Press',
+    'Barbell Squat',
+    'Deadlift',
+)
 
 
 class ProgressionService:
@@ -16,87 +24,103 @@ class ProgressionService:
     def __init__(self):
         self.workout_repo = WorkoutRepository()
         self.upcoming_repo = UpcomingWorkoutRepository()
+        self._all_upcoming: Optional[list[dict]] = None
+        self._upcoming_sessions: Optional[dict[int, list[dict]]] = None
+        self._session_dates: dict[date, dict[int, str]] = {}
+
+    def _get_all_upcoming(self) -> list[dict]:
+        """Load all upcoming workouts once per service instance.
 
-    def get_progression_data(self, exercise: str, include_upcoming: bool = True) -> dict:
+        A service lives for one request, so this is shared by every exercise
+        projected in that request (e.g. the three main lifts).
+        """
+        if self._all_upcoming is None:
+            self._all_upcoming = self.upcoming_repo.get_all()
+        return self._all_upcoming
+
+    def _get_upcoming_sessions(self) -> dict[int, list[dict]]:
+        """Group upcoming workouts by session number, in session order."""
+        if self._upcoming_sessions is None:
+            # get_all already orders by session, so each group is one contiguous run
+            self._upcoming_sessions = {
+                num: list(workouts)
+                for num, workouts in groupby(self._get_all_upcoming(), key=itemgetter('session'))
+            }
+        return self._upcoming_sessions
+
+    def _get_session_dates(self, start_date: date) -> dict[int, str]:
+        """Map every upcoming session to a projected date, two days apart.
+
+        The mapping only depends on the start date, which the main lifts usually
+        share, so it is built once per start date rather than once per exercise.
+        """
+        if start_date not in self._session_dates:
+            self._session_dates[start_date] = {
+                session_num: (start_date + timedelta(days=2 * i)).isoformat()
+                for i, session_num in enumerate(self._get_upcoming_sessions())
+            }
+        return self._session_dates[start_date]
+
+    def get_progression_data(
+        self, exercise: str, include_upcoming: bool = True, limit: Optional[int] = None
+    ) -> dict:
         """
         Get progression data for an exercise.
 
         Args:
             exercise: Exercise name
             include_upcoming: Whether to include upcoming workouts
+            limit: Only include the most recent N training dates in history
 
         Returns:
             Dict with 'historical' and 'upcoming' progression data
         """
-        # Get historical workouts
-        historical_workouts = self.workout_repo.get_by_exercise(exercise)
-        historical_workouts = [
-            w for w in historical_workouts
-            if w.get('weight') is not None
-        ]
-
-        # Group by date and get best set per date
-        historical_by_date = {}
-        for workout in historical_workouts:
-            date = workout.get('date', '')
-            weight = workout.get('weight')
-            reps = workout.get('reps')
-
-            if not weight or not reps:
+        # Get historical sets (weighted only)
+        historical_sets = self.workout_repo.get_progression_sets(exercise, limit=limit)
+
+        # Rows arrive ordered by date, so one groupby pass picks the best set per
+        # date and the result is already sorted.
+        historical = []
+        for workout_date, date_sets in groupby(historical_sets, key=itemgetter(0)):
+            scored = [
+                (calculate_estimated_1rm(weight, reps), weight, weight_unit, reps, comment)
+                for _, weight, weight_unit, reps, comment in date_sets
+                if weight and reps
+            ]
+            if not scored:
                 continue
 
-            estimated_1rm = calculate_estimated_1rm(weight, reps)
-
-            if (date not in historical_by_date or
-                estimated_1rm > historical_by_date[date]['estimated_1rm']):
-                historical_by_date[date] = {
-                    'date': date,
-                    'weight': weight,
-                    'weight_unit': workout.get('weight_unit', 'lbs'),
-                    'reps': reps,
-                    'estimated_1rm': estimated_1rm,
-                    'comment': workout.get('comment'),
-                }
-
-        historical = list(historical_by_date.values())
-        historical.sort(key=lambda x: x['date'])
+            estimated_1rm, weight, weight_unit, reps, comment = max(scored, key=itemgetter(0))
+            historical.append({
+                'date': workout_date,
+                'weight': weight,
+                'weight_unit': weight_unit,
+                'reps': reps,
+                'estimated_1rm': estimated_1rm,
+                'comment': comment,
+            })
 
         upcoming = []
 
         if include_upcoming:
-            # Get ALL upcoming workouts to build session-to-date mapping
-            all_upcoming = self.upcoming_repo.get_all()
-
-            # Group by session
-            sessions = {}
-            for workout in all_upcoming:
-                session = workout.get('session')
-                if session not in sessions:
-                    sessions[session] = []
-                sessions[session].append(workout)
+            # ALL upcoming sessions take part in the session-to-date mapping
+            sessions = self._get_upcoming_sessions()
 
             # Determine start date for projections
             if historical:
                 last_date_str = historical[-1]['date']
                 try:
-                    last_date = datetime.fromisoformat(last_date_str).date()
-                    start_date = last_date + timedelta(days=2)
+                    # Dates are stored as YYYY-MM-DD, so parse straight to a date
+                    start_date = date.fromisoformat(last_date_str) + timedelta(days=2)
                 except (ValueError, TypeError):
                     start_date = datetime.now(PACIFIC_TZ).date()
             else:
                 start_date = datetime.now(PACIFIC_TZ).date()
 
-            # Map ALL sessions to dates
-            session_to_date = {}
-            current_date = start_date
-            for session_num in sorted(sessions.keys()):
-                session_to_date[session_num] = current_date.isoformat()
-                current_date += timedelta(days=2)
+            session_to_date = self._get_session_dates(start_date)
 
             # Filter for the selected exercise and build upcoming list
-            for session_num in sorted(sessions.keys()):
-                session_workouts = sessions[session_num]
-
+            for session_num, session_workouts in sessions.items():
                 # Filter for the selected exercise
                 exercise_workouts = [
                     w for w in session_workouts
@@ -144,14 +168,8 @@ class ProgressionService:
 
     def get_main_lifts_progression(self) -> dict:
         """Get progression data for the main 3 lifts."""
-        main_lifts = [
-            'Flat Barbell Bench Press',
-            'Barbell Squat',
-            'Deadlift',
-        ]
-
         result = {}
-        for lift in main_lifts:
+        for lift in MAIN_LIFTS:
             result[lift] = self.get_progression_data(lift)
 
         return result
@@ -22,43 +22,44 @@ class WendlerService:
     def __init__(self):
         self.workout_repo = WorkoutRepository()
 
-    def get_latest_estimated_1rm(self, exercise: str) -> float | None:
-        """Get the latest estimated 1RM for an exercise based on historical data.
-
-        Args:
-            exercise: Exercise name
+    def _best_recent_1rm(self, sets: list[tuple]) -> float | None:
+        """Best estimated 1RM over the 10 most recent (weight, reps) sets."""
+        sets = [(weight, reps) for weight, reps in sets if weight and reps]
 
-        Returns:
-            Estimated 1RM value or None if no data
-        """
-        workouts = self.workout_repo.get_by_exercise(exercise)
-        workouts = [w for w in workouts if w.get("weight") and w.get("reps")]
-
-        if not workouts:
+        if not sets:
             return None
 
-        # Get the most recent workouts and find best 1RM
-        recent_workouts = workouts[-10:]
-
         best_1rm = 0
-        for workout in recent_workouts:
-            weight = workout.get("weight", 0)
-            reps = workout.get("reps", 0)
+        for weight, reps in sets[-10:]:
             estimated = calculate_estimated_1rm(weight, reps)
             if estimated > best_1rm:
                 best_1rm = estimated
 
         return best_1rm if best_1rm > 0 else None
 
+    def get_latest_estimated_1rm(self, exercise: str) -> float | None:
+        """Get the latest estimated 1RM for an exercise based on historical data.
+
+        Args:
+            exercise: Exercise name
+
+        Returns:
+            Estimated 1RM value or None if no data
+        """
+        sets = self.workout_repo.get_sets_by_exercises([exercise])
+        return self._best_recent_1rm(sets.get(exercise, []))
+
     def get_current_maxes(self) -> dict[str, float]:
         """Get current estimated 1RM for all main lifts.
 
         Returns:
             Dict mapping exercise name to estimated 1RM
         """
+        sets_by_exercise = self.workout_repo.get_sets_by_exercises(list(self.MAIN_LIFTS))
+
         maxes = {}
         for exercise in self.MAIN_LIFTS.keys():
-            estimated = self.get_latest_estimated_1rm(exercise)
+            estimated = self._best_recent_1rm(sets_by_exercise.get(exercise, []))
             if estimated:
                 maxes[exercise] = estimated
         return maxes
@@ -1,18 +1,26 @@
 """Utility functions for calculations."""
 
+from functools import lru_cache
 
-def calculate_estimated_1rm(weight: float, reps: int) -> float:
+
+@lru_cache(maxsize=4096)
+def calculate_estimated_1rm(weight: float, reps: int | str) -> float:
     """
     Calculate estimated 1RM using the formula: (0.033 × reps × weight) + weight
 
+    Results are memoized, since the same (weight, reps) pairs recur across a
+    lift's history.
+
     Args:
         weight: Weight lifted
-        reps: Number of reps
+        reps: Number of reps; AMRAP strings such as "5+" count as 5
 
     Returns:
         Estimated 1RM value
     """
     try:
+        if isinstance(reps, str):
+            reps = reps.rstrip("+")
         reps_num = int(reps)
         weight_num = float(weight)
 
@@ -27,6 +35,9 @@ def calculate_moving_average(values: list[float | None], window: int = 7) -> lis
     """
     Calculate moving average with given window size.
 
+    Keeps a running sum and count of the valid values in the window, so each
+    value is added and removed once rather than re-summing every window.
+
     Args:
         values: List of values (None values are skipped)
         window: Window size for moving average
@@ -35,14 +46,20 @@ def calculate_moving_average(values: list[float | None], window: int = 7) -> lis
         List of moving average values
     """
     ma = []
-    for i in range(len(values)):
-        if values[i] is None:
+    total = 0.0
+    count = 0
+    for i, value in enumerate(values):
+        if value is not None:
+            total += value
+            count += 1
+        if i >= window:
+            dropped = values[i - window]
+            if dropped is not None:
+                total -= dropped
+                count -= 1
+
+        if value is None:
             ma.append(None)
         else:
-            # Get window of valid values
-            window_values = [v for v in values[max(0, i - window + 1) : i + 1] if v is not None]
-            if window_values:
-                ma.append(round(sum(window_values) / len(window_values), 2))
-            else:
-                ma.append(None)
+            ma.append(round(total / count, 2))
     return ma
@@ -1,6 +1,7 @@
 """Date and time utility functions."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
@@ -16,8 +17,13 @@ def get_current_date() -> str:
     return get_current_datetime().date().isoformat()
 
 
+@lru_cache(maxsize=4096)
 def parse_iso_timestamp(timestamp_str: str) -> datetime:
-    """Parse ISO 8601 timestamp string to datetime in Pacific timezone."""
+    """Parse ISO 8601 timestamp string to datetime in Pacific timezone.
+
+    Cached because bulk scale syncs resend the same timestamps every time;
+    datetimes are immutable, so sharing results is safe.
+    """
     dt = datetime.fromisoformat(timestamp_str)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=PACIFIC_TZ)
@@ -43,7 +49,7 @@ def project_future_dates(start_date: str, num_sessions: int, days_between: int =
     Returns:
         List of dates in YYYY-MM-DD format
     """
-    current_date = datetime.fromisoformat(start_date).date()
+    current_date = date.fromisoformat(start_date)
     dates = []
 
     for _ in range(num_sessions):
@@ -0,0 +1,44 @@
+"""HTTP conditional request utility functions."""
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+
+def compute_etag(content: Any) -> str:
+    """Compute a weak ETag from the JSON form of a response body."""
+    body = json.dumps(jsonable_encoder(content), sort_keys=True, separators=(",", ":"))
+    return f'W/"{hashlib.blake2b(body.encode(), digest_size=16).hexdigest()}"'
+
+
+def not_modified_response(
+    request: Request, response: Response, content: Any
+) -> Optional[Response]:
+    """Handle If-None-Match for a GET endpoint.
+
+    Returns a 304 response when the client already holds this content.
+    Otherwise sets the ETag on the endpoint's response and returns None, and
+    the endpoint returns its content as usual. Clients are asked to
+    revalidate every time, so the data is never served stale; a match just
+    skips sending the body again.
+
+    Args:
+        request: Incoming request
+        response: Response the endpoint will return
+        content: Data the endpoint is about to return
+
+    Returns:
+        A 304 response, or None when the content should be sent
+    """
+    etag = compute_etag(content)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Migration to add the (exercise_id, date) index to the workouts table."""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+# Default data directory
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+INDEX_NAME = "ix_workouts_exercise_date"
+
+
+def migrate(db_path: Path) -> None:
+    """Create the per-exercise history index if it doesn't exist."""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    # Check if index already exists
+    cursor.execute("PRAGMA index_list(workouts)")
+    indexes = [index[1] for index in cursor.fetchall()]
+
+    if INDEX_NAME in indexes:
+        print(f"Index '{INDEX_NAME}' already exists on workouts table.")
+        conn.close()
+        return
+
+    # Progression and Wendler lookups filter by exercise and read in date order
+    cursor.execute(f"CREATE INDEX {INDEX_NAME} ON workouts (exercise_id, date)")
+    conn.commit()
+    print(f"Successfully added '{INDEX_NAME}' index to workouts table.")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    db_path = DATA_DIR / "helf.db"
+
+    if len(sys.argv) > 1:
+        db_path = Path(sys.argv[1])
+
+    if not db_path.exists():
+        print(f"Database not found at {db_path}")
+        sys.exit(1)
+
+    migrate(db_path)
@@ -10,6 +10,8 @@ from zoneinfo import ZoneInfo
 # Add backend directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import insert
+
 from app.config import settings
 from app.database import SessionLocal, init_db
 from app.db.models import BodyComposition, Category, Exercise, UpcomingWorkout, Workout
@@ -122,6 +124,12 @@ def main():
         category_cache: dict[str, Category] = {}
         exercise_cache: dict[str, Exercise] = {}
 
+        # Rows for the bulk tables are collected as plain dicts and inserted
+        # with one executemany per table rather than one ORM object each.
+        workout_rows: list[dict] = []
+        upcoming_rows: list[dict] = []
+        body_comp_rows: list[dict] = []
+
         # Categories
         for row in categories_table.values():
             name = row.get("name")
@@ -191,7 +199,7 @@ def main():
             if order_value is None:
                 order_value = 1
 
-            workout = Workout(
+            workout_rows.append(dict(
                 date=row.get("date"),
                 exercise_id=exercise.id,
                 category_id=category.id,
@@ -206,9 +214,7 @@ def main():
                 created_at=parse_datetime(row.get("created_at")) or datetime.now(PACIFIC_TZ),
                 updated_at=parse_datetime(row.get("updated_at")) or datetime.now(PACIFIC_TZ),
                 completed_at=parse_datetime(row.get("completed_at")),
-            )
-            session.add(workout)
-            counts["workouts"] += 1
+            ))
 
         # Upcoming workouts
         for row in upcoming_table.values():
@@ -237,7 +243,7 @@ def main():
             if reps is not None and not isinstance(reps, str):
                 reps = str(reps)
 
-            workout = UpcomingWorkout(
+            upcoming_rows.append(dict(
                 session=row.get("session") or 0,
                 exercise_id=exercise.id,
                 category_id=category.id,
@@ -249,9 +255,7 @@ def main():
                 time=row.get("time"),
                 comment=row.get("comment"),
                 created_at=parse_datetime(row.get("created_at")) or datetime.now(PACIFIC_TZ),
-            )
-            session.add(workout)
-            counts["upcoming_workouts"] += 1
+            ))
 
         # Body composition
         for row in body_comp_table.values():
@@ -260,7 +264,7 @@ def main():
             if not timestamp or weight is None:
                 continue
 
-            measurement = BodyComposition(
+            body_comp_rows.append(dict(
                 timestamp=timestamp,
                 date=row.get("date"),
                 weight=weight,
@@ -274,9 +278,16 @@ def main():
                 metabolic_age=row.get("metabolic_age"),
                 protein_pct=row.get("protein_pct"),
                 created_at=parse_datetime(row.get("created_at")) or timestamp,
-            )
-            session.add(measurement)
-            counts["body_composition"] += 1
+            ))
+
+        for model, rows, key in (
+            (Workout, workout_rows, "workouts"),
+            (UpcomingWorkout, upcoming_rows, "upcoming_workouts"),
+            (BodyComposition, body_comp_rows, "body_composition"),
+        ):
+            if rows:
+                session.execute(insert(model), rows)
+            counts[key] = len(rows)
 
         session.commit()
 
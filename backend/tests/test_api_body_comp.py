@@ -50,7 +50,15 @@ def test_body_comp_trends_and_stats(client):
     trends = client.get("/api/body-composition/trends?days=30")
     assert trends.status_code == 200
     assert len(trends.json()["dates"]) == 2
+    assert trends.json()["weights"] == [80, 81]
 
     stats = client.get("/api/body-composition/stats")
     assert stats.status_code == 200
     assert stats.json()["total_measurements"] == 2
+
+
+def test_body_comp_trends_empty(client):
+    trends = client.get("/api/body-composition/trends?days=7")
+    assert trends.status_code == 200
+    assert trends.json()["dates"] == []
+    assert trends.json()["water_pcts"] == []
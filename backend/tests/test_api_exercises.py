@@ -25,3 +25,32 @@ def test_exercises_crud_and_categories(client):
 def test_exercise_not_found_returns_404(client):
     response = client.get("/api/exercises/Unknown")
     assert response.status_code == 404
+
+
+def test_seed_exercises_is_idempotent(client):
+    first = client.post("/api/exercises/seed")
+    assert first.status_code == 200
+    assert first.json()["categories_created"] == 6
+    assert first.json()["exercises_created"] == 16
+
+    second = client.post("/api/exercises/seed")
+    assert second.json()["exercises_created"] == 0
+    assert second.json()["message"] == "All preset exercises already exist"
+
+
+def test_exercises_list_supports_conditional_get(client):
+    client.post("/api/exercises/", json={"name": "Bench", "category": "Push"})
+
+    first = client.get("/api/exercises/")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    cached = client.get("/api/exercises/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    client.post("/api/exercises/", json={"name": "Squat", "category": "Legs"})
+    changed = client.get("/api/exercises/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()) == 2
@@ -41,3 +41,24 @@ def test_progression_main_lifts_endpoint(client):
     response = client.get("/api/progression/")
     assert response.status_code == 200
     assert "Barbell Squat" in response.json()
+
+
+def test_progression_limit_returns_most_recent_dates(client):
+    for day, weight in (("2024-01-01", 100), ("2024-01-03", 105), ("2024-01-05", 110)):
+        client.post(
+            "/api/workouts/",
+            json={
+                "date": day,
+                "exercise": "Bench",
+                "category": "Push",
+                "weight": weight,
+                "reps": 5,
+            },
+        )
+
+    response = client.get("/api/progression/Bench?include_upcoming=false&limit=2")
+    assert response.status_code == 200
+    assert [entry["date"] for entry in response.json()["historical"]] == [
+        "2024-01-03",
+        "2024-01-05",
+    ]
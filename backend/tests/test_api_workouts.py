@@ -58,3 +58,23 @@ def test_workouts_get_by_date_and_move(client):
 def test_workouts_bulk_reorder_handles_empty(client):
     response = client.patch("/api/workouts/reorder", json={"workout_ids": []})
     assert response.status_code == 400
+
+
+def test_workouts_bulk_create(client):
+    response = client.post(
+        "/api/workouts/bulk",
+        json={
+            "workouts": [
+                {"date": "2024-01-03", "exercise": "Row", "category": "Pull", "reps": 8},
+                {"date": "2024-01-03", "exercise": "Row", "category": "Pull", "reps": 6},
+            ]
+        },
+    )
+    assert response.status_code == 201
+    assert [w["order"] for w in response.json()] == [1, 2]
+
+    by_date = client.get("/api/workouts/?date=2024-01-03")
+    assert len(by_date.json()) == 2
+    assert [w["created_at"] for w in response.json()] == [
+        w["created_at"] for w in by_date.json()
+    ]
@@ -0,0 +1,17 @@
+from sqlalchemy import create_engine, event, text
+
+from app.database import SQLITE_CACHE_SIZE_KIB, SQLITE_MMAP_SIZE, set_sqlite_pragmas
+
+
+def test_set_sqlite_pragmas_configures_connection(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    try:
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # 1 == NORMAL
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert conn.execute(text("PRAGMA mmap_size")).scalar() == SQLITE_MMAP_SIZE
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -SQLITE_CACHE_SIZE_KIB
+    finally:
+        engine.dispose()
@@ -0,0 +1,40 @@
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from app.api import body_comp, exercises, progression, upcoming, workouts
+from app.main import ImmutableStaticFiles
+
+
+def test_immutable_static_files_sets_long_cache(tmp_path):
+    (tmp_path / "index-abc123.js").write_text("console.log('ok')")
+    app = FastAPI()
+    app.mount("/assets", ImmutableStaticFiles(directory=str(tmp_path)), name="assets")
+    client = TestClient(app)
+
+    response = client.get("/assets/index-abc123.js")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    missing = client.get("/assets/missing.js")
+    assert missing.status_code == 404
+    assert "cache-control" not in missing.headers
+
+
+def test_api_routes_are_registered_once():
+    for module in (workouts, exercises, progression, upcoming, body_comp):
+        routes = [
+            (route.path, method)
+            for route in module.router.routes
+            for method in route.methods
+        ]
+        assert len(routes) == len(set(routes)), module.__name__
+
+
+def test_api_routes_declare_response_models():
+    # With a response model FastAPI serializes straight to JSON bytes through
+    # Pydantic instead of jsonable_encoder + json.dumps
+    for module in (workouts, exercises, progression, upcoming, body_comp):
+        for route in module.router.routes:
+            if isinstance(route, APIRoute) and route.status_code != 204:
+                assert route.response_model is not None, (module.__name__, route.path)
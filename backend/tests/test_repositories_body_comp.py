@@ -1,7 +1,10 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
 
 from app.models.body_composition import BodyCompositionCreate
+import app.repositories.body_comp_repo as body_comp_repo
 from app.repositories.body_comp_repo import BodyCompositionRepository
 from app.utils.date_helpers import PACIFIC_TZ
 
@@ -29,6 +32,20 @@ def test_body_comp_create_rejects_duplicate_timestamp():
     assert duplicate is None
 
 
+def test_body_comp_create_returns_stored_values():
+    repo = BodyCompositionRepository()
+    created = repo.create(
+        BodyCompositionCreate(
+            timestamp=datetime(2024, 1, 1, 8, 0, tzinfo=PACIFIC_TZ),
+            date="2024-01-01",
+            weight=80,
+        )
+    )
+
+    assert created == repo.get_by_id(created["doc_id"])
+    assert created["timestamp"] == datetime(2024, 1, 1, 8, 0)
+
+
 def test_body_comp_get_latest_returns_most_recent():
     repo = BodyCompositionRepository()
     repo.create(
@@ -93,6 +110,36 @@ def test_body_comp_get_recent_filters_by_cutoff():
     assert len(recent) == 1
 
 
+def test_body_comp_get_recent_trends_returns_columns():
+    repo = BodyCompositionRepository()
+    now = datetime.now(PACIFIC_TZ)
+    for days_ago, weight in ((40, 90), (5, 80), (2, 81)):
+        repo.create(
+            BodyCompositionCreate(
+                timestamp=now - timedelta(days=days_ago),
+                date=(now - timedelta(days=days_ago)).date().isoformat(),
+                weight=weight,
+                body_fat_pct=20,
+            )
+        )
+
+    trends = repo.get_recent_trends(days=30)
+    assert trends["dates"] == [
+        (now - timedelta(days=5)).date().isoformat(),
+        (now - timedelta(days=2)).date().isoformat(),
+    ]
+    assert trends["weights"] == [80, 81]
+    assert trends["body_fat_pcts"] == [20, 20]
+    assert trends["water_pcts"] == [None, None]
+    assert repo.get_recent_trends(days=1) == {
+        "dates": [],
+        "weights": [],
+        "body_fat_pcts": [],
+        "muscle_masses": [],
+        "water_pcts": [],
+    }
+
+
 def test_body_comp_stats_calculates_changes():
     repo = BodyCompositionRepository()
     now = datetime.now(PACIFIC_TZ)
@@ -130,3 +177,164 @@ def test_body_comp_stats_calculates_changes():
     assert stats["body_fat_change"] == -3
     assert stats["muscle_mass_change"] == 3
     assert stats["weight_change"] == pytest.approx(-9.0)
+
+
+def test_body_comp_stats_reflect_writes_after_cache_warm():
+    repo = BodyCompositionRepository()
+    now = datetime.now(PACIFIC_TZ)
+    created = repo.create(
+        BodyCompositionCreate(
+            timestamp=now - timedelta(days=2),
+            date=(now - timedelta(days=2)).date().isoformat(),
+            weight=80,
+        )
+    )
+    assert repo.get_stats()["total_measurements"] == 1
+
+    repo.create(
+        BodyCompositionCreate(
+            timestamp=now - timedelta(days=1),
+            date=(now - timedelta(days=1)).date().isoformat(),
+            weight=79,
+        )
+    )
+    stats = repo.get_stats()
+    assert stats["total_measurements"] == 2
+    assert stats["latest_weight"] == 79
+
+    repo.delete(created["doc_id"])
+    assert repo.get_stats()["total_measurements"] == 1
+
+
+def test_body_comp_create_allows_timestamp_again_after_delete():
+    repo = BodyCompositionRepository()
+    ts = datetime(2024, 1, 1, 12, 0, tzinfo=PACIFIC_TZ)
+    created = repo.create(BodyCompositionCreate(timestamp=ts, date="2024-01-01", weight=80))
+    assert repo.create(BodyCompositionCreate(timestamp=ts, date="2024-01-01", weight=80)) is None
+
+    assert repo.delete(created["doc_id"]) is True
+    recreated = repo.create(BodyCompositionCreate(timestamp=ts, date="2024-01-01", weight=81))
+    assert recreated is not None
+    assert recreated["weight"] == 81
+
+
+def test_body_comp_create_allows_timestamp_deleted_by_another_process(db_session):
+    repo = BodyCompositionRepository()
+    ts = datetime(2024, 1, 1, 12, 0, tzinfo=PACIFIC_TZ)
+    repo.create(BodyCompositionCreate(timestamp=ts, date="2024-01-01", weight=80))
+
+    # A delete that bypasses this repository leaves its known-timestamp set stale
+    db_session.execute(text("DELETE FROM body_composition"))
+    db_session.commit()
+
+    recreated = repo.create(BodyCompositionCreate(timestamp=ts, date="2024-01-01", weight=81))
+    assert recreated is not None
+    assert recreated["weight"] == 81
+
+    db_session.execute(text("DELETE FROM body_composition"))
+    db_session.commit()
+
+    created = repo.create_many(
+        [BodyCompositionCreate(timestamp=ts, date="2024-01-01", weight=82)]
+    )
+    assert [m["weight"] for m in created] == [82]
+
+
+def test_body_comp_create_many_skips_duplicates():
+    repo = BodyCompositionRepository()
+    existing_ts = datetime(2024, 1, 1, 10, 0, tzinfo=PACIFIC_TZ)
+    repo.create(BodyCompositionCreate(timestamp=existing_ts, date="2024-01-01", weight=80))
+
+    created = repo.create_many(
+        [
+            BodyCompositionCreate(timestamp=existing_ts, date="2024-01-01", weight=80),
+            BodyCompositionCreate(
+                timestamp=datetime(2024, 1, 2, 10, 0, tzinfo=PACIFIC_TZ),
+                date="2024-01-02",
+                weight=81,
+            ),
+            BodyCompositionCreate(
+                timestamp=datetime(2024, 1, 2, 10, 0, tzinfo=PACIFIC_TZ),
+                date="2024-01-02",
+                weight=81,
+            ),
+        ]
+    )
+
+    assert [m["date"] for m in created] == ["2024-01-02"]
+    assert repo.get_stats()["total_measurements"] == 2
+
+
+def test_body_comp_create_many_returns_stored_values():
+    repo = BodyCompositionRepository()
+    created = repo.create_many(
+        [
+            BodyCompositionCreate(
+                timestamp=datetime(2024, 1, 2, 8, 0, tzinfo=timezone.utc),
+                date="2024-01-02",
+                weight=81,
+            ),
+        ]
+    )
+
+    assert created == [repo.get_by_id(created[0]["doc_id"])]
+    assert created[0]["timestamp"] == datetime(2024, 1, 2, 8, 0)
+
+
+def test_body_comp_create_inserts_into_warm_cache_in_order():
+    repo = BodyCompositionRepository()
+    now = datetime.now(PACIFIC_TZ)
+    repo.create(
+        BodyCompositionCreate(
+            timestamp=now - timedelta(days=2),
+            date=(now - timedelta(days=2)).date().isoformat(),
+            weight=80,
+            body_fat_pct=20,
+        )
+    )
+    repo.get_stats()
+
+    older = now - timedelta(days=5)
+    repo.create(
+        BodyCompositionCreate(
+            timestamp=older,
+            date=older.date().isoformat(),
+            weight=82,
+            body_fat_pct=22,
+        )
+    )
+
+    cached_rows = body_comp_repo._cache_rows
+    stats = repo.get_stats()
+    # Served from the updated cache rather than re-read from the table
+    assert body_comp_repo._cache_rows is cached_rows
+    assert stats["total_measurements"] == 2
+    assert stats["first_date"] == older.date().isoformat()
+    assert stats["latest_weight"] == 80
+    assert stats["body_fat_change"] == -2
+
+
+def test_body_comp_stats_change_handles_zero_and_missing_values():
+    repo = BodyCompositionRepository()
+    now = datetime.now(PACIFIC_TZ)
+    repo.create(
+        BodyCompositionCreate(
+            timestamp=now - timedelta(days=3),
+            date=(now - timedelta(days=3)).date().isoformat(),
+            weight=80,
+            body_fat_pct=0,
+        )
+    )
+    repo.create(
+        BodyCompositionCreate(
+            timestamp=now - timedelta(days=1),
+            date=(now - timedelta(days=1)).date().isoformat(),
+            weight=80,
+            body_fat_pct=1.5,
+            muscle_mass=40,
+        )
+    )
+
+    stats = repo.get_stats()
+    assert stats["body_fat_change"] == 1.5
+    assert stats["muscle_mass_change"] is None
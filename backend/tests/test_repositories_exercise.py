@@ -25,6 +25,18 @@ def test_exercise_get_by_category_orders_by_last_used():
     assert [r["name"] for r in results] == ["Lunge", "Squat"]
 
 
+def test_exercise_get_names_by_category_orders_by_last_used():
+    repo = ExerciseRepository()
+    repo.create(ExerciseCreate(name="Squat", category="Legs"))
+    repo.create(ExerciseCreate(name="Lunge", category="Legs"))
+    repo.create(ExerciseCreate(name="Bench", category="Push"))
+
+    repo.update_usage("Squat", "2024-01-05")
+    repo.update_usage("Lunge", "2024-01-03")
+
+    assert repo.get_names_by_category("Legs") == ["Squat", "Lunge"]
+
+
 def test_exercise_get_recent_filters_null_last_used():
     repo = ExerciseRepository()
     repo.create(ExerciseCreate(name="Bench", category="Push"))
@@ -49,3 +61,24 @@ def test_category_get_all_sorts_by_name():
 
     results = repo.get_all()
     assert [r["name"] for r in results] == ["Alpha", "Zed"]
+
+
+def test_exercise_create_missing_skips_existing():
+    repo = ExerciseRepository()
+    repo.create(ExerciseCreate(name="Squat", category="Legs"))
+
+    created = repo.create_missing({"Legs": ["Squat", "Lunge"], "Core": ["Plank"]})
+    assert created == (1, 2)
+    assert sorted(repo.get_names_by_category("Legs")) == ["Lunge", "Squat"]
+    assert repo.get_names_by_category("Core") == ["Plank"]
+
+    assert repo.create_missing({"Legs": ["Squat", "Lunge"], "Core": ["Plank"]}) == (0, 0)
+
+
+def test_exercise_create_missing_ignores_repeated_names():
+    repo = ExerciseRepository()
+
+    assert repo.create_missing({"Legs": ["Squat", "Squat"], "Core": ["Squat"]}) == (2, 1)
+    assert repo.get_names_by_category("Legs") == ["Squat"]
+    assert repo.get_names_by_category("Core") == []
+    assert repo.create_missing({}) == (0, 0)
@@ -3,6 +3,7 @@ import pytest
 from app.db.models import UpcomingWorkout
 from app.models.upcoming import UpcomingWorkoutCreate
 from app.repositories.upcoming_repo import UpcomingWorkoutRepository
+from app.repositories.workout_repo import WorkoutRepository
 
 pytestmark = pytest.mark.usefixtures("db_engine")
 
@@ -53,3 +54,50 @@ def test_upcoming_get_by_exercise_orders_by_session():
 
     results = repo.get_by_exercise("Bench")
     assert [r["session"] for r in results] == [1, 2]
+
+
+def test_upcoming_get_all_orders_by_session_then_creation():
+    repo = UpcomingWorkoutRepository()
+    repo.create(UpcomingWorkoutCreate(session=2, exercise="Bench", category="Push"))
+    repo.create(UpcomingWorkoutCreate(session=1, exercise="Squat", category="Legs"))
+    repo.create(UpcomingWorkoutCreate(session=2, exercise="Row", category="Pull"))
+    repo.create(UpcomingWorkoutCreate(session=1, exercise="Curl", category="Pull"))
+
+    results = repo.get_all()
+    assert [(r["session"], r["exercise"]) for r in results] == [
+        (1, "Squat"),
+        (1, "Curl"),
+        (2, "Bench"),
+        (2, "Row"),
+    ]
+
+
+def test_upcoming_replace_all_swaps_program():
+    repo = UpcomingWorkoutRepository()
+    repo.create(UpcomingWorkoutCreate(session=1, exercise="Row", category="Pull"))
+    repo.create(UpcomingWorkoutCreate(session=2, exercise="Curl", category="Pull"))
+
+    deleted, created = repo.replace_all(
+        [UpcomingWorkoutCreate(session=5, exercise="Squat", category="Legs")]
+    )
+
+    assert (deleted, created) == (2, 1)
+    assert [w["session"] for w in repo.get_all()] == [5]
+    assert repo.delete_all() == 1
+
+
+def test_upcoming_transfer_session_moves_workouts_in_order():
+    repo = UpcomingWorkoutRepository()
+    repo.create(UpcomingWorkoutCreate(session=1, exercise="Squat", category="Legs", reps=5))
+    repo.create(UpcomingWorkoutCreate(session=1, exercise="Lunge", category="Legs", reps=8))
+    repo.create(UpcomingWorkoutCreate(session=2, exercise="Bench", category="Push"))
+
+    assert repo.transfer_session(1, "2024-01-10") == 2
+    assert repo.transfer_session(1, "2024-01-10") == 0
+    assert [w["session"] for w in repo.get_all()] == [2]
+
+    workouts = WorkoutRepository().get_by_date("2024-01-10")
+    assert [(w["exercise"], w["order"], w["reps"]) for w in workouts] == [
+        ("Squat", 1, 5),
+        ("Lunge", 2, 8),
+    ]
@@ -79,6 +79,22 @@ def test_workout_reorder_blocks_out_of_range():
     assert repo.reorder(first["doc_id"], "2024-01-05", "up") is False
 
 
+def test_workout_reorder_skips_gaps_and_other_dates():
+    repo = WorkoutRepository()
+    first = _create_workout(repo, "2024-01-06", "Row", "Pull", order=1)
+    third = _create_workout(repo, "2024-01-06", "Curl", "Pull", order=5)
+    _create_workout(repo, "2024-01-07", "Squat", "Legs", order=2)
+
+    assert repo.reorder(first["doc_id"], "2024-01-07", "down") is False
+    assert repo.reorder(first["doc_id"], "2024-01-06", "down") is True
+    reordered = repo.get_by_date("2024-01-06")
+    assert [(w["doc_id"], w["order"]) for w in reordered] == [
+        (third["doc_id"], 1),
+        (first["doc_id"], 5),
+    ]
+    assert repo.reorder(first["doc_id"], "2024-01-06", "down") is False
+
+
 def test_workout_bulk_reorder_updates_order():
     repo = WorkoutRepository()
     first = _create_workout(repo, "2024-01-06", "Row", "Pull")
@@ -114,6 +130,16 @@ def test_workout_counts_by_date_groups_correctly():
     assert counts == {"2024-02-01": 2, "2024-02-02": 1}
 
 
+def test_workout_counts_by_date_bounds_month_edges():
+    repo = WorkoutRepository()
+    _create_workout(repo, "2023-11-30", "Row", "Pull")
+    _create_workout(repo, "2023-12-01", "Row", "Pull")
+    _create_workout(repo, "2023-12-31", "Row", "Pull")
+    _create_workout(repo, "2024-01-01", "Row", "Pull")
+
+    assert repo.get_workout_counts_by_date(2023, 12) == {"2023-12-01": 1, "2023-12-31": 1}
+
+
 def test_workout_get_by_exercise_orders_by_date():
     repo = WorkoutRepository()
     _create_workout(repo, "2024-02-03", "Bench", "Push")
@@ -121,3 +147,66 @@ def test_workout_get_by_exercise_orders_by_date():
 
     results = repo.get_by_exercise("Bench")
     assert [w["date"] for w in results] == ["2024-02-01", "2024-02-03"]
+
+
+def test_workout_get_progression_sets_projects_weighted_sets():
+    repo = WorkoutRepository()
+    _create_workout(repo, "2024-01-02", "Bench", "Push", reps=3, weight=110)
+    _create_workout(repo, "2024-01-01", "Bench", "Push", reps=5, weight=100)
+    _create_workout(repo, "2024-01-01", "Bench", "Push", reps=10, weight=None)
+    _create_workout(repo, "2024-01-01", "Squat", "Legs")
+
+    sets = repo.get_progression_sets("Bench")
+
+    assert sets == [
+        ("2024-01-01", 100, "lbs", 5, None),
+        ("2024-01-02", 110, "lbs", 3, None),
+    ]
+
+
+def test_workout_bulk_reorder_ignores_unknown_ids_and_unchanged_rows():
+    repo = WorkoutRepository()
+    first = _create_workout(repo, "2024-01-07", "Row", "Pull")
+    second = _create_workout(repo, "2024-01-07", "Curl", "Pull")
+    third = _create_workout(repo, "2024-01-07", "Shrug", "Pull")
+
+    assert repo.bulk_reorder([third["doc_id"], second["doc_id"], first["doc_id"], 9999]) is True
+
+    reordered = repo.get_by_date("2024-01-07")
+    assert [(w["doc_id"], w["order"]) for w in reordered] == [
+        (third["doc_id"], 1),
+        (second["doc_id"], 2),
+        (first["doc_id"], 3),
+    ]
+
+
+def test_workout_create_appends_after_highest_order_after_delete():
+    repo = WorkoutRepository()
+    first = _create_workout(repo, "2024-01-08", "Row", "Pull")
+    _create_workout(repo, "2024-01-08", "Curl", "Pull")
+    repo.delete(first["doc_id"])
+
+    third = _create_workout(repo, "2024-01-08", "Shrug", "Pull")
+
+    assert third["order"] == 3
+
+
+def test_workout_create_bulk_continues_order_and_shares_exercise():
+    repo = WorkoutRepository()
+    _create_workout(repo, "2024-01-01", "Bench", "Push")
+
+    created = repo.create_bulk(
+        [
+            WorkoutCreate(date="2024-01-01", exercise="Bench", category="Push", reps=5),
+            WorkoutCreate(date="2024-01-01", exercise="Bench", category="Push", reps=3),
+            WorkoutCreate(date="2024-01-02", exercise="Squat", category="Legs", reps=5),
+        ]
+    )
+
+    assert [(w["date"], w["order"]) for w in created] == [
+        ("2024-01-01", 2),
+        ("2024-01-01", 3),
+        ("2024-01-02", 1),
+    ]
+    assert [w["exercise"] for w in created] == ["Bench", "Bench", "Squat"]
+    assert created[2]["category"] == "Legs"
@@ -1,6 +1,9 @@
 import json
+import threading
+import time
 import pytest
 
+import app.services.mqtt_service as mqtt_service
 from app.services.mqtt_service import MQTTService
 
 pytestmark = pytest.mark.usefixtures("db_engine")
@@ -28,6 +31,7 @@ def test_mqtt_on_message_creates_measurement():
     msg = type("Msg", (), {"topic": "openScaleSync/measurements/last", "payload": json.dumps(payload).encode()})
 
     service._on_message(None, None, msg)
+    service._drain_queue()
 
     assert len(stub_repo.measurements) == 1
     measurement = stub_repo.measurements[0]
@@ -53,5 +57,115 @@ def test_mqtt_on_message_skips_when_missing_fields():
     msg = type("Msg", (), {"topic": "openScaleSync/measurements/last", "payload": json.dumps(payload).encode()})
 
     service._on_message(None, None, msg)
+    assert service._drain_queue() == 0
 
     assert stub_repo.called is False
+
+
+def test_mqtt_on_message_bulk_payload_uses_create_many():
+    service = MQTTService()
+
+    class StubRepo:
+        def __init__(self):
+            self.batches = []
+
+        def create(self, measurement):
+            raise AssertionError("bulk payloads should not insert row by row")
+
+        def create_many(self, measurements):
+            self.batches.append(measurements)
+            return [{"doc_id": i} for i, _ in enumerate(measurements)]
+
+    stub_repo = StubRepo()
+    service.body_comp_repo = stub_repo
+
+    payload = [
+        {"date": "2024-01-01T12:00:00", "weight": 70.5},
+        {"date": "2024-01-02T12:00:00", "weight": 70.1},
+        {"date": "2024-01-03T12:00:00"},
+    ]
+    msg = type("Msg", (), {"topic": "openScaleSync/measurements/all", "payload": json.dumps(payload).encode()})
+
+    service._on_message(None, None, msg)
+    service._drain_queue()
+
+    assert len(stub_repo.batches) == 1
+    assert [m.date for m in stub_repo.batches[0]] == ["2024-01-01", "2024-01-02"]
+
+
+def test_mqtt_on_message_defers_writes_and_coalesces_queue():
+    service = MQTTService()
+
+    class StubRepo:
+        def __init__(self):
+            self.batches = []
+
+        def create(self, measurement):
+            raise AssertionError("queued messages should be written together")
+
+        def create_many(self, measurements):
+            self.batches.append(measurements)
+            return []
+
+    stub_repo = StubRepo()
+    service.body_comp_repo = stub_repo
+
+    for day in ("01", "02", "03"):
+        payload = {"date": f"2024-01-{day}T12:00:00", "weight": 70.0}
+        msg = type("Msg", (), {"topic": "openScaleSync/measurements/last", "payload": json.dumps(payload).encode()})
+        service._on_message(None, None, msg)
+
+    assert stub_repo.batches == []
+
+    assert service._drain_queue() == 3
+    assert len(stub_repo.batches) == 1
+    assert [m.date for m in stub_repo.batches[0]] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+
+def test_mqtt_stop_and_start_never_run_two_writers(monkeypatch):
+    monkeypatch.setattr(mqtt_service, "WRITER_STOP_TIMEOUT", 0.05)
+    service = MQTTService()
+    monkeypatch.setattr(service.client, "connect", lambda *args, **kwargs: None)
+    monkeypatch.setattr(service.client, "loop_start", lambda: None)
+
+    release = threading.Event()
+    writer_threads = []
+
+    class StubRepo:
+        def create(self, measurement):
+            writer_threads.append(threading.current_thread())
+            release.wait(timeout=5)
+            return {"doc_id": 1}
+
+        def create_many(self, measurements):
+            return [self.create(m) for m in measurements]
+
+    service.body_comp_repo = StubRepo()
+    service.start()
+    old_writer = service._writer_thread
+
+    payload = {"date": "2024-01-01T12:00:00", "weight": 70.0}
+    msg = type("Msg", (), {"topic": "openScaleSync/measurements/last", "payload": json.dumps(payload).encode()})
+    service._on_message(None, None, msg)
+    while not writer_threads:
+        time.sleep(0.01)
+
+    service.stop()
+    assert service._writer_thread is old_writer
+    assert old_writer.is_alive()
+
+    # Still busy: start() gives up waiting rather than running a second writer
+    service.start()
+    assert service._writer_thread is old_writer
+    assert old_writer.is_alive()
+
+    release.set()
+    service.start()
+    assert not old_writer.is_alive()
+    new_writer = service._writer_thread
+    assert new_writer is not old_writer
+
+    service._on_message(None, None, msg)
+    service.stop()
+    assert writer_threads == [old_writer, new_writer]
+    assert service._writer_thread is None
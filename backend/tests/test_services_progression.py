@@ -83,3 +83,45 @@ def test_progression_main_lifts_returns_all_keys():
         "Barbell Squat",
         "Deadlift",
     }
+
+
+def test_progression_main_lifts_loads_upcoming_once(monkeypatch):
+    service = ProgressionService()
+    calls = []
+    original_get_all = service.upcoming_repo.get_all
+
+    def counting_get_all():
+        calls.append(1)
+        return original_get_all()
+
+    monkeypatch.setattr(service.upcoming_repo, "get_all", counting_get_all)
+
+    service.get_main_lifts_progression()
+
+    assert len(calls) == 1
+
+
+def test_progression_session_dates_shared_across_exercises():
+    workout_repo = WorkoutRepository()
+    upcoming_repo = UpcomingWorkoutRepository()
+
+    for exercise in ("Bench", "Squat"):
+        workout_repo.create(
+            WorkoutCreate(
+                date="2024-01-01", exercise=exercise, category="Main", weight=100, reps=5
+            )
+        )
+    upcoming_repo.create(
+        UpcomingWorkoutCreate(session=3, exercise="Squat", category="Main", weight=120, reps=3)
+    )
+    upcoming_repo.create(
+        UpcomingWorkoutCreate(session=1, exercise="Bench", category="Main", weight=110, reps=3)
+    )
+
+    service = ProgressionService()
+    bench = service.get_progression_data("Bench")
+    squat = service.get_progression_data("Squat")
+
+    assert bench["upcoming"][0]["projected_date"] == "2024-01-03"
+    assert squat["upcoming"][0]["projected_date"] == "2024-01-05"
+    assert len(service._session_dates) == 1
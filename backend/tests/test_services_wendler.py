@@ -1,5 +1,7 @@
 import pytest
 
+from app.models.workout import WorkoutCreate
+from app.repositories.workout_repo import WorkoutRepository
 from app.services.wendler_service import WendlerService
 
 pytestmark = pytest.mark.usefixtures("db_engine")
@@ -22,3 +24,21 @@ def test_wendler_get_latest_estimated_1rm_returns_none_for_unknown():
     result = service.get_latest_estimated_1rm("Unknown Exercise That Does Not Exist")
 
     assert result is None
+
+
+def test_wendler_get_current_maxes_uses_recent_sets():
+    repo = WorkoutRepository()
+    for date, exercise, category, weight, reps in (
+        ("2024-01-01", "Barbell Squat", "Legs", 100, 5),
+        ("2024-01-02", "Barbell Squat", "Legs", 200, 1),
+        ("2024-01-02", "Deadlift", "Pull", 300, 0),
+    ):
+        repo.create(
+            WorkoutCreate(
+                date=date, exercise=exercise, category=category, weight=weight, reps=reps
+            )
+        )
+
+    maxes = WendlerService().get_current_maxes()
+
+    assert maxes == {"Barbell Squat": pytest.approx(206.6)}
@@ -22,6 +22,11 @@ def test_calculate_moving_average_skips_none_values():
     assert calculate_moving_average(values, window=2) == [1.0, None, 3.0, 4.0]
 
 
+def test_calculate_moving_average_drops_values_leaving_window():
+    values = [10.0, 20.0, None, 30.0, 40.0, 50.0]
+    assert calculate_moving_average(values, window=3) == [10.0, 15.0, None, 25.0, 35.0, 40.0]
+
+
 def test_parse_iso_timestamp_assigns_timezone():
     dt = parse_iso_timestamp("2024-01-01T12:00:00")
     assert dt.tzinfo == PACIFIC_TZ
@@ -7,8 +7,7 @@ import BodyComposition from "./pages/BodyComposition";
 import Upcoming from "./pages/Upcoming";
 import Exercises from "./pages/Exercises";
 import { InstallPrompt } from "./components/PWA/InstallPrompt";
-import { usePWA } from "./hooks/usePWA";
-import { WifiOff } from "lucide-react";
+import { OfflineBanner } from "./components/PWA/OfflineBanner";
 
 const queryClient = new QueryClient({
     defaultOptions: {
@@ -21,26 +20,11 @@ const queryClient = new QueryClient({
 });
 
 function App() {
-    const { isOnline } = usePWA();
-
     return (
         <QueryClientProvider client={queryClient}>
             <BrowserRouter>
                 <div className="min-h-screen bg-background text-foreground dark">
-                    {!isOnline && (
-                        <div
-                            className="px-4 py-2 text-center text-sm flex items-center justify-center gap-2"
-                            style={{
-                                background: 'var(--warning)',
-                                color: 'var(--text-inverse)'
-                            }}
-                        >
-                            <WifiOff className="h-4 w-4" />
-                            <span>
-                                You are offline. Some features may be limited.
-                            </span>
-                        </div>
-                    )}
+                    <OfflineBanner />
                     <Routes>
                         <Route path="/" element={<Calendar />} />
                         <Route path="/day/:date" element={<WorkoutSession />} />
@@ -0,0 +1,36 @@
+import { useEffect, useRef, useState, type ReactNode } from 'react';
+
+interface LazyRenderProps {
+  /** Height reserved before the children mount, so the layout doesn't jump */
+  height: number;
+  children: ReactNode;
+}
+
+/**
+ * Mount children only once the placeholder scrolls near the viewport. Once
+ * shown they stay mounted, so scrolling back doesn't rebuild them.
+ */
+export default function LazyRender({ height, children }: LazyRenderProps) {
+  const ref = useRef<HTMLDivElement>(null);
+  const [visible, setVisible] = useState(false);
+
+  useEffect(() => {
+    if (visible) return;
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) {
+          setVisible(true);
+        }
+      },
+      { rootMargin: '200px' },
+    );
+    if (ref.current) observer.observe(ref.current);
+    return () => observer.disconnect();
+  }, [visible]);
+
+  return (
+    <div ref={ref} style={{ minHeight: height }}>
+      {visible && children}
+    </div>
+  );
+}
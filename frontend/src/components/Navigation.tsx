@@ -1,22 +1,27 @@
 import { Link, useLocation } from "react-router-dom";
 import { Calendar, TrendingUp, Weight, ListTodo, Dumbbell } from "lucide-react";
 
+// Static, so defined once rather than on every page render
+const navItems = [
+    { path: "/", label: "Calendar", icon: Calendar },
+    { path: "/progression", label: "Progress", icon: TrendingUp },
+    { path: "/body-composition", label: "Body", icon: Weight },
+    { path: "/upcoming", label: "Upcoming", icon: ListTodo },
+    { path: "/exercises", label: "Exercises", icon: Dumbbell },
+];
+
 const Navigation = () => {
     const location = useLocation();
 
-    const isActive = (path: string) => {
-        if (path === "/" && location.pathname === "/") return true;
-        if (path !== "/" && location.pathname.startsWith(path)) return true;
-        return false;
-    };
+    // Resolve the active item once per render instead of twice per item
+    // (desktop and mobile lists each checked every path).
+    const activePath = navItems.find(({ path }) =>
+        path === "/"
+            ? location.pathname === "/"
+            : location.pathname.startsWith(path),
+    )?.path;
 
-    const navItems = [
-        { path: "/", label: "Calendar", icon: Calendar },
-        { path: "/progression", label: "Progress", icon: TrendingUp },
-        { path: "/body-composition", label: "Body", icon: Weight },
-        { path: "/upcoming", label: "Upcoming", icon: ListTodo },
-        { path: "/exercises", label: "Exercises", icon: Dumbbell },
-    ];
+    const isActive = (path: string) => path === activePath;
 
     return (
         <>
@@ -0,0 +1,27 @@
+import { WifiOff } from "lucide-react";
+import { usePWA } from "@/hooks/usePWA";
+
+/**
+ * Offline notice. Owns the connectivity subscription so that going on or
+ * offline re-renders only this banner, not the routed page beneath it.
+ */
+export function OfflineBanner() {
+    const { isOnline } = usePWA();
+
+    if (isOnline) return null;
+
+    return (
+        <div
+            className="px-4 py-2 text-center text-sm flex items-center justify-center gap-2"
+            style={{
+                background: 'var(--warning)',
+                color: 'var(--text-inverse)'
+            }}
+        >
+            <WifiOff className="h-4 w-4" />
+            <span>
+                You are offline. Some features may be limited.
+            </span>
+        </div>
+    );
+}
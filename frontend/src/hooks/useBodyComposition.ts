@@ -1,4 +1,4 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { keepPreviousData, useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { bodyCompositionApi } from '@/lib/api';
 import type { BodyComposition } from '@/types/bodyComposition';
 
@@ -44,6 +44,9 @@ export function useBodyCompositionTrends(days: number = 30) {
       const response = await bodyCompositionApi.getTrends(days);
       return response.data;
     },
+    // Keep the current charts on screen while another range loads, instead
+    // of unmounting them behind a spinner and rebuilding them afterwards
+    placeholderData: keepPreviousData,
   });
 }
 
@@ -1,15 +1,30 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useEffect } from 'react';
+import { queryOptions, useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { exercisesApi, categoriesApi } from '@/lib/api';
 import type { Exercise, ExerciseCreate, ExerciseUpdate, CategoryCreate, SeedExercisesResponse } from '@/types/exercise';
 
+const exercisesQueryOptions = queryOptions({
+  queryKey: ['exercises'],
+  queryFn: async () => {
+    const response = await exercisesApi.getAll();
+    return response.data;
+  },
+});
+
 export function useExercises() {
-  return useQuery({
-    queryKey: ['exercises'],
-    queryFn: async () => {
-      const response = await exercisesApi.getAll();
-      return response.data;
-    },
-  });
+  return useQuery(exercisesQueryOptions);
+}
+
+/**
+ * Load the exercise list alongside another page's own queries, so the workout
+ * session page finds it cached instead of starting that request on arrival.
+ */
+export function usePrefetchExercises() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    queryClient.prefetchQuery(exercisesQueryOptions);
+  }, [queryClient]);
 }
 
 export function useRecentExercises(limit: number = 10) {
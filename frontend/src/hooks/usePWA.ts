@@ -1,24 +1,36 @@
-import { useEffect, useState } from "react";
+import { useState, useSyncExternalStore } from "react";
+
+// One pair of window listeners shared by every component using usePWA,
+// attached while at least one of them is mounted.
+const connectivityListeners = new Set<() => void>();
+
+const notifyConnectivity = () => {
+    connectivityListeners.forEach((listener) => listener());
+};
+
+function subscribeConnectivity(listener: () => void) {
+    if (connectivityListeners.size === 0) {
+        window.addEventListener("online", notifyConnectivity);
+        window.addEventListener("offline", notifyConnectivity);
+    }
+    connectivityListeners.add(listener);
+
+    return () => {
+        connectivityListeners.delete(listener);
+        if (connectivityListeners.size === 0) {
+            window.removeEventListener("online", notifyConnectivity);
+            window.removeEventListener("offline", notifyConnectivity);
+        }
+    };
+}
+
+const getIsOnline = () => navigator.onLine;
 
 export function usePWA() {
-    const [isOnline, setIsOnline] = useState(navigator.onLine);
+    const isOnline = useSyncExternalStore(subscribeConnectivity, getIsOnline);
     const [isInstalled] = useState(
         () => window.matchMedia("(display-mode: standalone)").matches
     );
 
-    useEffect(() => {
-        // Listen for online/offline events
-        const handleOnline = () => setIsOnline(true);
-        const handleOffline = () => setIsOnline(false);
-
-        window.addEventListener("online", handleOnline);
-        window.addEventListener("offline", handleOffline);
-
-        return () => {
-            window.removeEventListener("online", handleOnline);
-            window.removeEventListener("offline", handleOffline);
-        };
-    }, []);
-
     return { isOnline, isInstalled };
 }
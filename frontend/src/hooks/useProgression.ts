@@ -1,11 +1,15 @@
 import { useQuery } from '@tanstack/react-query';
 import { progressionApi } from '@/lib/api';
 
-export function useProgression(exercise: string, includeUpcoming: boolean = true) {
+export function useProgression(
+  exercise: string,
+  includeUpcoming: boolean = true,
+  limit?: number,
+) {
   return useQuery({
-    queryKey: ['progression', exercise, includeUpcoming],
+    queryKey: ['progression', exercise, includeUpcoming, limit],
     queryFn: async () => {
-      const response = await progressionApi.getByExercise(exercise, includeUpcoming);
+      const response = await progressionApi.getByExercise(exercise, includeUpcoming, limit);
       return response.data;
     },
     enabled: !!exercise,
@@ -1,4 +1,11 @@
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import { useEffect } from "react";
+import {
+    queryOptions,
+    type QueryClient,
+    useQuery,
+    useMutation,
+    useQueryClient,
+} from "@tanstack/react-query";
 import { workoutsApi } from "@/lib/api";
 import type { Workout, WorkoutCreate, CalendarResponse } from "@/types/workout";
 
@@ -27,20 +34,62 @@ export function useWorkout(id: number) {
     });
 }
 
-export function useCalendar(year: number, month: number) {
-    return useQuery({
+const calendarQueryOptions = (year: number, month: number) =>
+    queryOptions({
         queryKey: ["calendar", year, month],
         queryFn: async () => {
             const response = await workoutsApi.getCalendar(year, month);
             return response.data;
         },
+        // Counts only change through the workout mutations, which invalidate
+        // ["calendar"], so paging back to a month reuses its cached counts.
+        staleTime: Infinity,
+        gcTime: 30 * 60 * 1000,
     });
+
+export function useCalendar(year: number, month: number) {
+    return useQuery(calendarQueryOptions(year, month));
+}
+
+/**
+ * Warm the cache for a month the user is likely to open next, so switching
+ * to it renders from cache instead of showing the loading state.
+ */
+export function usePrefetchCalendar(year: number, month: number) {
+    const queryClient = useQueryClient();
+
+    useEffect(() => {
+        queryClient.prefetchQuery(calendarQueryOptions(year, month));
+    }, [queryClient, year, month]);
+}
+
+// Shared by the per-set mutations below, which tend to arrive in bursts while
+// logging a session.
+const WORKOUT_MUTATION_KEY = ["workouts", "mutation"];
+
+// Caches to refetch once the current burst of workout mutations settles
+const pendingInvalidations = new Set<string>();
+
+/**
+ * Invalidate the given caches once the last in-flight workout mutation
+ * settles, so a burst of quick edits causes one refetch instead of one each
+ * (and an early refetch can't clobber later optimistic updates).
+ */
+function invalidateWhenIdle(queryClient: QueryClient, queryKeys: string[]) {
+    queryKeys.forEach((key) => pendingInvalidations.add(key));
+    // The settling mutation still counts as in flight here
+    if (queryClient.isMutating({ mutationKey: WORKOUT_MUTATION_KEY }) > 1) return;
+    pendingInvalidations.forEach((key) => {
+        queryClient.invalidateQueries({ queryKey: [key] });
+    });
+    pendingInvalidations.clear();
 }
 
 export function useCreateWorkout() {
     const queryClient = useQueryClient();
 
     return useMutation({
+        mutationKey: WORKOUT_MUTATION_KEY,
         mutationFn: async (workout: WorkoutCreate) => {
             const response = await workoutsApi.create(workout);
             return response.data;
@@ -99,8 +148,7 @@ export function useCreateWorkout() {
             });
         },
         onSettled: () => {
-            queryClient.invalidateQueries({ queryKey: ["workouts"] });
-            queryClient.invalidateQueries({ queryKey: ["calendar"] });
+            invalidateWhenIdle(queryClient, ["workouts", "calendar"]);
         },
     });
 }
@@ -109,6 +157,7 @@ export function useUpdateWorkout() {
     const queryClient = useQueryClient();
 
     return useMutation({
+        mutationKey: WORKOUT_MUTATION_KEY,
         mutationFn: async ({
             id,
             workout,
@@ -151,8 +200,7 @@ export function useUpdateWorkout() {
             });
         },
         onSettled: () => {
-            queryClient.invalidateQueries({ queryKey: ["workouts"] });
-            queryClient.invalidateQueries({ queryKey: ["calendar"] });
+            invalidateWhenIdle(queryClient, ["workouts", "calendar"]);
         },
     });
 }
@@ -161,6 +209,7 @@ export function useDeleteWorkout() {
     const queryClient = useQueryClient();
 
     return useMutation({
+        mutationKey: WORKOUT_MUTATION_KEY,
         mutationFn: async (id: number) => {
             await workoutsApi.delete(id);
             return id;
@@ -214,8 +263,7 @@ export function useDeleteWorkout() {
             });
         },
         onSettled: () => {
-            queryClient.invalidateQueries({ queryKey: ["workouts"] });
-            queryClient.invalidateQueries({ queryKey: ["calendar"] });
+            invalidateWhenIdle(queryClient, ["workouts", "calendar"]);
         },
     });
 }
@@ -224,6 +272,7 @@ export function useBulkReorderWorkouts() {
     const queryClient = useQueryClient();
 
     return useMutation({
+        mutationKey: WORKOUT_MUTATION_KEY,
         mutationFn: async (workoutIds: number[]) => {
             await workoutsApi.bulkReorder(workoutIds);
         },
@@ -251,7 +300,7 @@ export function useBulkReorderWorkouts() {
             });
         },
         onSettled: () => {
-            queryClient.invalidateQueries({ queryKey: ["workouts"] });
+            invalidateWhenIdle(queryClient, ["workouts"]);
         },
     });
 }
@@ -260,6 +309,7 @@ export function useToggleComplete() {
     const queryClient = useQueryClient();
 
     return useMutation({
+        mutationKey: WORKOUT_MUTATION_KEY,
         mutationFn: async ({
             id,
             completed,
@@ -292,7 +342,7 @@ export function useToggleComplete() {
             });
         },
         onSettled: () => {
-            queryClient.invalidateQueries({ queryKey: ["workouts"] });
+            invalidateWhenIdle(queryClient, ["workouts"]);
         },
     });
 }
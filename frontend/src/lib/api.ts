@@ -123,11 +123,15 @@ export const categoriesApi = {
 
 // Progression
 export const progressionApi = {
-    getByExercise: (exercise: string, includeUpcoming: boolean = true) =>
+    getByExercise: (
+        exercise: string,
+        includeUpcoming: boolean = true,
+        limit?: number,
+    ) =>
         api.get<ProgressionResponse>(
             `/api/progression/${encodeURIComponent(exercise)}`,
             {
-                params: { include_upcoming: includeUpcoming },
+                params: { include_upcoming: includeUpcoming, limit },
             },
         ),
 
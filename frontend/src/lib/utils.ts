@@ -4,3 +4,52 @@ import { twMerge } from "tailwind-merge"
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
 }
+
+export interface CategoryColor {
+  bg: string
+  text: string
+  border: string
+}
+
+// Predefined colors for common categories
+const CATEGORY_COLORS: Record<string, string> = {
+  Push: "var(--chart-2)", // Blue
+  Pull: "var(--accent)", // Green
+  Legs: "var(--chart-3)", // Purple
+  Core: "var(--chart-4)", // Orange
+  Cardio: "var(--error)", // Red
+}
+
+// Color palette for hash-based assignment
+const CATEGORY_PALETTE = [
+  "var(--chart-1)", // Green
+  "var(--chart-2)", // Blue
+  "var(--chart-3)", // Purple
+  "var(--chart-4)", // Orange
+  "var(--chart-5)", // Yellow
+  "var(--info)", // Light blue
+  "var(--error)", // Red
+]
+
+// There are only a handful of categories, so each one's colors are worked out
+// once and every row rendered in that category shares the same object.
+const categoryColorCache = new Map<string, CategoryColor>()
+
+export function getCategoryColor(category: string): CategoryColor {
+  let colors = categoryColorCache.get(category)
+  if (colors) return colors
+
+  let color = CATEGORY_COLORS[category]
+  if (!color) {
+    // Simple hash function for consistent color assignment
+    let hash = 0
+    for (let i = 0; i < category.length; i++) {
+      hash = category.charCodeAt(i) + ((hash << 5) - hash)
+    }
+    color = CATEGORY_PALETTE[Math.abs(hash) % CATEGORY_PALETTE.length]
+  }
+
+  colors = { bg: color, text: color, border: color }
+  categoryColorCache.set(category, colors)
+  return colors
+}
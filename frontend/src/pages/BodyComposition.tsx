@@ -1,8 +1,9 @@
-import { useState } from "react";
+import { memo, useMemo, useState } from "react";
 import { format, parseISO } from "date-fns";
 import type { LucideIcon } from "lucide-react";
 import { Weight, TrendingDown, TrendingUp } from "lucide-react";
 import Navigation from "@/components/Navigation";
+import LazyRender from "@/components/LazyRender";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import {
     Select,
@@ -25,6 +26,163 @@ import {
     ResponsiveContainer,
 } from "recharts";
 
+// Shared chart tooltip styling, defined once rather than per chart per render
+const TOOLTIP_CONTENT_STYLE = {
+    backgroundColor: "var(--bg-tertiary)",
+    border: "1px solid var(--border)",
+    borderRadius: 'var(--radius-md)',
+    color: 'var(--text-primary)',
+};
+
+const formatTickDate = (date: string) => format(parseISO(date), "MMM d");
+const formatTooltipDate = (date: string) => format(parseISO(date), "MMM d, yyyy");
+
+// Trend range the charts open with
+const DEFAULT_TREND_DAYS = 30;
+
+const KG_TO_LBS = 2.20462;
+
+const kgToLbs = (kg: number | null) => {
+    if (kg === null) return null;
+    return kg * KG_TO_LBS;
+};
+
+// Above this many measurements the charts are downsampled before rendering;
+// a chart card is only a few hundred pixels wide, so more points than that
+// add SVG nodes without adding visible detail.
+const CHART_MAX_POINTS = 400;
+const CHART_BUCKETS = 80;
+
+// Past this many points the per-reading dots merge into a solid band anyway;
+// the line is drawn without them (one path instead of a circle per reading)
+// and the hovered reading still gets its active dot.
+const CHART_DOT_LIMIT = 120;
+const TREND_DOT = { r: 3 };
+
+interface TrendPoint {
+    date: string;
+    weight: number | null;
+    bodyFat: number | null;
+    muscleMass: number | null;
+    water: number | null;
+}
+
+const TREND_SERIES = ["weight", "bodyFat", "muscleMass", "water"] as const;
+
+type TrendSeries = (typeof TREND_SERIES)[number];
+
+// M4-style downsampling: split the series into equal buckets and keep each
+// bucket's first and last point plus the points holding every series' min
+// and max, so peaks and dips survive and the lines keep their shape. Only
+// the series passed in are scanned; the rest have no readings to keep.
+const downsampleTrend = (points: TrendPoint[], series: readonly TrendSeries[]) => {
+    if (points.length <= CHART_MAX_POINTS) return points;
+
+    const keep = new Set<number>();
+    const bucketSize = points.length / CHART_BUCKETS;
+    for (let bucket = 0; bucket < CHART_BUCKETS; bucket++) {
+        const start = Math.floor(bucket * bucketSize);
+        const end = Math.floor((bucket + 1) * bucketSize);
+        keep.add(start);
+        keep.add(end - 1);
+
+        for (const key of series) {
+            let minIndex = -1;
+            let maxIndex = -1;
+            let min = Infinity;
+            let max = -Infinity;
+            for (let i = start; i < end; i++) {
+                const value = points[i][key];
+                if (value == null) continue;
+                if (value < min) {
+                    min = value;
+                    minIndex = i;
+                }
+                if (value > max) {
+                    max = value;
+                    maxIndex = i;
+                }
+            }
+            if (minIndex >= 0) {
+                keep.add(minIndex);
+                keep.add(maxIndex);
+            }
+        }
+    }
+
+    return [...keep].sort((a, b) => a - b).map((index) => points[index]);
+};
+
+interface TrendChartConfig {
+    dataKey: TrendSeries;
+    title: string;
+    label: string;
+    color: string;
+    unit: string;
+    formatTick: (value: number) => string;
+}
+
+const formatMassTick = (value: number) => value.toFixed(0);
+const formatPercentTick = (value: number) => value.toFixed(1) + "%";
+
+const TREND_CHARTS: TrendChartConfig[] = [
+    { dataKey: "weight", title: "Weight", label: "Weight", color: "var(--chart-2)", unit: " lbs", formatTick: formatMassTick },
+    { dataKey: "bodyFat", title: "Body Fat %", label: "Body Fat", color: "var(--error)", unit: "%", formatTick: formatPercentTick },
+    { dataKey: "muscleMass", title: "Muscle Mass", label: "Muscle Mass", color: "var(--accent)", unit: " lbs", formatTick: formatMassTick },
+    { dataKey: "water", title: "Water %", label: "Water", color: "var(--info)", unit: "%", formatTick: formatPercentTick },
+];
+
+// Memoized so a chart only re-renders when its data changes, not when the
+// stats above it refetch or the page re-renders for other reasons
+const TrendChart = memo(({ data, chart }: { data: TrendPoint[]; chart: TrendChartConfig }) => (
+    <Card className="animate-in">
+        <CardHeader style={{ paddingBottom: 0 }}>
+            <CardTitle style={{ fontSize: '14px', fontWeight: 600, color: chart.color, letterSpacing: '0.03em', textTransform: 'uppercase' }}>
+                {chart.title}
+            </CardTitle>
+        </CardHeader>
+        <CardContent>
+            <LazyRender height={220}>
+                <ResponsiveContainer width="100%" height={220}>
+                    <LineChart data={data}>
+                        <CartesianGrid strokeDasharray="3 3" stroke="var(--border)" />
+                        <XAxis
+                            dataKey="date"
+                            stroke="var(--text-muted)"
+                            style={{ fontSize: '11px' }}
+                            tickFormatter={formatTickDate}
+                        />
+                        <YAxis
+                            stroke="var(--text-muted)"
+                            style={{ fontSize: '11px' }}
+                            domain={['auto', 'auto']}
+                            tickFormatter={chart.formatTick}
+                            padding={{ top: 10, bottom: 10 }}
+                        />
+                        <Tooltip
+                            contentStyle={TOOLTIP_CONTENT_STYLE}
+                            labelFormatter={formatTooltipDate}
+                            formatter={(value: number | undefined) => {
+                                if (value == null) return ["N/A", chart.label];
+                                return [value.toFixed(1) + chart.unit, chart.label];
+                            }}
+                        />
+                        <Line
+                            type="monotone"
+                            dataKey={chart.dataKey}
+                            stroke={chart.color}
+                            name={chart.title}
+                            strokeWidth={2}
+                            dot={data.length > CHART_DOT_LIMIT ? false : TREND_DOT}
+                            connectNulls
+                        />
+                    </LineChart>
+                </ResponsiveContainer>
+            </LazyRender>
+        </CardContent>
+    </Card>
+));
+
 const StatCard = ({
     title,
     value,
@@ -83,26 +241,40 @@ const StatCard = ({
 };
 
 const BodyComposition = () => {
-    const [trendDays, setTrendDays] = useState(30);
+    const [trendDays, setTrendDays] = useState(DEFAULT_TREND_DAYS);
 
     const { data: stats, isLoading: statsLoading } = useBodyCompositionStats();
     const { data: trends, isLoading: trendsLoading } =
         useBodyCompositionTrends(trendDays);
 
-    const chartData = trends
-        ? trends.dates.map((date, index) => ({
-              date,
-              weight: trends.weights[index],
-              bodyFat: trends.body_fat_pcts[index],
-              muscleMass: trends.muscle_masses[index],
-              water: trends.water_pcts[index],
-          }))
-        : [];
+    // Masses are converted to lbs once per fetch, so the axis and tooltip
+    // formatters only have to format them. Which series have any reading in
+    // range is worked out once here too: empty series are skipped by the
+    // downsampler and their charts aren't rendered. Downsampling keeps every
+    // series' extremes, so a series with readings never loses all of them.
+    const { chartData, chartSeries } = useMemo((): {
+        chartData: TrendPoint[];
+        chartSeries: TrendSeries[];
+    } => {
+        if (!trends) return { chartData: [], chartSeries: [] };
 
-    const kgToLbs = (kg: number | null) => {
-        if (kg === null) return null;
-        return kg * 2.20462;
-    };
+        const points: TrendPoint[] = trends.dates.map((date, index) => ({
+            date,
+            weight: kgToLbs(trends.weights[index]),
+            bodyFat: trends.body_fat_pcts[index],
+            muscleMass: kgToLbs(trends.muscle_masses[index]),
+            water: trends.water_pcts[index],
+        }));
+        const series = TREND_SERIES.filter((key) =>
+            points.some((point) => point[key] != null),
+        );
+        return { chartData: downsampleTrend(points, series), chartSeries: series };
+    }, [trends]);
+
+    const visibleCharts = useMemo(
+        () => TREND_CHARTS.filter((chart) => chartSeries.includes(chart.dataKey)),
+        [chartSeries],
+    );
 
     return (
         <>
@@ -218,217 +390,9 @@ const BodyComposition = () => {
                                 </div>
                             ) : chartData.length > 0 ? (
                                 <div style={{ display: 'flex', flexDirection: 'column', gap: 'var(--space-4)' }}>
-                                    {/* Weight Chart */}
-                                    {chartData.some(d => d.weight != null) && (
-                                        <Card className="animate-in">
-                                            <CardHeader style={{ paddingBottom: 0 }}>
-                                                <CardTitle style={{ fontSize: '14px', fontWeight: 600, color: 'var(--chart-2)', letterSpacing: '0.03em', textTransform: 'uppercase' }}>
-                                                    Weight
-                                                </CardTitle>
-                                            </CardHeader>
-                                            <CardContent>
-                                                <ResponsiveContainer width="100%" height={220}>
-                                                    <LineChart data={chartData}>
-                                                        <CartesianGrid strokeDasharray="3 3" stroke="var(--border)" />
-                                                        <XAxis
-                                                            dataKey="date"
-                                                            stroke="var(--text-muted)"
-                                                            style={{ fontSize: '11px' }}
-                                                            tickFormatter={(date) => format(parseISO(date), "MMM d")}
-                                                        />
-                                                        <YAxis
-                                                            stroke="var(--text-muted)"
-                                                            style={{ fontSize: '11px' }}
-                                                            domain={['auto', 'auto']}
-                                                            tickFormatter={(v) => (v * 2.20462).toFixed(0)}
-                                                            padding={{ top: 10, bottom: 10 }}
-                                                        />
-                                                        <Tooltip
-                                                            contentStyle={{
-                                                                backgroundColor: "var(--bg-tertiary)",
-                                                                border: "1px solid var(--border)",
-                                                                borderRadius: 'var(--radius-md)',
-                                                                color: 'var(--text-primary)',
-                                                            }}
-                                                            labelFormatter={(date) => format(parseISO(date), "MMM d, yyyy")}
-                                                            formatter={(value: number | undefined) => {
-                                                                if (value == null) return ["N/A", "Weight"];
-                                                                return [kgToLbs(value)?.toFixed(1) + " lbs", "Weight"];
-                                                            }}
-                                                        />
-                                                        <Line
-                                                            type="monotone"
-                                                            dataKey="weight"
-                                                            stroke="var(--chart-2)"
-                                                            name="Weight"
-                                                            strokeWidth={2}
-                                                            dot={{ r: 3 }}
-                                                            connectNulls
-                                                        />
-                                                    </LineChart>
-                                                </ResponsiveContainer>
-                                            </CardContent>
-                                        </Card>
-                                    )}
-
-                                    {/* Body Fat % Chart */}
-                                    {chartData.some(d => d.bodyFat != null) && (
-                                        <Card className="animate-in">
-                                            <CardHeader style={{ paddingBottom: 0 }}>
-                                                <CardTitle style={{ fontSize: '14px', fontWeight: 600, color: 'var(--error)', letterSpacing: '0.03em', textTransform: 'uppercase' }}>
-                                                    Body Fat %
-                                                </CardTitle>
-                                            </CardHeader>
-                                            <CardContent>
-                                                <ResponsiveContainer width="100%" height={220}>
-                                                    <LineChart data={chartData}>
-                                                        <CartesianGrid strokeDasharray="3 3" stroke="var(--border)" />
-                                                        <XAxis
-                                                            dataKey="date"
-                                                            stroke="var(--text-muted)"
-                                                            style={{ fontSize: '11px' }}
-                                                            tickFormatter={(date) => format(parseISO(date), "MMM d")}
-                                                        />
-                                                        <YAxis
-                                                            stroke="var(--text-muted)"
-                                                            style={{ fontSize: '11px' }}
-                                                            domain={['auto', 'auto']}
-                                                            tickFormatter={(v) => v.toFixed(1) + "%"}
-                                                            padding={{ top: 10, bottom: 10 }}
-                                                        />
-                                                        <Tooltip
-                                                            contentStyle={{
-                                                                backgroundColor: "var(--bg-tertiary)",
-                                                                border: "1px solid var(--border)",
-                                                                borderRadius: 'var(--radius-md)',
-                                                                color: 'var(--text-primary)',
-                                                            }}
-                                                            labelFormatter={(date) => format(parseISO(date), "MMM d, yyyy")}
-                                                            formatter={(value: number | undefined) => {
-                                                                if (value == null) return ["N/A", "Body Fat"];
-                                                                return [value.toFixed(1) + "%", "Body Fat"];
-                                                            }}
-                                                        />
-                                                        <Line
-                                                            type="monotone"
-                                                            dataKey="bodyFat"
-                                                            stroke="var(--error)"
-                                                            name="Body Fat %"
-                                                            strokeWidth={2}
-                                                            dot={{ r: 3 }}
-                                                            connectNulls
-                                                        />
-                                                    </LineChart>
-                                                </ResponsiveContainer>
-                                            </CardContent>
-                                        </Card>
-                                    )}
-
-                                    {/* Muscle Mass Chart */}
-                                    {chartData.some(d => d.muscleMass != null) && (
-                                        <Card className="animate-in">
-                                            <CardHeader style={{ paddingBottom: 0 }}>
-                                                <CardTitle style={{ fontSize: '14px', fontWeight: 600, color: 'var(--accent)', letterSpacing: '0.03em', textTransform: 'uppercase' }}>
-                                                    Muscle Mass
-                                                </CardTitle>
-                                            </CardHeader>
-                                            <CardContent>
-                                                <ResponsiveContainer width="100%" height={220}>
-                                                    <LineChart data={chartData}>
-                                                        <CartesianGrid strokeDasharray="3 3" stroke="var(--border)" />
-                                                        <XAxis
-                                                            dataKey="date"
-                                                            stroke="var(--text-muted)"
-                                                            style={{ fontSize: '11px' }}
-                                                            tickFormatter={(date) => format(parseISO(date), "MMM d")}
-                                                        />
-                                                        <YAxis
-                                                            stroke="var(--text-muted)"
-                                                            style={{ fontSize: '11px' }}
-                                                            domain={['auto', 'auto']}
-                                                            tickFormatter={(v) => (v * 2.20462).toFixed(0)}
-                                                            padding={{ top: 10, bottom: 10 }}
-                                                        />
-                                                        <Tooltip
-                                                            contentStyle={{
-                                                                backgroundColor: "var(--bg-tertiary)",
-                                                                border: "1px solid var(--border)",
-                                                                borderRadius: 'var(--radius-md)',
-                                                                color: 'var(--text-primary)',
-                                                            }}
-                                                            labelFormatter={(date) => format(parseISO(date), "MMM d, yyyy")}
-                                                            formatter={(value: number | undefined) => {
-                                                                if (value == null) return ["N/A", "Muscle Mass"];
-                                                                return [kgToLbs(value)?.toFixed(1) + " lbs", "Muscle Mass"];
-                                                            }}
-                                                        />
-                                                        <Line
-                                                            type="monotone"
-                                                            dataKey="muscleMass"
-                                                            stroke="var(--accent)"
-                                                            name="Muscle Mass"
-                                                            strokeWidth={2}
-                                                            dot={{ r: 3 }}
-                                                            connectNulls
-                                                        />
-                                                    </LineChart>
-                                                </ResponsiveContainer>
-                                            </CardContent>
-                                        </Card>
-                                    )}
-
-                                    {/* Water % Chart */}
-                                    {chartData.some(d => d.water != null) && (
-                                        <Card className="animate-in">
-                                            <CardHeader style={{ paddingBottom: 0 }}>
-                                                <CardTitle style={{ fontSize: '14px', fontWeight: 600, color: 'var(--info)', letterSpacing: '0.03em', textTransform: 'uppercase' }}>
-                                                    Water %
-                                                </CardTitle>
-                                            </CardHeader>
-                                            <CardContent>
-                                                <ResponsiveContainer width="100%" height={220}>
-                                                    <LineChart data={chartData}>
-                                                        <CartesianGrid strokeDasharray="3 3" stroke="var(--border)" />
-                                                        <XAxis
-                                                            dataKey="date"
-                                                            stroke="var(--text-muted)"
-                                                            style={{ fontSize: '11px' }}
-                                                            tickFormatter={(date) => format(parseISO(date), "MMM d")}
-                                                        />
-                                                        <YAxis
-                                                            stroke="var(--text-muted)"
-                                                            style={{ fontSize: '11px' }}
-                                                            domain={['auto', 'auto']}
-                                                            tickFormatter={(v) => v.toFixed(1) + "%"}
-                                                            padding={{ top: 10, bottom: 10 }}
-                                                        />
-                                                        <Tooltip
-                                                            contentStyle={{
-                                                                backgroundColor: "var(--bg-tertiary)",
-                                                                border: "1px solid var(--border)",
-                                                                borderRadius: 'var(--radius-md)',
-                                                                color: 'var(--text-primary)',
-                                                            }}
-                                                            labelFormatter={(date) => format(parseISO(date), "MMM d, yyyy")}
-                                                            formatter={(value: number | undefined) => {
-                                                                if (value == null) return ["N/A", "Water"];
-                                                                return [value.toFixed(1) + "%", "Water"];
-                                                            }}
-                                                        />
-                                                        <Line
-                                                            type="monotone"
-                                                            dataKey="water"
-                                                            stroke="var(--info)"
-                                                            name="Water %"
-                                                            strokeWidth={2}
-                                                            dot={{ r: 3 }}
-                                                            connectNulls
-                                                        />
-                                                    </LineChart>
-                                                </ResponsiveContainer>
-                                            </CardContent>
-                                        </Card>
-                                    )}
+                                    {visibleCharts.map((chart) => (
+                                        <TrendChart key={chart.dataKey} data={chartData} chart={chart} />
+                                    ))}
                                 </div>
                             ) : (
                                 <div style={{ textAlign: 'center', padding: 'var(--space-12) 0', color: 'var(--text-secondary)' }}>
@@ -1,8 +1,9 @@
 import { useState, useMemo } from "react";
-import { useNavigate } from "react-router-dom";
+import { Link } from "react-router-dom";
 import { ChevronLeft, ChevronRight, Plus, Dumbbell, Flame } from "lucide-react";
 import Navigation from "@/components/Navigation";
-import { useCalendar } from "@/hooks/useWorkouts";
+import { useCalendar, usePrefetchCalendar } from "@/hooks/useWorkouts";
+import { usePrefetchExercises } from "@/hooks/useExercises";
 
 /**
  * Calculate workout streak allowing every-other-day training.
@@ -49,8 +50,15 @@ const calculateStreak = (workoutCounts: Record<string, number>): number => {
     return streak;
 };
 
+const WEEKDAYS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"];
+
+// Day cell class names, indexed by [isToday][hasWorkout]
+const DAY_CELL_CLASSES = [
+    ['calendar-day', 'calendar-day calendar-day--has-workout'],
+    ['calendar-day calendar-day--today', 'calendar-day calendar-day--has-workout calendar-day--today'],
+];
+
 const Calendar = () => {
-    const navigate = useNavigate();
     const today = new Date();
     const [currentYear, setCurrentYear] = useState(today.getFullYear());
     const [currentMonth, setCurrentMonth] = useState(today.getMonth() + 1);
@@ -75,6 +83,16 @@ const Calendar = () => {
         prevMonth,
     );
 
+    // The previous month is already loaded above; warm the next one too so
+    // paging in either direction is served from cache.
+    const nextMonthNum = currentMonth === 12 ? 1 : currentMonth + 1;
+    const nextYear = currentMonth === 12 ? currentYear + 1 : currentYear;
+    usePrefetchCalendar(nextYear, nextMonthNum);
+
+    // Days link to the workout session page, which needs the exercise list;
+    // fetch it now, in parallel with the calendar counts.
+    usePrefetchExercises();
+
     const monthName = new Date(
         currentYear,
         currentMonth - 1,
@@ -104,16 +122,20 @@ const Calendar = () => {
         }
     };
 
-    const handleDayClick = (day: number) => {
-        const date = `${currentYear}-${String(currentMonth).padStart(2, "0")}-${String(day).padStart(2, "0")}`;
-        navigate(`/day/${date}`);
-    };
-
     const workoutCounts = useMemo(
         () => calendarData?.counts || {},
         [calendarData?.counts],
     );
 
+    // Month totals for the stat cards, derived once per counts change
+    const { totalSets, activeDays } = useMemo(() => {
+        const counts = Object.values(workoutCounts);
+        return {
+            totalSets: counts.reduce((a, b) => a + b, 0),
+            activeDays: counts.filter((c) => c > 0).length,
+        };
+    }, [workoutCounts]);
+
     // Calculate streak using combined data from current and previous month
     const streak = useMemo(() => {
         if (!isViewingCurrentMonth) return null;
@@ -125,12 +147,46 @@ const Calendar = () => {
         return calculateStreak(combinedCounts);
     }, [workoutCounts, prevMonthData?.counts, isViewingCurrentMonth]);
 
-    const getDayClasses = (count: number, isToday: boolean) => {
-        const classes = ['calendar-day'];
-        if (count > 0) classes.push('calendar-day--has-workout');
-        if (isToday) classes.push('calendar-day--today');
-        return classes.join(' ');
-    };
+    // Day cells only change with the month or its counts, so build them once
+    // per change rather than on every render of the page.
+    const todayDate = today.getDate();
+    const dayCells = useMemo(() => {
+        // The year-month part is shared by every cell, so format it once
+        const monthPrefix = `${currentYear}-${String(currentMonth).padStart(2, "0")}-`;
+        // Exactly firstDay + daysInMonth cells; the grid wraps them into as
+        // many weeks as the month needs, with no trailing filler row.
+        return Array.from({ length: firstDay + daysInMonth }, (_, i) => {
+            if (i < firstDay) {
+                return <div key={`empty-${i}`} className="calendar-day calendar-day--empty" />;
+            }
+            const day = i - firstDay + 1;
+            const dateStr = monthPrefix + (day < 10 ? `0${day}` : `${day}`);
+            const count = workoutCounts[dateStr] || 0;
+            const isToday = isViewingCurrentMonth && day === todayDate;
+
+            // A plain link: no click handler per cell, and the browser handles
+            // navigation (including open-in-new-tab) natively.
+            return (
+                <Link
+                    key={day}
+                    to={`/day/${dateStr}`}
+                    className={DAY_CELL_CLASSES[+isToday][+(count > 0)]}
+                >
+                    <div className="calendar-day__number">{day}</div>
+                    {count > 0 ? (
+                        <div className="calendar-day__workout-count">
+                            <Dumbbell className="w-3 h-3" />
+                            <span>{count}</span>
+                        </div>
+                    ) : (
+                        <div className="calendar-day__add-icon">
+                            <Plus className="w-3.5 h-3.5" />
+                        </div>
+                    )}
+                </Link>
+            );
+        });
+    }, [firstDay, daysInMonth, currentYear, currentMonth, workoutCounts, isViewingCurrentMonth, todayDate]);
 
     return (
         <>
@@ -159,7 +215,7 @@ const Calendar = () => {
 
                         {/* Day Headers */}
                         <div className="grid grid-cols-7" style={{ gap: 'var(--space-1)', marginBottom: 'var(--space-3)' }}>
-                            {["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"].map(
+                            {WEEKDAYS.map(
                                 (day, index) => (
                                     <div
                                         key={day}
@@ -190,40 +246,7 @@ const Calendar = () => {
                             </div>
                         ) : (
                             <div className="grid grid-cols-7" style={{ gap: 'var(--space-1)' }}>
-                                {/* Empty cells for days before month starts */}
-                                {Array.from({ length: firstDay }).map((_, i) => (
-                                    <div key={`empty-${i}`} className="calendar-day calendar-day--empty" />
-                                ))}
-
-                                {/* Actual days */}
-                                {Array.from({ length: daysInMonth }).map((_, i) => {
-                                    const day = i + 1;
-                                    const dateStr = `${currentYear}-${String(currentMonth).padStart(2, "0")}-${String(day).padStart(2, "0")}`;
-                                    const count = workoutCounts[dateStr] || 0;
-                                    const isToday = day === today.getDate() &&
-                                        currentMonth === today.getMonth() + 1 &&
-                                        currentYear === today.getFullYear();
-
-                                    return (
-                                        <div
-                                            key={day}
-                                            onClick={() => handleDayClick(day)}
-                                            className={getDayClasses(count, isToday)}
-                                        >
-                                            <div className="calendar-day__number">{day}</div>
-                                            {count > 0 ? (
-                                                <div className="calendar-day__workout-count">
-                                                    <Dumbbell className="w-3 h-3" />
-                                                    <span>{count}</span>
-                                                </div>
-                                            ) : (
-                                                <div className="calendar-day__add-icon">
-                                                    <Plus className="w-3.5 h-3.5" />
-                                                </div>
-                                            )}
-                                        </div>
-                                    );
-                                })}
+                                {dayCells}
                             </div>
                         )}
                     </div>
@@ -235,7 +258,7 @@ const Calendar = () => {
                                 This Month
                             </div>
                             <div className="stat-card__value">
-                                {Object.values(workoutCounts).reduce((a, b) => a + b, 0)}
+                                {totalSets}
                             </div>
                             <div className="stat-card__label">Total Sets</div>
                         </div>
@@ -245,7 +268,7 @@ const Calendar = () => {
                                 Active Days
                             </div>
                             <div className="stat-card__value">
-                                {Object.values(workoutCounts).filter((c) => c > 0).length}
+                                {activeDays}
                             </div>
                             <div className="stat-card__label">Days trained</div>
                         </div>
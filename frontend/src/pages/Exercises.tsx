@@ -14,38 +14,7 @@ import {
   useSeedExercises,
 } from '@/hooks/useExercises';
 import type { Exercise } from '@/types/exercise';
-
-// Predefined colors for common categories (matching WorkoutSession/Upcoming)
-const getCategoryColor = (category: string) => {
-  const predefined: Record<string, string> = {
-    Push: 'var(--chart-2)',
-    Pull: 'var(--accent)',
-    Legs: 'var(--chart-3)',
-    Core: 'var(--chart-4)',
-    Cardio: 'var(--error)',
-  };
-
-  const palette = [
-    'var(--chart-1)',
-    'var(--chart-2)',
-    'var(--chart-3)',
-    'var(--chart-4)',
-    'var(--chart-5)',
-    'var(--info)',
-    'var(--error)',
-  ];
-
-  let color = predefined[category];
-  if (!color) {
-    let hash = 0;
-    for (let i = 0; i < category.length; i++) {
-      hash = category.charCodeAt(i) + ((hash << 5) - hash);
-    }
-    color = palette[Math.abs(hash) % palette.length];
-  }
-
-  return { bg: color, text: color, border: color };
-};
+import { getCategoryColor } from '@/lib/utils';
 
 const Exercises = () => {
   const { data: exercises, isLoading } = useExercises();
@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useCallback, useDeferredValue, useMemo, useState } from "react";
 import { useParams } from "react-router-dom";
 import { format, parseISO } from "date-fns";
 import { Weight, Hash, MessageSquare, TrendingUp } from "lucide-react";
@@ -15,6 +15,7 @@ import {
     useProgression,
     useProgressionExercises,
 } from "@/hooks/useProgression";
+import type { ProgressionDataPoint } from "@/types/progression";
 import {
     LineChart,
     Line,
@@ -27,11 +28,114 @@ import {
     ReferenceLine,
 } from "recharts";
 
+// Shared chart tooltip styling, defined once rather than per chart per render
+const TOOLTIP_CONTENT_STYLE = {
+    backgroundColor: "var(--bg-tertiary)",
+    border: "1px solid var(--border)",
+    borderRadius: 'var(--radius-md)',
+    color: 'var(--text-primary)',
+};
+
+// Moving-average window the chart opens with
+const DEFAULT_MA_WINDOW_DAYS = 30;
+
+const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
+// Only the first rows of the history list get staggered entrance delays; the
+// rest start below the fold and would otherwise wait seconds to appear
+const HISTORY_STAGGER_ROWS = 12;
+
+// Fields of a chart point the moving average and dot renderer rely on
+interface ChartPoint {
+    date: string;
+    time: number;
+    day: number;
+    estimated_1rm: number;
+    type: "historical" | "upcoming";
+}
+
+// Calculate moving average (30 days) over the date-sorted historical
+// points with a sliding window: each point enters and leaves the running
+// sum once, so this is linear in the number of points.
+const calculateMovingAverage = (
+    data: ChartPoint[],
+    windowDays: number = DEFAULT_MA_WINDOW_DAYS,
+) => {
+    const result = new Map<string, number>();
+    const historicalData = data.filter((d) => d.type === "historical");
+
+    let start = 0;
+    let sum = 0;
+    historicalData.forEach((point, index) => {
+        sum += point.estimated_1rm;
+
+        // Whole-day numbers keep the window check an integer compare, with
+        // no Date allocated per point
+        while (historicalData[start].day < point.day - windowDays) {
+            sum -= historicalData[start].estimated_1rm;
+            start++;
+        }
+
+        result.set(point.date, sum / (index - start + 1));
+    });
+
+    return result;
+};
+
+// Long histories skip the dots on completed sessions: every dot is its own
+// SVG node, and at this density they only blur the line. Planned sessions
+// keep theirs, so the projection stays distinguishable.
+const HISTORY_DOT_LIMIT = 150;
+
+type DotProps = { cx?: number; cy?: number; payload: { type: string } };
+
+// Planned sessions are drawn in a different color from completed ones. Defined
+// once so the chart gets the same renderer on every render.
+const renderProgressionDot = (props: DotProps) => {
+    const { cx, cy, payload } = props;
+    if (cx == null || cy == null) return null;
+    return (
+        <circle
+            cx={cx}
+            cy={cy}
+            r={4}
+            fill={payload.type === "upcoming" ? "var(--warning)" : "var(--chart-2)"}
+            stroke="none"
+        />
+    );
+};
+
+const renderUpcomingDot = (props: DotProps) =>
+    props.payload.type === "upcoming" ? renderProgressionDot(props) : null;
+
+// Parse and format a point's date once, so sorting, the moving average, the
+// axis and tooltip formatters and the history list never re-parse it
+const toPoint = (
+    date: string,
+    point: Pick<ProgressionDataPoint, "estimated_1rm" | "weight" | "weight_unit" | "reps" | "comment">,
+    type: "historical" | "upcoming",
+) => {
+    const parsed = parseISO(date);
+    return {
+        date,
+        time: parsed.getTime(),
+        day: Date.UTC(parsed.getFullYear(), parsed.getMonth(), parsed.getDate()) / MS_PER_DAY,
+        tickLabel: format(parsed, "MMM d"),
+        hoverLabel: format(parsed, "MMM d, yyyy"),
+        estimated_1rm: point.estimated_1rm,
+        weight: point.weight,
+        weight_unit: point.weight_unit,
+        reps: point.reps,
+        comment: point.comment,
+        type,
+    };
+};
+
 const Progression = () => {
     const { exercise: urlExercise } = useParams<{ exercise?: string }>();
     const [selectedExercise, setSelectedExercise] = useState(urlExercise || "");
     const [includeUpcoming, setIncludeUpcoming] = useState(true);
-    const [maWindowDays, setMaWindowDays] = useState(30);
+    const [maWindowDays, setMaWindowDays] = useState(DEFAULT_MA_WINDOW_DAYS);
 
     const { data: exercises } = useProgressionExercises();
 
@@ -39,82 +143,70 @@ const Progression = () => {
     if (!selectedExercise && exercises && exercises.length > 0) {
         setSelectedExercise(exercises[0]);
     }
-    const { data: progressionData, isLoading } = useProgression(
-        selectedExercise,
-        includeUpcoming,
+    // Always fetch with upcoming sessions: the response is a superset of the
+    // historical-only one, so toggling the checkbox filters the cached data
+    // instead of fetching the exercise again.
+    const { data: progressionData, isLoading } = useProgression(selectedExercise);
+
+    // Historical points are parsed and labelled once per fetch; the chart and
+    // the history list below both read from them.
+    const historicalPoints = useMemo(
+        () => progressionData?.historical.map((point) =>
+            toPoint(point.date, point, "historical"),
+        ) ?? [],
+        [progressionData],
     );
 
-    // Prepare chart data
-    const chartData = progressionData
-        ? [
-              ...progressionData.historical.map((point) => ({
-                  date: point.date,
-                  estimated_1rm: point.estimated_1rm,
-                  weight: point.weight,
-                  reps: point.reps,
-                  comment: point.comment,
-                  type: "historical" as const,
-              })),
-              ...(includeUpcoming
-                  ? progressionData.upcoming.map((point) => ({
-                        date: point.projected_date,
-                        estimated_1rm: point.estimated_1rm,
-                        weight: point.weight,
-                        reps: point.reps,
-                        comment: point.comment,
-                        type: "upcoming" as const,
-                    }))
-                  : []),
-          ].sort(
-              (a, b) => parseISO(a.date).getTime() - parseISO(b.date).getTime(),
-          )
-        : [];
-
-    // Calculate moving average (30 days)
-    const calculateMovingAverage = (
-        data: typeof chartData,
-        windowDays: number = 30,
-    ) => {
-        const result: Array<{ date: string; ma: number }> = [];
-        const historicalData = data.filter((d) => d.type === "historical");
-
-        historicalData.forEach((point, index) => {
-            const pointDate = parseISO(point.date);
-            const windowStart = new Date(pointDate);
-            windowStart.setDate(windowStart.getDate() - windowDays);
-
-            const windowData = historicalData
-                .slice(0, index + 1)
-                .filter((d) => {
-                    const dDate = parseISO(d.date);
-                    return dDate >= windowStart && dDate <= pointDate;
-                });
-
-            if (windowData.length > 0) {
-                const avg =
-                    windowData.reduce((sum, d) => sum + d.estimated_1rm, 0) /
-                    windowData.length;
-                result.push({ date: point.date, ma: avg });
-            }
-        });
-
-        return result;
-    };
+    // Prepare chart data; rebuilt only when the data or toggle changes, not
+    // when the moving-average window does
+    const chartData = useMemo(() => {
+        if (!progressionData) return [];
 
-    const movingAverageData =
-        chartData.length > 0 ? calculateMovingAverage(chartData, maWindowDays) : [];
+        return [
+            ...historicalPoints,
+            ...(includeUpcoming
+                ? progressionData.upcoming.map((point) =>
+                      toPoint(point.projected_date, point, "upcoming"),
+                  )
+                : []),
+        ].sort((a, b) => a.time - b.time);
+    }, [progressionData, historicalPoints, includeUpcoming]);
 
-    // Merge MA data with chart data
-    const combinedData = chartData.map((point) => {
-        const maPoint = movingAverageData.find((ma) => ma.date === point.date);
-        return {
-            ...point,
-            ma: maPoint?.ma,
-        };
-    });
+    // Newest first for the history list, without re-parsing any dates
+    const historyNewestFirst = useMemo(
+        () => [...historicalPoints].sort((a, b) => b.time - a.time),
+        [historicalPoints],
+    );
+
+    // Axis ticks and tooltips are keyed by date; look up the preformatted labels
+    const pointsByDate = useMemo(
+        () => new Map(chartData.map((point) => [point.date, point])),
+        [chartData],
+    );
+
+    // The chart follows a deferred copy of the window: the picker updates
+    // immediately, and quick successive changes collapse into one chart
+    // re-render instead of one each.
+    const chartMaWindowDays = useDeferredValue(maWindowDays);
+
+    // Only the moving average depends on the window, so changing it leaves
+    // the chart points (and their labels) untouched
+    const movingAverageData = useMemo(
+        () => calculateMovingAverage(chartData, chartMaWindowDays),
+        [chartData, chartMaWindowDays],
+    );
+
+    // The MA line reads its values through this accessor instead of from
+    // a merged copy of the points, so a window change hands the chart a new
+    // accessor for that one line while its data array stays the same, and
+    // the 1RM line and its dots aren't rebuilt or re-animated
+    const movingAverageOf = useCallback(
+        (point: ChartPoint) => movingAverageData.get(point.date),
+        [movingAverageData],
+    );
 
     const today = format(new Date(), "yyyy-MM-dd");
-    const todayIndex = combinedData.findIndex((d) => d.date === today);
+    const hasTodayPoint = pointsByDate.has(today);
 
     return (
         <>
@@ -193,7 +285,7 @@ const Progression = () => {
                                 Loading progression data...
                             </p>
                         </div>
-                    ) : progressionData && combinedData.length > 0 ? (
+                    ) : progressionData && chartData.length > 0 ? (
                         <>
                             <Card className="animate-in section">
                                 <CardHeader>
@@ -203,7 +295,7 @@ const Progression = () => {
                                 </CardHeader>
                                 <CardContent>
                                     <ResponsiveContainer width="100%" height={320}>
-                                        <LineChart data={combinedData}>
+                                        <LineChart data={chartData}>
                                             <CartesianGrid
                                                 strokeDasharray="3 3"
                                                 stroke="var(--border)"
@@ -213,7 +305,7 @@ const Progression = () => {
                                                 stroke="var(--text-muted)"
                                                 style={{ fontSize: '12px' }}
                                                 tickFormatter={(date) =>
-                                                    format(parseISO(date), "MMM d")
+                                                    pointsByDate.get(date)?.tickLabel ?? date
                                                 }
                                             />
                                             <YAxis
@@ -227,17 +319,9 @@ const Progression = () => {
                                                 }}
                                             />
                                             <Tooltip
-                                                contentStyle={{
-                                                    backgroundColor: "var(--bg-tertiary)",
-                                                    border: "1px solid var(--border)",
-                                                    borderRadius: 'var(--radius-md)',
-                                                    color: 'var(--text-primary)',
-                                                }}
+                                                contentStyle={TOOLTIP_CONTENT_STYLE}
                                                 labelFormatter={(date) =>
-                                                    format(
-                                                        parseISO(date),
-                                                        "MMM d, yyyy",
-                                                    )
+                                                    pointsByDate.get(date)?.hoverLabel ?? date
                                                 }
                                                 formatter={(
                                                     value: number | undefined,
@@ -249,7 +333,7 @@ const Progression = () => {
                                                             value.toFixed(1),
                                                             name,
                                                         ];
-                                                    if (name === `${maWindowDays}-day MA`)
+                                                    if (name === `${chartMaWindowDays}-day MA`)
                                                         return [
                                                             value.toFixed(1),
                                                             name,
@@ -258,7 +342,7 @@ const Progression = () => {
                                                 }}
                                             />
                                             <Legend />
-                                            {todayIndex >= 0 && (
+                                            {hasTodayPoint && (
                                                 <ReferenceLine
                                                     x={today}
                                                     stroke="var(--accent)"
@@ -272,31 +356,17 @@ const Progression = () => {
                                                 stroke="var(--chart-2)"
                                                 name="Estimated 1RM"
                                                 strokeWidth={2}
-                                                dot={(props: { cx?: number; cy?: number; payload: { type: string } }) => {
-                                                    const { cx, cy, payload } =
-                                                        props;
-                                                    if (cx == null || cy == null) return null;
-                                                    return (
-                                                        <circle
-                                                            cx={cx}
-                                                            cy={cy}
-                                                            r={4}
-                                                            fill={
-                                                                payload.type ===
-                                                                "upcoming"
-                                                                    ? "var(--warning)"
-                                                                    : "var(--chart-2)"
-                                                            }
-                                                            stroke="none"
-                                                        />
-                                                    );
-                                                }}
+                                                dot={
+                                                    historicalPoints.length > HISTORY_DOT_LIMIT
+                                                        ? renderUpcomingDot
+                                                        : renderProgressionDot
+                                                }
                                             />
                                             <Line
                                                 type="monotone"
-                                                dataKey="ma"
+                                                dataKey={movingAverageOf}
                                                 stroke="var(--accent)"
-                                                name={`${maWindowDays}-day MA`}
+                                                name={`${chartMaWindowDays}-day MA`}
                                                 strokeWidth={2}
                                                 dot={false}
                                             />
@@ -317,82 +387,80 @@ const Progression = () => {
                                     </CardHeader>
                                     <CardContent>
                                         <div className="stagger-children hide-scrollbar" style={{ display: 'flex', flexDirection: 'column', gap: 'var(--space-3)', maxHeight: '400px', overflowY: 'auto' }}>
-                                            {progressionData.historical
-                                                .sort((a, b) => parseISO(b.date).getTime() - parseISO(a.date).getTime())
-                                                .map((point, index) => (
-                                                    <div
-                                                        key={index}
-                                                        className="animate-in"
-                                                        style={{
-                                                            padding: 'var(--space-4)',
-                                                            background: 'var(--bg-tertiary)',
-                                                            borderRadius: 'var(--radius-md)',
-                                                            border: '1px solid var(--border-subtle)',
-                                                            animationDelay: `${index * 30}ms`,
-                                                        }}
-                                                    >
-                                                        <div className="flex items-start" style={{ gap: 'var(--space-4)' }}>
-                                                            <div
-                                                                className="workout-order"
-                                                                style={{
-                                                                    width: '36px',
-                                                                    height: '36px',
-                                                                    fontSize: '14px',
-                                                                    background: 'var(--success-subtle)',
-                                                                    color: 'var(--success)',
-                                                                }}
-                                                            >
-                                                                {progressionData.historical.length - index}
+                                            {historyNewestFirst.map((point, index) => (
+                                                <div
+                                                    key={index}
+                                                    className="animate-in history-row"
+                                                    style={{
+                                                        padding: 'var(--space-4)',
+                                                        background: 'var(--bg-tertiary)',
+                                                        borderRadius: 'var(--radius-md)',
+                                                        border: '1px solid var(--border-subtle)',
+                                                        animationDelay: `${Math.min(index, HISTORY_STAGGER_ROWS) * 30}ms`,
+                                                    }}
+                                                >
+                                                    <div className="flex items-start" style={{ gap: 'var(--space-4)' }}>
+                                                        <div
+                                                            className="workout-order"
+                                                            style={{
+                                                                width: '36px',
+                                                                height: '36px',
+                                                                fontSize: '14px',
+                                                                background: 'var(--success-subtle)',
+                                                                color: 'var(--success)',
+                                                            }}
+                                                        >
+                                                            {progressionData.historical.length - index}
+                                                        </div>
+                                                        <div className="flex-1">
+                                                            <div className="flex items-center flex-wrap" style={{ gap: 'var(--space-3)', marginBottom: 'var(--space-2)' }}>
+                                                                <h3
+                                                                    style={{
+                                                                        fontFamily: 'var(--font-body)',
+                                                                        fontSize: '15px',
+                                                                        fontWeight: 600,
+                                                                        color: 'var(--text-primary)',
+                                                                    }}
+                                                                >
+                                                                    {point.hoverLabel}
+                                                                </h3>
                                                             </div>
-                                                            <div className="flex-1">
-                                                                <div className="flex items-center flex-wrap" style={{ gap: 'var(--space-3)', marginBottom: 'var(--space-2)' }}>
-                                                                    <h3
-                                                                        style={{
-                                                                            fontFamily: 'var(--font-body)',
-                                                                            fontSize: '15px',
-                                                                            fontWeight: 600,
-                                                                            color: 'var(--text-primary)',
-                                                                        }}
-                                                                    >
-                                                                        {format(parseISO(point.date), "MMM d, yyyy")}
-                                                                    </h3>
-                                                                </div>
-                                                                <div className="flex flex-wrap" style={{ gap: 'var(--space-2)' }}>
-                                                                    {point.weight && (
-                                                                        <div className="workout-chip">
-                                                                            <Weight style={{ width: '14px', height: '14px', color: 'var(--success)' }} />
-                                                                            <span className="workout-chip__value" style={{ fontSize: '13px' }}>
-                                                                                {point.weight} {point.weight_unit}
-                                                                            </span>
-                                                                        </div>
-                                                                    )}
-                                                                    {point.reps && (
-                                                                        <div className="workout-chip">
-                                                                            <Hash style={{ width: '14px', height: '14px', color: 'var(--success)' }} />
-                                                                            <span className="workout-chip__value" style={{ fontSize: '13px' }}>
-                                                                                {point.reps} reps
-                                                                            </span>
-                                                                        </div>
-                                                                    )}
+                                                            <div className="flex flex-wrap" style={{ gap: 'var(--space-2)' }}>
+                                                                {point.weight && (
                                                                     <div className="workout-chip">
-                                                                        <TrendingUp style={{ width: '14px', height: '14px', color: 'var(--accent)' }} />
-                                                                        <span className="workout-chip__value" style={{ fontSize: '13px', color: 'var(--accent)' }}>
-                                                                            {point.estimated_1rm.toFixed(1)} 1RM
+                                                                        <Weight style={{ width: '14px', height: '14px', color: 'var(--success)' }} />
+                                                                        <span className="workout-chip__value" style={{ fontSize: '13px' }}>
+                                                                            {point.weight} {point.weight_unit}
                                                                         </span>
                                                                     </div>
-                                                                    {point.comment && (
-                                                                        <div className="workout-chip">
-                                                                            <MessageSquare style={{ width: '14px', height: '14px', color: 'var(--text-muted)' }} />
-                                                                            <span className="workout-chip__comment" style={{ fontSize: '13px' }}>
-                                                                                {point.comment}
-                                                                            </span>
-                                                                        </div>
-                                                                    )}
+                                                                )}
+                                                                {point.reps && (
+                                                                    <div className="workout-chip">
+                                                                        <Hash style={{ width: '14px', height: '14px', color: 'var(--success)' }} />
+                                                                        <span className="workout-chip__value" style={{ fontSize: '13px' }}>
+                                                                            {point.reps} reps
+                                                                        </span>
+                                                                    </div>
+                                                                )}
+                                                                <div className="workout-chip">
+                                                                    <TrendingUp style={{ width: '14px', height: '14px', color: 'var(--accent)' }} />
+                                                                    <span className="workout-chip__value" style={{ fontSize: '13px', color: 'var(--accent)' }}>
+                                                                        {point.estimated_1rm.toFixed(1)} 1RM
+                                                                    </span>
                                                                 </div>
+                                                                {point.comment && (
+                                                                    <div className="workout-chip">
+                                                                        <MessageSquare style={{ width: '14px', height: '14px', color: 'var(--text-muted)' }} />
+                                                                        <span className="workout-chip__comment" style={{ fontSize: '13px' }}>
+                                                                            {point.comment}
+                                                                        </span>
+                                                                    </div>
+                                                                )}
                                                             </div>
                                                         </div>
                                                     </div>
-                                                ))}
+                                                </div>
+                                            ))}
                                         </div>
                                     </CardContent>
                                 </Card>
@@ -17,37 +17,30 @@ import {
   usePreset,
   useLiftoscriptGenerate,
 } from '@/hooks/useUpcoming';
+import { getCategoryColor } from '@/lib/utils';
 
-// Predefined colors for common categories (matching WorkoutSession)
-const getCategoryColor = (category: string) => {
-  const predefined: Record<string, string> = {
-    Push: 'var(--chart-2)',
-    Pull: 'var(--accent)',
-    Legs: 'var(--chart-3)',
-    Core: 'var(--chart-4)',
-    Cardio: 'var(--error)',
-  };
-
-  const palette = [
-    'var(--chart-1)',
-    'var(--chart-2)',
-    'var(--chart-3)',
-    'var(--chart-4)',
-    'var(--chart-5)',
-    'var(--info)',
-    'var(--error)',
-  ];
+// Styles shared by every planned workout row, allocated once instead of per
+// row on each render
+const WORKOUT_ROW_STYLE = {
+  padding: 'var(--space-4)',
+  background: 'var(--bg-tertiary)',
+  borderRadius: 'var(--radius-md)',
+  border: '1px solid var(--border-subtle)',
+};
 
-  let color = predefined[category];
-  if (!color) {
-    let hash = 0;
-    for (let i = 0; i < category.length; i++) {
-      hash = category.charCodeAt(i) + ((hash << 5) - hash);
-    }
-    color = palette[Math.abs(hash) % palette.length];
-  }
+const WORKOUT_ROW_NUMBER_STYLE = {
+  width: '36px',
+  height: '36px',
+  fontSize: '14px',
+  background: 'rgba(234, 179, 8, 0.1)',
+  color: 'var(--warning)',
+};
 
-  return { bg: color, text: color, border: color };
+const WORKOUT_ROW_TITLE_STYLE = {
+  fontFamily: 'var(--font-body)',
+  fontSize: '16px',
+  fontWeight: 600,
+  color: 'var(--text-primary)',
 };
 
 const Upcoming = () => {
@@ -143,27 +136,23 @@ const Upcoming = () => {
   const sessionGroups = useMemo(() => {
     if (!upcomingWorkouts) return [];
 
-    const groups = new Map<number, typeof upcomingWorkouts>();
-    upcomingWorkouts.forEach(workout => {
-      if (!groups.has(workout.session)) {
-        groups.set(workout.session, []);
+    // The API returns workouts ordered by session and then creation, so each
+    // session is one contiguous run and a single pass groups them in order
+    const groups: { session: number; workouts: typeof upcomingWorkouts }[] = [];
+    for (const workout of upcomingWorkouts) {
+      const last = groups[groups.length - 1];
+      if (last && last.session === workout.session) {
+        last.workouts.push(workout);
+      } else {
+        groups.push({ session: workout.session, workouts: [workout] });
       }
-      groups.get(workout.session)!.push(workout);
-    });
-
-    return Array.from(groups.entries())
-      .sort(([a], [b]) => a - b)
-      .map(([session, workouts]) => ({
-        session,
-        workouts: workouts.sort((a, b) => a.doc_id - b.doc_id),
-      }));
+    }
+    return groups;
   }, [upcomingWorkouts]);
 
   const handleTransferSession = async (session: number) => {
-    if (!transferDate) {
-      alert('Please select a date');
-      return;
-    }
+    // The transfer button is only enabled once a date is picked
+    if (!transferDate) return;
 
     const dateStr = format(transferDate, 'yyyy-MM-dd');
     await transferSession.mutateAsync({ session, date: dateStr });
@@ -440,38 +429,14 @@ const Upcoming = () => {
                       {workouts.map((workout, workoutIndex) => {
                         const catColor = getCategoryColor(workout.category);
                         return (
-                          <div
-                            key={workout.doc_id}
-                            style={{
-                              padding: 'var(--space-4)',
-                              background: 'var(--bg-tertiary)',
-                              borderRadius: 'var(--radius-md)',
-                              border: '1px solid var(--border-subtle)',
-                            }}
-                          >
+                          <div key={workout.doc_id} style={WORKOUT_ROW_STYLE}>
                             <div className="flex items-start" style={{ gap: 'var(--space-4)' }}>
-                              <div
-                                className="workout-order"
-                                style={{
-                                  width: '36px',
-                                  height: '36px',
-                                  fontSize: '14px',
-                                  background: 'rgba(234, 179, 8, 0.1)',
-                                  color: 'var(--warning)',
-                                }}
-                              >
+                              <div className="workout-order" style={WORKOUT_ROW_NUMBER_STYLE}>
                                 {workoutIndex + 1}
                               </div>
                               <div className="flex-1">
                                 <div className="flex items-center flex-wrap" style={{ gap: 'var(--space-3)', marginBottom: 'var(--space-2)' }}>
-                                  <h3
-                                    style={{
-                                      fontFamily: 'var(--font-body)',
-                                      fontSize: '16px',
-                                      fontWeight: 600,
-                                      color: 'var(--text-primary)',
-                                    }}
-                                  >
+                                  <h3 style={WORKOUT_ROW_TITLE_STYLE}>
                                     {workout.exercise}
                                   </h3>
                                   <span
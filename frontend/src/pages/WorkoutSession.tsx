@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useMemo } from "react";
 import { useParams, useNavigate } from "react-router-dom";
 import { format, parseISO } from "date-fns";
 import {
@@ -62,9 +62,17 @@ import {
   useCopyToDate,
 } from "@/hooks/useWorkouts";
 import type { Workout } from "@/types/workout";
-import { useCategories, useExercises, useRecentExercises } from "@/hooks/useExercises";
+import { useExercises, useRecentExercises } from "@/hooks/useExercises";
 import { useProgression } from "@/hooks/useProgression";
 import type { WorkoutCreate } from "@/types/workout";
+import type { Exercise } from "@/types/exercise";
+import { getCategoryColor, type CategoryColor } from "@/lib/utils";
+
+// Number of recent training days offered in the "recent weights" pickers
+const RECENT_WEIGHTS_LIMIT = 5;
+
+// Delay before a newly selected exercise fetches its recent weights
+const HISTORY_DEBOUNCE_MS = 150;
 
 // Get weight increment based on current weight value
 const getWeightIncrement = (weight: number): number => {
@@ -73,6 +81,11 @@ const getWeightIncrement = (weight: number): number => {
   return 10;
 };
 
+// Read a number input's value as the browser already parsed it; an empty
+// field is null rather than 0
+const numberInputValue = (input: HTMLInputElement): number | null =>
+  Number.isNaN(input.valueAsNumber) ? null : input.valueAsNumber;
+
 // Sortable workout card component
 interface SortableWorkoutCardProps {
   workout: Workout;
@@ -80,11 +93,7 @@ interface SortableWorkoutCardProps {
   editingWorkout: Workout | null;
   confirmingDelete: number | null;
   formData: WorkoutCreate;
-  getCategoryColor: (category: string) => {
-    bg: string;
-    text: string;
-    border: string;
-  };
+  getCategoryColor: (category: string) => CategoryColor;
   handleEditWorkout: (workout: Workout) => void;
   toggleComplete: ReturnType<typeof useToggleComplete>;
   handleDeleteClick: (id: number) => void;
@@ -129,6 +138,7 @@ const SortableWorkoutCard = ({
   const { data: progressionData } = useProgression(
     isEditing && showRecentWeights ? workout.exercise : "",
     false,
+    RECENT_WEIGHTS_LIMIT,
   );
 
   const style = {
@@ -141,7 +151,7 @@ const SortableWorkoutCard = ({
   const catColor = getCategoryColor(workout.category);
 
   return (
-    <Card ref={setNodeRef} style={style} className="card-hover animate-in">
+    <Card ref={setNodeRef} style={style} className="card-hover animate-in workout-card">
       <CardContent style={{ padding: "var(--space-4)", position: "relative", minHeight: "120px" }}>
         {isEditing && (
           <button
@@ -402,13 +412,11 @@ const SortableWorkoutCard = ({
                       step="0.1"
                       placeholder="0"
                       className="input--stepper"
-                      value={formData.weight || ""}
+                      value={formData.weight ?? ""}
                       onChange={(e: React.ChangeEvent<HTMLInputElement>) =>
                         setFormData({
                           ...formData,
-                          weight: e.target.value
-                            ? parseFloat(e.target.value)
-                            : null,
+                          weight: numberInputValue(e.target),
                         })
                       }
                     />
@@ -458,9 +466,9 @@ const SortableWorkoutCard = ({
                       inputMode="numeric"
                       placeholder="e.g., 5"
                       className="input--stepper input--mono"
-                      value={formData.reps || ""}
+                      value={formData.reps ?? ""}
                       onChange={(e: React.ChangeEvent<HTMLInputElement>) => {
-                        const value = e.target.value ? parseInt(e.target.value) : null;
+                        const value = numberInputValue(e.target);
                         setFormData({
                           ...formData,
                           reps: value,
@@ -564,7 +572,7 @@ const SortableWorkoutCard = ({
                       }}
                     >
                       {progressionData.historical
-                        .slice(-5)
+                        .slice(-RECENT_WEIGHTS_LIMIT)
                         .reverse()
                         .map((entry, i) => (
                           <button
@@ -651,10 +659,42 @@ const WorkoutSession = () => {
   const navigate = useNavigate();
 
   const { data: workouts, isLoading } = useWorkouts({ date });
-  const { data: categories } = useCategories();
   const { data: exercises } = useExercises();
   const { data: recentExercises } = useRecentExercises(8);
 
+  // Index exercises once per fetch: one pass yields the name and category
+  // lookups plus the category options, so the page doesn't need a separate
+  // categories request.
+  const { exercisesByName, exercisesByCategory, categoryNames } = useMemo(() => {
+    const byName = new Map<string, Exercise>();
+    const byCategory = new Map<string, Exercise[]>();
+    for (const exercise of exercises || []) {
+      byName.set(exercise.name, exercise);
+      const group = byCategory.get(exercise.category);
+      if (group) {
+        group.push(exercise);
+      } else {
+        byCategory.set(exercise.category, [exercise]);
+      }
+    }
+    return {
+      exercisesByName: byName,
+      exercisesByCategory: byCategory,
+      categoryNames: [...byCategory.keys()].sort(),
+    };
+  }, [exercises]);
+
+  // Sort a copy once per fetch; sorting the query data in place during
+  // render mutated the cached array and was repeated for every consumer.
+  const sortedWorkouts = useMemo(
+    () => (workouts ? [...workouts].sort((a, b) => a.order - b.order) : []),
+    [workouts],
+  );
+  const sortedWorkoutIds = useMemo(
+    () => sortedWorkouts.map((w) => w.doc_id),
+    [sortedWorkouts],
+  );
+
   const createWorkout = useCreateWorkout();
   const updateWorkout = useUpdateWorkout();
   const deleteWorkout = useDeleteWorkout();
@@ -679,6 +719,7 @@ const WorkoutSession = () => {
   const [editingWorkout, setEditingWorkout] = useState<Workout | null>(null);
   const [selectedCategory, setSelectedCategory] = useState("");
   const [selectedExercise, setSelectedExercise] = useState("");
+  const [historyExercise, setHistoryExercise] = useState("");
   const [confirmingDelete, setConfirmingDelete] = useState<number | null>(null);
   const [showAddRecent, setShowAddRecent] = useState(false);
   const [showMoveCalendar, setShowMoveCalendar] = useState(false);
@@ -704,7 +745,7 @@ const WorkoutSession = () => {
   };
 
   const handleExerciseChange = (exercise: string) => {
-    const exerciseData = exercises?.find((e) => e.name === exercise);
+    const exerciseData = exercisesByName.get(exercise);
     setSelectedExercise(exercise);
     setFormData({
       ...formData,
@@ -717,7 +758,7 @@ const WorkoutSession = () => {
     setEditingWorkout(workout);
 
     // Look up the exercise's actual category (in case workout data is stale)
-    const exerciseData = exercises?.find((e) => e.name === workout.exercise);
+    const exerciseData = exercisesByName.get(workout.exercise);
     const actualCategory = exerciseData?.category || workout.category;
 
     setSelectedCategory(actualCategory);
@@ -780,9 +821,7 @@ const WorkoutSession = () => {
   // Sync exercise selection when editing and exercises data is available
   const [lastSyncedEdit, setLastSyncedEdit] = useState<number | null>(null);
   if (editingWorkout && exercises && lastSyncedEdit !== editingWorkout.doc_id) {
-    const exerciseData = exercises.find(
-      (e) => e.name === editingWorkout.exercise,
-    );
+    const exerciseData = exercisesByName.get(editingWorkout.exercise);
     if (exerciseData) {
       setSelectedCategory(exerciseData.category);
       setSelectedExercise(editingWorkout.exercise);
@@ -801,6 +840,12 @@ const WorkoutSession = () => {
     }
   }, [confirmingDelete]);
 
+  // Coalesce rapid exercise selections into a single recent-weights fetch
+  useEffect(() => {
+    const timer = setTimeout(() => setHistoryExercise(selectedExercise), HISTORY_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [selectedExercise]);
+
   const handleDeleteClick = useCallback((id: number) => {
     setConfirmingDelete(id);
   }, []);
@@ -831,8 +876,7 @@ const WorkoutSession = () => {
     (event: DragEndEvent) => {
       const { active, over } = event;
 
-      if (over && active.id !== over.id && workouts) {
-        const sortedWorkouts = [...workouts].sort((a, b) => a.order - b.order);
+      if (over && active.id !== over.id) {
         const oldIndex = sortedWorkouts.findIndex(
           (w) => w.doc_id === active.id,
         );
@@ -845,7 +889,7 @@ const WorkoutSession = () => {
         }
       }
     },
-    [workouts, bulkReorderWorkouts],
+    [sortedWorkouts, bulkReorderWorkouts],
   );
 
   const handleMoveToDate = useCallback(async () => {
@@ -872,48 +916,14 @@ const WorkoutSession = () => {
 
   // Progression data for add form's selected exercise
   const { data: addFormProgression } = useProgression(
-    showAddRecent && selectedExercise && !editingWorkout ? selectedExercise : "",
+    showAddRecent && historyExercise && !editingWorkout ? historyExercise : "",
     false,
+    RECENT_WEIGHTS_LIMIT,
   );
 
-  const categoryExercises =
-    exercises?.filter((e) => e.category === selectedCategory) || [];
+  const categoryExercises = exercisesByCategory.get(selectedCategory) || [];
   const formattedDate = date ? format(parseISO(date), "MMMM d, yyyy") : "";
 
-  const getCategoryColor = (category: string) => {
-    // Predefined colors for common categories
-    const predefined: Record<string, string> = {
-      Push: "var(--chart-2)", // Blue
-      Pull: "var(--accent)", // Green
-      Legs: "var(--chart-3)", // Purple
-      Core: "var(--chart-4)", // Orange
-      Cardio: "var(--error)", // Red
-    };
-
-    // Color palette for hash-based assignment
-    const palette = [
-      "var(--chart-1)", // Green
-      "var(--chart-2)", // Blue
-      "var(--chart-3)", // Purple
-      "var(--chart-4)", // Orange
-      "var(--chart-5)", // Yellow
-      "var(--info)", // Light blue
-      "var(--error)", // Red
-    ];
-
-    let color = predefined[category];
-    if (!color) {
-      // Simple hash function for consistent color assignment
-      let hash = 0;
-      for (let i = 0; i < category.length; i++) {
-        hash = category.charCodeAt(i) + ((hash << 5) - hash);
-      }
-      color = palette[Math.abs(hash) % palette.length];
-    }
-
-    return { bg: color, text: color, border: color };
-  };
-
   return (
     <>
       <Navigation />
@@ -1219,9 +1229,9 @@ const WorkoutSession = () => {
                           <SelectValue placeholder="Select category" />
                         </SelectTrigger>
                         <SelectContent>
-                          {categories?.map((cat) => (
-                            <SelectItem key={cat.doc_id} value={cat.name}>
-                              {cat.name}
+                          {categoryNames.map((name) => (
+                            <SelectItem key={name} value={name}>
+                              {name}
                             </SelectItem>
                           ))}
                         </SelectContent>
@@ -1286,13 +1296,11 @@ const WorkoutSession = () => {
                         step="0.1"
                         placeholder="0"
                         className="input--stepper"
-                        value={formData.weight || ""}
+                        value={formData.weight ?? ""}
                         onChange={(e: React.ChangeEvent<HTMLInputElement>) =>
                           setFormData({
                             ...formData,
-                            weight: e.target.value
-                              ? parseFloat(e.target.value)
-                              : null,
+                            weight: numberInputValue(e.target),
                           })
                         }
                       />
@@ -1342,9 +1350,9 @@ const WorkoutSession = () => {
                         inputMode="numeric"
                         placeholder="e.g., 5"
                         className="input--stepper input--mono"
-                        value={formData.reps || ""}
+                        value={formData.reps ?? ""}
                         onChange={(e: React.ChangeEvent<HTMLInputElement>) => {
-                          const value = e.target.value ? parseInt(e.target.value) : null;
+                          const value = numberInputValue(e.target);
                           setFormData({
                             ...formData,
                             reps: value,
@@ -1448,7 +1456,7 @@ const WorkoutSession = () => {
                           }}
                         >
                           {addFormProgression.historical
-                            .slice(-5)
+                            .slice(-RECENT_WEIGHTS_LIMIT)
                             .reverse()
                             .map((entry, i) => (
                               <button
@@ -1551,9 +1559,7 @@ const WorkoutSession = () => {
               onDragEnd={handleDragEnd}
             >
               <SortableContext
-                items={workouts
-                  .sort((a, b) => a.order - b.order)
-                  .map((w) => w.doc_id)}
+                items={sortedWorkoutIds}
                 strategy={verticalListSortingStrategy}
               >
                 <div
@@ -1564,28 +1570,26 @@ const WorkoutSession = () => {
                     gap: "var(--space-4)",
                   }}
                 >
-                  {workouts
-                    .sort((a, b) => a.order - b.order)
-                    .map((workout, index) => (
-                      <SortableWorkoutCard
-                        key={workout.doc_id}
-                        workout={workout}
-                        index={index}
-                        editingWorkout={editingWorkout}
-                        confirmingDelete={confirmingDelete}
-                        formData={formData}
-                        getCategoryColor={getCategoryColor}
-                        handleEditWorkout={handleEditWorkout}
-                        toggleComplete={toggleComplete}
-                        handleDeleteClick={handleDeleteClick}
-                        handleDeleteConfirm={handleDeleteConfirm}
-                        handleDeleteCancel={handleDeleteCancel}
-                        setFormData={setFormData}
-                        handleSubmit={handleSubmit}
-                        handleDuplicate={handleDuplicate}
-                        resetForm={resetForm}
-                      />
-                    ))}
+                  {sortedWorkouts.map((workout, index) => (
+                    <SortableWorkoutCard
+                      key={workout.doc_id}
+                      workout={workout}
+                      index={index}
+                      editingWorkout={editingWorkout}
+                      confirmingDelete={confirmingDelete}
+                      formData={formData}
+                      getCategoryColor={getCategoryColor}
+                      handleEditWorkout={handleEditWorkout}
+                      toggleComplete={toggleComplete}
+                      handleDeleteClick={handleDeleteClick}
+                      handleDeleteConfirm={handleDeleteConfirm}
+                      handleDeleteCancel={handleDeleteCancel}
+                      setFormData={setFormData}
+                      handleSubmit={handleSubmit}
+                      handleDuplicate={handleDuplicate}
+                      resetForm={resetForm}
+                    />
+                  ))}
                 </div>
               </SortableContext>
             </DndContext>